@@ -49,6 +49,25 @@ class Blade(VGroup):
         self.outlet = outlet
 
 
+def blade_cascade(count=3, pitch=0.3, chord=0.6, centre=(0.45, 0.5)):
+    """
+    A row of blades in the unit square, inlets facing -x, for flow simulation.
+
+    The fluid solver grid spans the unit square, so the same layout is
+    rasterized into the obstacle mask and (scaled) drawn by the scene.
+    """
+    blades = VGroup()
+    offsets = (np.arange(count) - (count - 1) / 2) * pitch
+    for dy in offsets:
+        blade = Blade()
+        # Inlet (top) to the left, outlet (bottom) to the right
+        blade.rotate(PI / 2, about_point=ORIGIN)
+        blade.scale(chord / blade.blade.width)
+        blade.move_to([centre[0], centre[1] + dy, 0])
+        blades.add(blade)
+    return blades
+
+
 class BladeInlet(MovingCameraScene):
     """Scene that visualizes inlet velocity triangle on the blade."""
     def construct(self):
@@ -0,0 +1,196 @@
+"""
+Raster and pooled-vector rendering of solver fields
+Includes: colour maps into RGBA buffers, an ImageMobject updated in place,
+a fixed pool of arrow segments binned by colour, tracer point clouds and
+streamline batches
+"""
+
+from manim import *
+import numpy as np
+
+
+def field_pixels(field):
+    """
+    Interior of a solver field (indexed [x, y]) as image rows.
+
+    Returns a view: image row 0 is the largest y, column 0 the smallest x.
+    """
+    return field[1:-1, 1:-1].T[::-1]
+
+
+def opacity_rgba(values, out, color=BLUE, scale=100.0, max_opacity=0.7):
+    """Single-colour map: opacity grows linearly with value / scale."""
+    out[..., :3] = np.round(np.asarray(color.to_rgb()) * 255)
+    alpha = np.clip(values / scale, 0, 1)
+    alpha *= 255 * max_opacity
+    out[..., 3] = alpha
+    return out
+
+
+def diverging_rgba(values, out, positive=RED, negative=BLUE, scale=5.0, max_opacity=0.8):
+    """Two-colour map for signed fields: colour by sign, opacity by |value| / scale."""
+    rgb = np.where(
+        (values > 0)[..., None],
+        np.round(np.asarray(positive.to_rgb()) * 255),
+        np.round(np.asarray(negative.to_rgb()) * 255),
+    )
+    out[..., :3] = rgb
+    alpha = np.clip(np.abs(values) / scale, 0, 1)
+    alpha *= 255 * max_opacity
+    out[..., 3] = alpha
+    return out
+
+
+def unit_to_scene(x, y, extent, offset, out):
+    """Write normalized solver positions as scene points (z = 0) into out."""
+    np.multiply(x, extent, out=out[:, 0])
+    np.multiply(y, extent, out=out[:, 1])
+    out[:, :2] += np.asarray(offset[:2]) - 0.5 * extent
+    out[:, 2] = offset[2] if len(offset) > 2 else 0
+    return out
+
+
+class FieldImage(ImageMobject):
+    """
+    A solver field drawn as one raster image.
+
+    The RGBA pixel buffer is allocated once and rewritten in place by
+    update_field, so drawing cost depends on the grid size only, not on
+    how many cells are non-empty. With a resample.FieldResampler the image
+    has the display resolution instead of the solver's.
+    """
+
+    def __init__(self, field, width, height, colormap=opacity_rgba, resampler=None, **kwargs):
+        self.colormap = colormap
+        self.resampler = resampler
+        if resampler is None:
+            nx, ny = field.shape[0] - 2, field.shape[1] - 2
+        else:
+            nx, ny = resampler.shape
+            self._display = np.empty(resampler.shape, dtype=resampler.dtype)
+        super().__init__(np.zeros((ny, nx, 4), dtype=np.uint8), **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["bilinear"])
+        self.stretch_to_fit_width(width)
+        self.stretch_to_fit_height(height)
+        self.update_field(field)
+
+    def update_field(self, field):
+        """Colour-map the interior of a solver field into the pixel buffer."""
+        if self.resampler is None:
+            pixels = field_pixels(field)
+        else:
+            pixels = self.resampler(field, out=self._display).T[::-1]
+        self.colormap(pixels, self.pixel_array)
+        return self
+
+
+class ArrowField(VGroup):
+    """
+    A fixed pool of arrows (shaft plus two barbs) for a sampled vector field.
+
+    Arrows are sorted into colour bins by magnitude; each bin is a single
+    VMobject whose points are rewritten from arrays every update, so no
+    mobjects are created per frame. Arrows below min_magnitude are hidden.
+    """
+
+    def __init__(self, starts, scale=0.08, colors=(BLUE, RED), num_bins=8, max_magnitude=10.0,
+                 min_magnitude=0.5, stroke_width=2, tip_ratio=0.25, tip_angle=25 * DEGREES, **kwargs):
+        super().__init__(**kwargs)
+        self.starts = np.asarray(starts, dtype=float)
+        self.scale = scale
+        self.max_magnitude = max_magnitude
+        self.min_magnitude = min_magnitude
+        self.tip_ratio = tip_ratio
+        self.tip_rotations = [rotation_matrix(angle, OUT) for angle in (tip_angle, -tip_angle)]
+
+        low, high = colors
+        for t in np.linspace(0, 1, num_bins):
+            bin_mob = VMobject()
+            bin_mob.set_stroke(interpolate_color(low, high, t), width=stroke_width)
+            bin_mob.set_fill(opacity=0)
+            self.add(bin_mob)
+
+    def update_vectors(self, vx, vy):
+        """Rewrite every arrow from vector components (one per start point)."""
+        vx = np.asarray(vx, dtype=float).ravel()
+        vy = np.asarray(vy, dtype=float).ravel()
+        magnitude = np.hypot(vx, vy)
+
+        shaft = np.zeros_like(self.starts)
+        shaft[:, 0] = vx * self.scale
+        shaft[:, 1] = vy * self.scale
+        ends = self.starts + shaft
+
+        # Barbs point back from the tip, rotated either side of the shaft
+        back = -self.tip_ratio * shaft
+        barbs = [ends + back @ rotation.T for rotation in self.tip_rotations]
+
+        # (K, 3 segments, 2 endpoints, 3) -> straight cubic segments (K, 3, 4, 3)
+        segments = np.stack([
+            np.stack([self.starts, ends], axis=1),
+            np.stack([ends, barbs[0]], axis=1),
+            np.stack([ends, barbs[1]], axis=1),
+        ], axis=1)
+        weights = np.linspace(0, 1, 4)[:, None]
+        curves = segments[:, :, :1] * (1 - weights) + segments[:, :, 1:] * weights
+
+        num_bins = len(self.submobjects)
+        bins = np.clip((magnitude / self.max_magnitude * num_bins).astype(int), 0, num_bins - 1)
+        visible = magnitude > self.min_magnitude
+        for k, bin_mob in enumerate(self.submobjects):
+            bin_mob.set_points(curves[visible & (bins == k)].reshape(-1, 3))
+        return self
+
+
+class TracerCloud(PMobject):
+    """
+    Any number of tracer particles as one point cloud.
+
+    Points and colours are rewritten in place by update_tracers. The Cairo
+    camera overwrites pixels rather than blending them, so fading mixes the
+    colour towards the background instead of lowering the opacity.
+    """
+
+    def __init__(self, count, extent, offset, color=WHITE, background=BLACK, stroke_width=1, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.extent = extent
+        self.offset = np.asarray(offset, dtype=float)
+        self.color_rgb = np.asarray(ManimColor(color).to_rgb())
+        self.background_rgb = np.asarray(ManimColor(background).to_rgb())
+        self.points = np.zeros((count, 3))
+        self.rgbas = np.ones((count, 4))
+
+    def update_tracers(self, tracers):
+        """Copy positions and fade from a tracers.TracerParticles."""
+        unit_to_scene(tracers.x, tracers.y, self.extent, self.offset, self.points)
+        np.multiply.outer(tracers.fade, self.color_rgb - self.background_rgb, out=self.rgbas[:, :3])
+        self.rgbas[:, :3] += self.background_rgb
+        return self
+
+
+class StreamlineField(VMobject):
+    """
+    A batch of streamlines as one VMobject of straight segments.
+
+    update_lines takes the output of tracers.streamlines; segments with an
+    invalid end are dropped, which splits lines into separate subpaths.
+    """
+
+    def __init__(self, extent, offset, color=YELLOW, stroke_width=1.5, stroke_opacity=0.8, **kwargs):
+        super().__init__(**kwargs)
+        self.extent = extent
+        self.offset = np.asarray(offset, dtype=float)
+        self.set_stroke(color, width=stroke_width, opacity=stroke_opacity)
+        self.set_fill(opacity=0)
+
+    def update_lines(self, lines, valid):
+        """Rewrite the points from (K, M, 2) normalized lines and their (K, M) valid flags."""
+        count, length = valid.shape
+        points = unit_to_scene(lines[..., 0].ravel(), lines[..., 1].ravel(), self.extent, self.offset,
+                               np.empty((count * length, 3))).reshape(count, length, 3)
+        keep = valid[:, :-1] & valid[:, 1:]
+        starts, ends = points[:, :-1][keep], points[:, 1:][keep]
+        weights = np.linspace(0, 1, 4)[:, None]
+        curves = starts[:, None] * (1 - weights) + ends[:, None] * weights
+        self.set_points(curves.reshape(-1, 3))
+        return self
@@ -0,0 +1,273 @@
+"""
+Simulate-then-render frame cache for fluid scenes
+Frames are stored as a memory-mapped .npy stack keyed by solver parameters and forcing code
+
+Phase one runs the solver headless and writes density, u, v and vorticity
+for every simulation frame into <cache>/<key>/frames.npy. Phase two (the
+scene) maps the same file read-only and reads frames without copying. The
+key does not depend on render quality, so -ql and -qh renders, and colour
+tweaks, reuse one simulation. The writer can run in a background process
+while the scene consumes finished frames.
+"""
+
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+
+FRAME_FORMAT_VERSION = 1
+FIELDS = ("density", "u", "v", "vorticity")
+
+# Override with the FLUID_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frame_cache")
+
+
+def _source_of(obj):
+    """
+    Source text of a function, or of every method of a class.
+
+    Methods are read through their code objects, which works even when the
+    defining module (e.g. a scene file loaded by manim) is not importable.
+    """
+    if inspect.isclass(obj):
+        methods = [value for _, value in sorted(vars(obj).items()) if inspect.isfunction(value)]
+        return "".join(inspect.getsource(method) for method in methods)
+    return inspect.getsource(obj)
+
+
+def frame_cache_key(params, functions=(), source_files=()):
+    """
+    Hash everything a simulated frame stack depends on.
+
+    Parameters:
+    -----------
+    params : dict
+        Solver arguments, frame count, substeps, ... (JSON-serializable)
+    functions : iterable of callables or classes
+        Solver class, initial-condition and forcing functions; their source
+        is hashed, so editing them invalidates old entries
+    source_files : iterable of paths
+        Other files the physics depends on (e.g. poisson.py)
+
+    Returns:
+    --------
+    key : str (hex digest)
+    """
+    digest = hashlib.sha256()
+    digest.update(f"frame-format-{FRAME_FORMAT_VERSION}".encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    for func in functions:
+        digest.update(_source_of(func).encode())
+    for path in source_files:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class FrameCache:
+    """
+    One cache entry: frames.npy of shape (num_frames + 1, len(FIELDS), size, size)
+    plus progress.json with the number of finished frames.
+
+    Frame 0 is the initial state; frame k is the state after k simulation frames.
+    A writer that fails leaves an error in progress.json, so the entry is never
+    taken as complete and readers stop waiting for it. `process` is the
+    background writer started by cached_simulation, if any.
+    """
+
+    def __init__(self, key, num_frames, size, dtype=np.float32, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.environ.get("FLUID_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.key = key
+        self.shape = (num_frames + 1, len(FIELDS), size, size)
+        self.dtype = np.dtype(dtype)
+        self.directory = os.path.join(cache_dir, key)
+        self.frames_path = os.path.join(self.directory, "frames.npy")
+        self.progress_path = os.path.join(self.directory, "progress.json")
+        self._reader = None
+        self.process = None
+
+    @property
+    def num_frames(self):
+        return self.shape[0] - 1
+
+    def _progress(self):
+        """Contents of progress.json ({} when the entry does not exist)."""
+        try:
+            with open(self.progress_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def frames_done(self):
+        """Frames written so far (0 when the entry does not exist)."""
+        return self._progress().get('frames_done', 0)
+
+    def error(self):
+        """Why the writer failed, or None."""
+        return self._progress().get('error')
+
+    def is_complete(self):
+        progress = self._progress()
+        return progress.get('frames_done') == self.shape[0] and not progress.get('error')
+
+    def _write_progress(self, frames_done, meta=None, error=None):
+        tmp_path = f"{self.progress_path}.{os.getpid()}.tmp"
+        record = {'frames_done': frames_done, 'shape': self.shape, 'meta': meta or {}}
+        if error is not None:
+            record['error'] = error
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        # Rename so readers never see a half-written progress file
+        os.replace(tmp_path, self.progress_path)
+
+    def open_for_writing(self, meta=None):
+        """Create the full-size stack and reset progress; returns the writable memmap."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_progress(0, meta)
+        return np.lib.format.open_memmap(self.frames_path, mode="w+", dtype=self.dtype, shape=self.shape)
+
+    def reset(self):
+        """Forget the progress of an earlier (incomplete) run."""
+        if os.path.exists(self.progress_path):
+            os.remove(self.progress_path)
+        self._reader = None
+
+    def mark_written(self, frames_done, frames, meta=None):
+        """Flush the memmap, then publish the new frame count."""
+        frames.flush()
+        self._write_progress(frames_done, meta)
+
+    def mark_failed(self, error):
+        """Record that the writer failed, keeping the count of frames it finished."""
+        progress = self._progress()
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_progress(progress.get('frames_done', 0), progress.get('meta'), error)
+
+    def reader(self):
+        """Read-only memmap of the stack (opened once, shared by all frame views)."""
+        if self._reader is None:
+            self._reader = np.lib.format.open_memmap(self.frames_path, mode="r")
+        return self._reader
+
+    def wait_for_frame(self, index, timeout=600.0, poll=0.05):
+        """
+        Block until frame `index` has been written (by this or another process).
+
+        Raises RuntimeError as soon as the writer has failed (its error is in
+        progress.json) or the background writer process has exited without
+        writing the frame, and TimeoutError after `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            progress = self._progress()
+            if progress.get('frames_done', 0) > index:
+                return
+            if progress.get('error'):
+                raise RuntimeError(f"Frame {index} of cache {self.key} will not be written: {progress['error']}")
+            if self.process is not None and not self.process.is_alive():
+                # The writer may have published the frame just before exiting
+                if self.frames_done() > index:
+                    return
+                error = self.error() or f"writer process exited with code {self.process.exitcode}"
+                self.mark_failed(error)
+                raise RuntimeError(f"Frame {index} of cache {self.key} will not be written: {error}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Frame {index} of cache {self.key} not written after {timeout}s")
+            time.sleep(poll)
+
+    def frame(self, index, wait=True):
+        """Zero-copy views {field name: (size, size) array} of one frame."""
+        if wait:
+            self.wait_for_frame(index)
+        frames = self.reader()
+        return {name: frames[index, k] for k, name in enumerate(FIELDS)}
+
+
+def record_frame(frames, index, solver):
+    """Copy the solver fields into frame `index` (vorticity is computed in place)."""
+    slot = frames[index]
+    np.copyto(slot[FIELDS.index("density")], solver.density, casting="same_kind")
+    np.copyto(slot[FIELDS.index("u")], solver.u, casting="same_kind")
+    np.copyto(slot[FIELDS.index("v")], solver.v, casting="same_kind")
+    vorticity = slot[FIELDS.index("vorticity")]
+    if vorticity.dtype == solver.dtype:
+        solver.get_vorticity(out=vorticity)
+    else:
+        np.copyto(vorticity, solver.get_vorticity(), casting="same_kind")
+
+
+def simulate_to_cache(cache, solver_factory, solver_params, setup, forcing, steps_per_frame=1):
+    """
+    Phase one: run the solver headless and write every frame to the cache.
+
+    Parameters:
+    -----------
+    cache : FrameCache
+    solver_factory : callable
+        solver_factory(**solver_params) -> NavierStokesSolver-like object
+    setup : callable
+        setup(solver) adds the initial conditions
+    forcing : callable or None
+        forcing(solver, frame) runs after the substeps of each frame
+    steps_per_frame : int
+        Solver steps between stored frames
+    """
+    meta = {'solver_params': solver_params, 'steps_per_frame': steps_per_frame}
+    try:
+        solver = solver_factory(**solver_params)
+        setup(solver)
+        frames = cache.open_for_writing(meta)
+        record_frame(frames, 0, solver)
+        cache.mark_written(1, frames, meta)
+        for frame in range(cache.num_frames):
+            solver.step(steps_per_frame)
+            if forcing is not None:
+                forcing(solver, frame)
+            record_frame(frames, frame + 1, solver)
+            cache.mark_written(frame + 2, frames, meta)
+    except BaseException as exc:
+        # Never leave a half-written entry that looks resumable or pending
+        cache.mark_failed(f"{type(exc).__name__}: {exc}")
+        raise
+    del frames
+    return cache
+
+
+def cached_simulation(solver_factory, solver_params, setup, forcing, num_frames, steps_per_frame=1,
+                      background=False, source_files=(), cache_dir=None, dtype=np.float32):
+    """
+    Get (or start producing) the frame cache for a simulation.
+
+    A complete entry is reused as is. Otherwise the simulation runs now, or
+    with background=True in a forked process while the caller reads frames
+    through FrameCache.frame (which waits for each one). Platforms without
+    fork run it in the foreground.
+
+    Returns:
+    --------
+    cache : FrameCache
+    """
+    params = dict(solver_params, num_frames=num_frames, steps_per_frame=steps_per_frame,
+                  storage_dtype=np.dtype(dtype).name)
+    key = frame_cache_key(params, (solver_factory, setup) + ((forcing,) if forcing else ()), source_files)
+    cache = FrameCache(key, num_frames, solver_params['size'], dtype=dtype, cache_dir=cache_dir)
+    if cache.is_complete():
+        return cache
+
+    cache.reset()
+    args = (cache, solver_factory, solver_params, setup, forcing, steps_per_frame)
+    if background and "fork" in multiprocessing.get_all_start_methods():
+        process = multiprocessing.get_context("fork").Process(target=simulate_to_cache, args=args, daemon=True)
+        process.start()
+        cache.process = process
+        # The writer creates the stack first; wait for it before anyone maps it
+        cache.wait_for_frame(0)
+    else:
+        simulate_to_cache(*args)
+    return cache
@@ -0,0 +1,114 @@
+"""
+Pressure solver benchmark
+Times every Poisson backend against grid size on a projection problem and
+reports iterations, residual and the divergence left after projection
+
+Usage:
+    python poisson_benchmark.py
+    python poisson_benchmark.py --sizes 66 130 258 --backends dct multigrid --output poisson.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from poisson import POISSON_BACKENDS, apply_laplacian, make_poisson_solver, set_neumann
+
+
+def projection_problem(size, seed=0, smoothing=3):
+    """
+    Right-hand side of the projection for a random smooth velocity field.
+
+    Returns the (size, size) rhs laid out like NavierStokesSolver.project's
+    `div` (ghost ring included) and the grid spacing.
+    """
+    rng = np.random.default_rng(seed)
+    n = size - 2
+    h = 1.0 / n
+    u = np.zeros((size, size))
+    v = np.zeros((size, size))
+    # Box-smoothed noise, zero normal velocity on the walls
+    for field in (u, v):
+        noise = rng.normal(size=(n, n))
+        for axis in (0, 1):
+            for _ in range(smoothing):
+                noise = (np.roll(noise, 1, axis) + noise + np.roll(noise, -1, axis)) / 3
+        field[1:-1, 1:-1] = noise
+    u[0], u[-1] = -u[1], -u[-2]
+    v[:, 0], v[:, -1] = -v[:, 1], -v[:, -2]
+    u[:, 0], u[:, -1] = u[:, 1], u[:, -2]
+    v[0], v[-1] = v[1], v[-2]
+
+    rhs = np.zeros((size, size))
+    rhs[1:-1, 1:-1] = -0.5 * h * (u[2:, 1:-1] - u[:-2, 1:-1] + v[1:-1, 2:] - v[1:-1, :-2])
+    set_neumann(rhs)
+    return rhs, h
+
+
+def run_backend(backend, size, tol, repeat=3):
+    """Set-up time, best solve time and the solver report for one backend and size."""
+    rhs, h = projection_problem(size)
+    divergence_before = float(np.abs(rhs[1:-1, 1:-1]).max()) / h ** 2
+
+    start = time.perf_counter()
+    solver = make_poisson_solver(backend, size - 2, tol=tol)
+    setup = time.perf_counter() - start
+
+    best = None
+    for _ in range(repeat):
+        p = np.zeros_like(rhs)
+        start = time.perf_counter()
+        report = solver.solve(p, rhs)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, report, p)
+    elapsed, report, p = best
+
+    residual = rhs[1:-1, 1:-1] - apply_laplacian(p, np.empty((size - 2, size - 2)))
+    return {
+        'backend': backend,
+        'size': size,
+        'tol': tol,
+        'time_setup': setup,
+        'time_solve': elapsed,
+        'iterations': report['iterations'],
+        'residual': report['residual'],
+        'divergence_before': divergence_before,
+        'divergence_after': float(np.abs(residual).max()) / h ** 2,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pressure Poisson backends")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[66, 130, 258],
+                        help="Grid sizes including the ghost ring (2^k + 2 suits multigrid)")
+    parser.add_argument("--backends", nargs="+", default=sorted(POISSON_BACKENDS),
+                        choices=sorted(POISSON_BACKENDS))
+    parser.add_argument("--tol", type=float, default=1e-6, help="Divergence target")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed solves per case (best is kept)")
+    parser.add_argument("--output", help="Optional JSON results file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'backend':>10} {'size':>5} {'setup':>9} {'solve':>9} {'iters':>5} {'residual':>9} {'div':>9}")
+    for size in args.sizes:
+        for backend in args.backends:
+            record = run_backend(backend, size, args.tol, args.repeat)
+            results.append(record)
+            mark = "✓" if record['divergence_after'] <= args.tol else "✗"
+            print(f"{backend:>10} {size:>5} {record['time_setup'] * 1e3:>7.1f}ms "
+                  f"{record['time_solve'] * 1e3:>7.2f}ms {record['iterations']:>5} "
+                  f"{record['residual']:>9.1e} {record['divergence_after']:>9.1e} {mark}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"✓ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Fluid solver benchmark
+Steps per second and per-step allocation profile of NavierStokesSolver by
+grid size, dtype and pressure backend
+
+The allocation profile runs the solver under tracemalloc: "transient" is the
+peak extra memory while stepping and "retained" what is still held after it.
+An allocation-free step keeps both independent of the grid size (NumPy's
+fixed-size iteration buffers show up as a small constant).
+
+Usage:
+    python solver_benchmark.py
+    python solver_benchmark.py --sizes 66 130 258 --dtypes float32 --backends dct jacobi
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from poisson import POISSON_BACKENDS
+from simulation import NavierStokesSolver
+
+
+def seeded_solver(size, dtype, backend):
+    """A solver with a swirl of velocity and density to advect."""
+    solver = NavierStokesSolver(size=size, dtype=dtype, pressure_solver=backend)
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    solver.add_sources(0.5 + 0.2 * np.cos(angle), 0.5 + 0.2 * np.sin(angle),
+                       vx=-np.sin(angle) * 20, vy=np.cos(angle) * 20, amount=100, radius=3)
+    return solver
+
+
+def profile_steps(solver, steps):
+    """Transient and retained bytes over `steps` steps (after a warm-up step)."""
+    solver.step()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    solver.step(steps)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base, current - base
+
+
+def run_case(size, dtype, backend, steps=50, profile_steps_count=10):
+    solver = seeded_solver(size, dtype, backend)
+    transient, retained = profile_steps(solver, profile_steps_count)
+
+    start = time.perf_counter()
+    solver.step(steps)
+    elapsed = time.perf_counter() - start
+
+    report = solver.projection_report
+    return {
+        'size': size,
+        'dtype': np.dtype(dtype).name,
+        'backend': backend,
+        'steps_per_second': steps / elapsed,
+        'field_bytes': size * size * np.dtype(dtype).itemsize,
+        'transient_bytes': transient,
+        'retained_bytes': retained,
+        'residual': report['residual'],
+        'divergence': report['divergence'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NavierStokesSolver steps and allocations")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[66, 130, 258])
+    parser.add_argument("--dtypes", nargs="+", default=["float64", "float32"], choices=["float64", "float32"])
+    parser.add_argument("--backends", nargs="+", default=["dct", "jacobi"], choices=sorted(POISSON_BACKENDS))
+    parser.add_argument("--steps", type=int, default=50, help="Timed steps per case")
+    parser.add_argument("--output", help="Optional JSON results file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'size':>5} {'dtype':>8} {'backend':>10} {'steps/s':>8} {'field':>9} {'transient':>10} {'retained':>9}")
+    for size in args.sizes:
+        for dtype in args.dtypes:
+            for backend in args.backends:
+                record = run_case(size, dtype, backend, args.steps)
+                results.append(record)
+                print(f"{size:>5} {record['dtype']:>8} {backend:>10} {record['steps_per_second']:>8.1f} "
+                      f"{record['field_bytes'] / 1024:>7.0f}kB {record['transient_bytes'] / 1024:>8.0f}kB "
+                      f"{record['retained_bytes'] / 1024:>7.1f}kB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"✓ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
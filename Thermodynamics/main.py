@@ -1,4 +1,266 @@
 from manim import *
+import argparse
+import json
+import sys
+import time
+
+
+class KineticGas:
+    """Ideal gas of point particles in the cylinder, as (N, 2) position and velocity arrays.
+
+    Units have m = k_B = 1, so in 2D the temperature is the mean of v_x^2
+    and v_y^2, and the pressure is force per unit length of wall.
+
+    - Particles fly ballistically and reflect elastically off the cylinder
+      walls and the piston face. The piston is a moving wall (v_x -> 2V - v_x),
+      so a receding piston takes energy from the gas: the work P dV.
+    - The pressure comes from the momentum the piston face receives.
+    - The heater is a heat bath: particles exchange their velocity with it at
+      random (Andersen collisions), which also shares energy between x and y.
+    """
+
+    def __init__(self, count, left, piston, bottom, top, temperature=16.0, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.left, self.piston, self.bottom, self.top = left, piston, bottom, top
+        self.positions = np.column_stack([
+            self.rng.uniform(left, piston, count),
+            self.rng.uniform(bottom, top, count),
+        ])
+        self.velocities = self.rng.normal(0, np.sqrt(temperature), (count, 2))
+        self.piston_impulse = 0.0
+        self.impulse_time = 0.0
+
+    @property
+    def count(self):
+        return len(self.positions)
+
+    def area(self):
+        return (self.piston - self.left) * (self.top - self.bottom)
+
+    def step(self, dt, piston):
+        """Advance by dt while the piston face moves (linearly) to `piston`.
+
+        Substeps keep every particle from crossing more than half the chamber
+        per substep, so one reflection per wall and substep is enough.
+        """
+        width = min(piston, self.piston) - self.left
+        fastest = np.abs(self.velocities[:, 0]).max()
+        substeps = max(1, int(np.ceil(fastest * dt / (0.5 * width))))
+        start = self.piston
+        for k in range(1, substeps + 1):
+            self._advance(dt / substeps, start + (piston - start) * k / substeps)
+
+    def _advance(self, dt, piston):
+        piston_velocity = (piston - self.piston) / dt
+        self.piston = piston
+        pos, vel = self.positions, self.velocities
+        pos += vel * dt
+
+        # Piston face: reflect in the frame of the moving wall
+        hit = pos[:, 0] > piston
+        if hit.any():
+            vx = vel[hit, 0]
+            self.piston_impulse += 2 * float((vx - piston_velocity).sum())
+            vel[hit, 0] = 2 * piston_velocity - vx
+            pos[hit, 0] = 2 * piston - pos[hit, 0]
+
+        # Fixed walls
+        hit = pos[:, 0] < self.left
+        pos[hit, 0] = 2 * self.left - pos[hit, 0]
+        vel[hit, 0] *= -1
+        hit = pos[:, 1] < self.bottom
+        pos[hit, 1] = 2 * self.bottom - pos[hit, 1]
+        vel[hit, 1] *= -1
+        hit = pos[:, 1] > self.top
+        pos[hit, 1] = 2 * self.top - pos[hit, 1]
+        vel[hit, 1] *= -1
+
+        np.clip(pos[:, 0], self.left, piston, out=pos[:, 0])
+        self.impulse_time += dt
+
+    def heat(self, dt, temperature, tau=0.05):
+        """Heat-bath collisions: each particle is rethermalized at `temperature` at rate 1 / tau."""
+        hit = self.rng.random(self.count) < dt / tau
+        self.velocities[hit] = self.rng.normal(0, np.sqrt(temperature), (np.count_nonzero(hit), 2))
+
+    def temperature(self):
+        return float(np.mean(self.velocities ** 2))
+
+    def take_pressure(self):
+        """Mean pressure on the piston since the last call (impulse / time / face length)."""
+        if self.impulse_time == 0:
+            return 0.0
+        pressure = self.piston_impulse / (self.impulse_time * (self.top - self.bottom))
+        self.piston_impulse = 0.0
+        self.impulse_time = 0.0
+        return pressure
+
+
+class HardDiskGas(KineticGas):
+    """Gas of equal hard disks in a closed box: KineticGas walls plus disk-disk collisions.
+
+    Time-stepped rather than event-driven: each substep moves every disk, then
+    resolves all overlapping, approaching pairs at once with elastic impulses
+    along the line of centres. Pairs come from a cell list: disks are sorted by
+    cell index and np.searchsorted finds each neighbour cell range, so the cost
+    grows about linearly with the number of disks.
+    """
+
+    def __init__(self, count, left, right, bottom, top, radius, speed=None, temperature=1.0, seed=None):
+        # Walls act on the disk centres, so shrink the box by the radius
+        super().__init__(count, left + radius, right - radius, bottom + radius, top - radius,
+                         temperature=temperature, seed=seed)
+        self.radius = radius
+        if speed is not None:
+            # Same speed, random directions: far from Maxwell-Boltzmann
+            angle = self.rng.uniform(0, 2 * np.pi, count)
+            self.velocities = speed * np.column_stack([np.cos(angle), np.sin(angle)])
+        self.collisions = 0
+
+        cell = 2 * radius
+        self.cell_size = cell
+        self.columns = max(int(np.ceil((self.piston - self.left) / cell)), 1)
+        self.rows = max(int(np.ceil((self.top - self.bottom) / cell)), 1)
+
+    def step(self, dt, piston=None):
+        """Advance by dt in substeps short enough that no disk moves more than its radius."""
+        fastest = np.sqrt((self.velocities ** 2).sum(axis=1).max())
+        substeps = max(1, int(np.ceil(fastest * dt / self.radius)))
+        for _ in range(substeps):
+            self._advance(dt / substeps, self.piston)
+            self.collide()
+
+    def _pairs(self):
+        """Sort disks by cell, then return all pairs (i, j) in neighbouring cells, each once."""
+        n = self.count
+        ix = ((self.positions[:, 0] - self.left) / self.cell_size).astype(np.intp)
+        iy = ((self.positions[:, 1] - self.bottom) / self.cell_size).astype(np.intp)
+        np.clip(ix, 0, self.columns - 1, out=ix)
+        np.clip(iy, 0, self.rows - 1, out=iy)
+        ids = ix * self.rows + iy
+        order = np.argsort(ids, kind="stable")
+        self.positions = self.positions[order]
+        self.velocities = self.velocities[order]
+        ids, ix, iy = ids[order], ix[order], iy[order]
+
+        # Cells (x, y - 1), (x, y), (x, y + 1) are consecutive ids: one range per column.
+        # Own column: later disks up to the cell above; next column: all three cells
+        low = np.maximum(iy - 1, 0)
+        high = np.minimum(iy + 1, self.rows - 1)
+        own_end = np.searchsorted(ids, ix * self.rows + high, side="right")
+        has_next = ix + 1 < self.columns
+        next_start = np.searchsorted(ids, (ix + 1) * self.rows + low, side="left")
+        next_end = np.where(has_next, np.searchsorted(ids, (ix + 1) * self.rows + high, side="right"), next_start)
+
+        first = np.concatenate([np.arange(1, n + 1), next_start])
+        count = np.concatenate([own_end - np.arange(1, n + 1), next_end - next_start])
+        np.maximum(count, 0, out=count)
+        i = np.repeat(np.tile(np.arange(n), 2), count)
+        j = np.repeat(first - (np.cumsum(count) - count), count) + np.arange(count.sum())
+        return i, j
+
+    def collide(self, max_passes=4):
+        """Resolve overlapping, approaching pairs with equal-mass elastic impulses.
+
+        A disk touching several others is resolved one pair per pass (a greedy
+        matching of the contact pairs), so every impulse is a true two-body
+        collision and kinetic energy is conserved.
+        """
+        i, j = self._pairs()
+        pos, vel = self.positions, self.velocities
+        dx = pos[i] - pos[j]
+        d2 = np.einsum("pd,pd->p", dx, dx)
+        close = np.flatnonzero(d2 < (2 * self.radius) ** 2)
+        i, j, dx, d2 = i[close], j[close], dx[close], d2[close]
+
+        resolved = 0
+        for _ in range(max_passes):
+            approach = np.einsum("pd,pd->p", vel[i] - vel[j], dx)
+            hit = approach < 0
+            if not hit.any():
+                break
+            i, j, dx, d2, approach = i[hit], j[hit], dx[hit], d2[hit], approach[hit]
+
+            # Each disk takes part in at most one pair per pass: its first
+            index = np.arange(len(i))
+            first = np.full(self.count, len(i))
+            np.minimum.at(first, np.concatenate([i, j]), np.concatenate([index, index]))
+            now = (first[i] == index) & (first[j] == index)
+
+            # Exchange the normal component of the relative velocity
+            impulse = dx[now] * (approach[now] / np.maximum(d2[now], 1e-30))[:, None]
+            vel[i[now]] -= impulse
+            vel[j[now]] += impulse
+            resolved += np.count_nonzero(now)
+            i, j, dx, d2 = i[~now], j[~now], dx[~now], d2[~now]
+        self.collisions += resolved
+        return resolved
+
+    def speeds(self):
+        return np.sqrt((self.velocities ** 2).sum(axis=1))
+
+
+class GasCloud(PMobject):
+    """All gas particles as one point cloud; update_from copies positions into its point buffer."""
+
+    def __init__(self, gas, color=YELLOW, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.points = np.zeros((gas.count, 3))
+        self.rgbas = np.tile(np.append(ManimColor(color).to_rgb(), 1.0), (gas.count, 1))
+        self.update_from(gas)
+
+    def update_from(self, gas):
+        self.points[:, :2] = gas.positions
+        return self
+
+
+class SpeedHistogram(VMobject):
+    """Speed histogram drawn as one VMobject whose bar outlines are rewritten in place.
+
+    update_from(speeds) bins the speeds as a probability density; bar heights
+    are scaled so a density of `max_density` fills `height`. The first point is
+    always the lower-left corner (speed 0, density 0), so moving the mobject
+    moves every later update with it.
+    """
+
+    def __init__(self, max_speed, num_bins=30, width=4.0, height=2.5, max_density=1.0,
+                 color=YELLOW, **kwargs):
+        super().__init__(**kwargs)
+        self.edges = np.linspace(0, max_speed, num_bins + 1)
+        self.bar_width = width
+        self.bar_height = height
+        self.max_density = max_density
+        self.set_fill(color, opacity=0.6)
+        self.set_stroke(color, width=1)
+        self._corners = np.zeros((num_bins, 5, 3))
+        self.update_from(np.zeros(0))
+
+    def origin(self):
+        return self.points[0].copy() if len(self.points) else ORIGIN.copy()
+
+    def to_scene(self, speeds, densities):
+        """Scene points (K, 3) of speed / density pairs, e.g. for a reference curve."""
+        speeds, densities = np.broadcast_arrays(speeds, densities)
+        local = np.column_stack([
+            speeds / self.edges[-1] * self.bar_width,
+            np.minimum(densities / self.max_density, 1) * self.bar_height,
+            np.zeros(len(speeds)),
+        ])
+        return local + self.origin()
+
+    def update_from(self, speeds):
+        density, _ = np.histogram(speeds, bins=self.edges, density=len(speeds) > 0)
+        corners = self._corners
+        corners[:, [0, 3, 4], 0] = (self.edges[:-1] / self.edges[-1] * self.bar_width)[:, None]
+        corners[:, [1, 2], 0] = (self.edges[1:] / self.edges[-1] * self.bar_width)[:, None]
+        corners[:, [2, 3], 1] = (np.minimum(density / self.max_density, 1) * self.bar_height)[:, None]
+
+        # Closed rectangles as straight cubic segments
+        weights = np.linspace(0, 1, 4)[:, None]
+        curves = corners[:, :-1, None] * (1 - weights) + corners[:, 1:, None] * weights
+        self.set_points(curves.reshape(-1, 3) + self.origin())
+        return self
+
 
 class IsobaricExpansion(Scene):
     def construct(self):
@@ -7,89 +269,185 @@ class IsobaricExpansion(Scene):
         cylinder_top = Line(LEFT*2 + UP*1.5, RIGHT*2 + UP*1.5, stroke_width=4)
         cylinder_left = Line(LEFT*2 + UP*1.5, LEFT*2 + DOWN*1.5, stroke_width=4)
         cylinder = VGroup(cylinder_bottom, cylinder_top, cylinder_left)
-        
+
         # Piston
         piston = Rectangle(width=0.5, height=3, color=BLUE, fill_opacity=0.5)
         piston.move_to(LEFT*1.5)
-        
-        # Gas Particles (Random dots)
-        num_particles = 200
-        particles = VGroup()
-        for _ in range(num_particles):
-            dot = Dot(color=YELLOW, radius=0.03)
-            # Random position in initial small volume
-            x = np.random.uniform(-1.98, -1.77)
-            y = np.random.uniform(-1.4, 1.4)
-            dot.move_to([x, y, 0])
-            
-            # Store relative X position (0 to 1) within the chamber
-            # Chamber goes from -2.0 to -1.75 (width 0.25)
-            dot.relative_x = (x - (-2.0)) / 0.25
-            dot.initial_y = y
-            particles.add(dot)
+
+        # Gas particles in the initial small volume
+        # Chamber goes from -2.0 to the piston's left face at -1.75 (width 0.25)
+        left_wall = -2.0
+        initial_face = -1.75
+        temperature0 = 16.0
+        gas = KineticGas(10000, left_wall, initial_face, -1.47, 1.47, temperature=temperature0)
+        particles = GasCloud(gas)
+
+        # Reference state: ideal gas P0 = N T0 / A0
+        area0 = gas.area()
+        pressure0 = gas.count * temperature0 / area0
 
         self.add(cylinder, piston, particles)
-        
+
+        # Live readouts; the measured pressure is smoothed over ~0.25 s
+        state = {'pressure': pressure0}
+        readouts = VGroup(*[
+            VGroup(MathTex(label, font_size=34), DecimalNumber(1.0, num_decimal_places=2, font_size=34)).arrange(RIGHT)
+            for label in (r"P / P_0 =", r"T / T_0 =", r"V / V_0 =")
+        ]).arrange(DOWN, aligned_edge=LEFT).to_corner(UR)
+        p_value, t_value, v_value = (row[1] for row in readouts)
+        p_value.add_updater(lambda m: m.set_value(state['pressure'] / pressure0))
+        t_value.add_updater(lambda m: m.set_value(gas.temperature() / temperature0))
+        v_value.add_updater(lambda m: m.set_value(gas.area() / area0))
+        self.add(readouts)
+
         # Heat source (Arrows from left face)
         arrows = VGroup(*[Arrow(start=LEFT, end=RIGHT, color=RED).next_to(cylinder_left, LEFT).shift(UP * i * 0.5) for i in range(-2, 3)])
-        
+
         self.play(FadeIn(arrows))
-        
+
         # Animation: Expansion
         expansion_tracker = ValueTracker(0)
-        
+
         # Updater for piston
         def update_piston(m):
             val = expansion_tracker.get_value()
             m.move_to(LEFT*1.5 + RIGHT * val)
-            
+
         piston.add_updater(update_piston)
-        
-        # Updater for particles
-        def update_particles(m):
-            val = expansion_tracker.get_value()
-            
-            # Current chamber boundaries
-            left_wall = -2.0
-            # Piston left face: Center is (-1.5 + val), width 0.5 -> Left face is -1.75 + val
-            piston_face = -1.75 + val
-            current_width = piston_face - left_wall
-            
-            margin = 0.05
-            
-            for dot in m:
-                # Calculate "base" position based on expansion (uniform distribution)
-                base_x = left_wall + dot.relative_x * current_width
-                
-                # Add random vibration (jitter)
-                # Increasing jitter as expansion happens to simulate heating? 
-                # User said "increase vibration". Let's make it constant but large.
-                jitter_amount = 0.1
-                dx = np.random.uniform(-jitter_amount, jitter_amount)
-                dy = np.random.uniform(-jitter_amount, jitter_amount)
-                
-                new_x = base_x + dx
-                new_y = dot.initial_y + dy # Vibrating around initial Y
-                
-                # Clamp X to stay inside chamber
-                if new_x < left_wall + margin:
-                    new_x = left_wall + margin + abs(dx)
-                elif new_x > piston_face - margin:
-                    new_x = piston_face - margin - abs(dx)
-                
-                # Clamp Y to stay inside cylinder
-                if new_y < -1.5 + margin:
-                    new_y = -1.5 + margin + abs(dy)
-                elif new_y > 1.5 - margin:
-                    new_y = 1.5 - margin - abs(dy)
-                
-                dot.move_to([new_x, new_y, 0])
+
+        # Updater for particles: the gas follows the piston's left face, and the
+        # heater keeps T / T0 = V / V0, the heat an isobaric expansion needs
+        def update_particles(m, dt):
+            if dt == 0:
+                return
+            piston_face = initial_face + expansion_tracker.get_value()
+            gas.step(dt, piston_face)
+            gas.heat(dt, temperature0 * gas.area() / area0)
+            state['pressure'] += (gas.take_pressure() - state['pressure']) * min(1.0, dt / 0.25)
+            m.update_from(gas)
 
         particles.add_updater(update_particles)
-        
+
+        # Slow enough to stay close to quasi-static: the piston moves at a
+        # small fraction of the thermal speed
         self.play(
             expansion_tracker.animate.set_value(3),
-            run_time=4,
+            run_time=6,
             rate_func=linear
         )
         self.wait()
+
+
+def disk_radius(count, area_fraction, area):
+    """Radius at which `count` disks cover `area_fraction` of a box of the given area."""
+    return np.sqrt(area_fraction * area / (np.pi * count))
+
+
+class MaxwellBoltzmann(Scene):
+    def construct(self):
+        # Box on the left; every disk starts with the same speed
+        left, right, bottom, top = -6.5, -0.5, -2.0, 2.0
+        box = Rectangle(width=right - left, height=top - bottom, stroke_width=4)
+        box.move_to([(left + right) / 2, (bottom + top) / 2, 0])
+        count = 5000
+        speed0 = 1.0
+        radius = disk_radius(count, 0.1, (right - left) * (top - bottom))
+        gas = HardDiskGas(count, left, right, bottom, top, radius, speed=speed0, seed=1)
+        particles = GasCloud(gas)
+
+        # Speed histogram on the right, with plain axes
+        histogram = SpeedHistogram(max_speed=3 * speed0, num_bins=30, width=5.0, height=3.0, max_density=1.2)
+        histogram.shift(RIGHT * 0.75 + DOWN * 1.5)
+        corner = histogram.origin()
+        axes = VGroup(
+            Line(corner, corner + RIGHT * 5.2, stroke_width=2),
+            Line(corner, corner + UP * 3.2, stroke_width=2),
+        )
+        v_label = MathTex("v", font_size=34).next_to(axes[0], RIGHT, buff=0.1)
+        f_label = MathTex("f(v)", font_size=34).next_to(axes[1], UP, buff=0.1)
+        title = Text("Hard-disk gas", font_size=36).to_edge(UP, buff=0.3)
+        collisions = VGroup(Text("collisions:", font_size=28), Integer(0, font_size=28)).arrange(RIGHT)
+        collisions.next_to(box, DOWN, buff=0.25)
+        collisions[1].add_updater(lambda m: m.set_value(gas.collisions))
+        self.add(box, particles, histogram, axes, v_label, f_label, title, collisions)
+
+        def update_gas(m, dt):
+            if dt == 0:
+                return
+            gas.step(dt)
+            m.update_from(gas)
+            histogram.update_from(gas.speeds())
+
+        particles.add_updater(update_gas)
+        self.wait(5)
+
+        # Collisions conserve energy, so T is fixed by the initial speed:
+        # 2D Maxwell-Boltzmann f(v) = v / T exp(-v^2 / 2T)
+        temperature = gas.temperature()
+        speeds = np.linspace(0, histogram.edges[-1], 120)
+        curve = VMobject(color=RED, stroke_width=4)
+        curve.set_points_smoothly(histogram.to_scene(speeds, speeds / temperature * np.exp(-speeds ** 2 / (2 * temperature))))
+        formula = MathTex(r"f(v) = \frac{v}{T}\, e^{-v^2 / 2T}", font_size=36, color=RED)
+        formula.next_to(axes, UP, buff=0.1).align_to(axes, RIGHT)
+        self.play(Create(curve), Write(formula), run_time=2)
+        self.wait(3)
+
+
+def benchmark(count, steps, area_fraction=0.1, dt=1 / 60, seed=0):
+    """Time HardDiskGas frames at a fixed area fraction in a 6 x 4 box."""
+    radius = disk_radius(count, area_fraction, 24.0)
+    gas = HardDiskGas(count, -3.0, 3.0, -2.0, 2.0, radius, temperature=0.5, seed=seed)
+    gas.step(dt)  # warm-up: resolves the overlaps of the random start
+    gas.collisions = 0
+    energy = (gas.velocities ** 2).sum()
+
+    substeps = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        fastest = np.sqrt((gas.velocities ** 2).sum(axis=1).max())
+        substeps += max(1, int(np.ceil(fastest * dt / gas.radius)))
+        gas.step(dt)
+    elapsed = time.perf_counter() - start
+    return {
+        'count': count,
+        'radius': radius,
+        'frames_per_second': steps / elapsed,
+        'substeps_per_frame': substeps / steps,
+        'us_per_disk_substep': elapsed / (substeps * count) * 1e6,
+        'collisions_per_second': gas.collisions / elapsed,
+        'energy_drift': (gas.velocities ** 2).sum() / energy - 1,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HardDiskGas collision engine")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark; scenes are rendered with manim")
+    parser.add_argument("--counts", type=int, nargs="+", default=[5000, 10000, 20000])
+    parser.add_argument("--steps", type=int, default=60, help="Timed 1/60 s frames per case")
+    parser.add_argument("--area-fraction", type=float, default=0.1)
+    parser.add_argument("--output", help="Optional JSON results file")
+    args = parser.parse_args()
+    if not args.benchmark:
+        parser.print_help()
+        return 0
+
+    # The disk radius shrinks with the count, so substeps per frame grow too;
+    # the per disk-substep cost shows the scaling of one collision pass
+    results = []
+    print(f"{'disks':>6} {'frames/s':>9} {'substeps':>9} {'us/disk-step':>13} {'collisions/s':>13} {'energy':>9}")
+    for count in args.counts:
+        record = benchmark(count, args.steps, args.area_fraction)
+        results.append(record)
+        print(f"{count:>6} {record['frames_per_second']:>9.1f} {record['substeps_per_frame']:>9.1f} "
+              f"{record['us_per_disk_substep']:>13.3f} {record['collisions_per_second']:>13.0f} "
+              f"{record['energy_drift']:>+9.1e}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"✓ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,50 @@
 from manim import *
 import numpy as np
 
+# ============ 0. PRIMITIVES - Many dots, few mobjects ============
+class ParticleField(PMobject):
+    """Dots at (x, f(x, t)) drawn as one point cloud.
+
+    f is vectorized: it takes the (N,) x array and a time and returns the
+    (N,) heights. update_field(t) writes them into the point buffer in place,
+    so a frame is one call of f however many dots there are.
+    """
+
+    def __init__(self, func, x, t=0.0, color=BLUE, stroke_width=20, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.func = func
+        self.x = np.asarray(x, dtype=float)
+        self.points = np.zeros((len(self.x), 3))
+        self.points[:, 0] = self.x
+        self.rgbas = np.tile(np.append(ManimColor(color).to_rgb(), 1.0), (len(self.x), 1))
+        self.update_field(t)
+
+    def update_field(self, t):
+        self.points[:, 1] = self.func(self.x, t)
+        return self
+
+
+class PrecomputedPath(Animation):
+    """Play a whole precomputed trajectory in one animation.
+
+    `path` is a VMobject holding every step; each frame shows it up to alpha
+    with pointwise_become_partial and moves `head` (e.g. a Dot) to its end.
+    One play means one partial movie file, however many steps the path has.
+    """
+
+    def __init__(self, path, head=None, rate_func=linear, **kwargs):
+        self.path = path
+        self.full_path = path.copy()
+        self.head = head
+        mobject = VGroup(path, head) if head is not None else path
+        super().__init__(mobject, rate_func=rate_func, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.path.pointwise_become_partial(self.full_path, 0, alpha)
+        if self.head is not None:
+            self.head.move_to(self.path.get_end())
+
+
 # ============ 1. VALUE TRACKER - Animate changing numbers ============
 class ValueTrackerExample(Scene):
     def construct(self):
@@ -89,27 +133,16 @@ class MorphingShapes(Scene):
 # ============ 4. WAVE SIMULATION ============
 class WaveSimulation(Scene):
     def construct(self):
-        # Create dots in a wave pattern
+        # Dots in a wave pattern, as one ParticleField: raising num_dots
+        # (e.g. to 2000 with a smaller spacing) leaves the frame time flat
         num_dots = 20
-        dots = VGroup()
-        
-        for i in range(num_dots):
-            dot = Dot(radius=0.1, color=BLUE)
-            dot.move_to([i * 0.5 - 4.5, 0, 0])
-            dots.add(dot)
+        x = np.arange(num_dots) * 0.5 - 4.5
         
+        # Sine wave: y = sin(x - vt)
+        dots = ParticleField(lambda x, t: 0.5 * np.sin(x - t * 2), x, color=BLUE)
         self.add(dots)
         
-        # Create updater function for wave motion
-        def wave_updater(group):
-            time = self.time
-            for i, dot in enumerate(group):
-                original_x = i * 0.5 - 4.5
-                # Sine wave: y = sin(x - vt)
-                y = 0.5 * np.sin(original_x - time * 2)
-                dot.move_to([original_x, y, 0])
-        
-        dots.add_updater(wave_updater)
+        dots.add_updater(lambda group: group.update_field(self.time))
         self.wait(5)
 
 
@@ -259,31 +292,20 @@ class RandomWalker(Scene):
     def construct(self):
         # Create a dot
         dot = Dot(color=BLUE, radius=0.1)
-        path = VMobject(stroke_color=GREEN, stroke_width=2)
         
-        # Initialize path at starting position
-        current_pos = np.array([0, 0, 0])
-        path.set_points_as_corners([current_pos])
+        # Precompute the whole random walk: 50 steps of length 0.3
+        num_steps = 50
+        angles = np.random.random(num_steps) * 2 * PI
+        steps = 0.3 * np.column_stack([np.cos(angles), np.sin(angles), np.zeros(num_steps)])
+        positions = np.zeros((num_steps + 1, 3))
+        for i, step in enumerate(steps):
+            # Clamp to screen
+            positions[i + 1] = np.clip(positions[i] + step, [-6, -3.5, 0], [6, 3.5, 0])
         
-        self.add(dot, path)
+        path = VMobject(stroke_color=GREEN, stroke_width=2)
+        path.set_points_as_corners(positions)
         
-        # Random walk animation
-        for i in range(50):
-            # Random direction
-            angle = np.random.random() * 2 * PI
-            step = np.array([0.3 * np.cos(angle), 0.3 * np.sin(angle), 0])
-            new_pos = current_pos + step
-            
-            # Clamp to screen
-            new_pos[0] = np.clip(new_pos[0], -6, 6)
-            new_pos[1] = np.clip(new_pos[1], -3.5, 3.5)
-            
-            # Add to path
-            path.add_line_to(new_pos)
-            
-            # Animate dot
-            self.play(dot.animate.move_to(new_pos), run_time=0.1)
-            
-            current_pos = new_pos
+        # One play for all steps (was 50 plays of 0.1 s each)
+        self.play(PrecomputedPath(path, head=dot, run_time=0.1 * num_steps))
         
         self.wait()
@@ -1,4 +1,5 @@
 from manim import *
+import itertools
 import numpy as np
 class Slider(MovingCameraScene):
     def construct(self):
@@ -73,6 +74,84 @@ class CurveBlade(MovingCameraScene):
         return self.base_radius + variation
 
 
+GOLDEN = (1 + np.sqrt(5)) / 2
+
+
+def _permuted_signs(base, even_only=False):
+    """All sign changes of all (even) coordinate permutations of `base`, without duplicates."""
+    base = np.asarray(base, dtype=float)
+    perms = []
+    for perm in itertools.permutations(range(4)):
+        inversions = sum(perm[a] > perm[b] for a in range(4) for b in range(a + 1, 4))
+        if not even_only or inversions % 2 == 0:
+            perms.append(base[list(perm)])
+    signs = np.array(list(itertools.product((1, -1), repeat=4)))
+    verts = (np.array(perms)[:, None, :] * signs[None, :, :]).reshape(-1, 4)
+    return np.unique(np.round(verts, 9), axis=0)
+
+
+def polytope_edges(verts):
+    """(E, 2) vertex index pairs at the shortest vertex distance (the edges of a regular polytope)."""
+    i, j = np.triu_indices(len(verts), 1)
+    d2 = ((verts[i] - verts[j]) ** 2).sum(axis=1)
+    short = d2 < d2.min() * (1 + 1e-6)
+    return np.column_stack([i[short], j[short]])
+
+
+def tesseract():
+    """(16, 4) vertices: all combinations of ±1."""
+    return np.array(list(itertools.product((-1, 1), repeat=4)), dtype=float)
+
+
+def cell_24():
+    """(24, 4) vertices: permutations of (±1, ±1, 0, 0)."""
+    return _permuted_signs([1, 1, 0, 0])
+
+
+def cell_120():
+    """(600, 4) vertices of the 120-cell (circumradius 2 * sqrt(2))."""
+    phi, root5 = GOLDEN, np.sqrt(5)
+    return np.concatenate([
+        _permuted_signs([0, 0, 2, 2]),
+        _permuted_signs([1, 1, 1, root5]),
+        _permuted_signs([phi ** -2, phi, phi, phi]),
+        _permuted_signs([1 / phi, 1 / phi, 1 / phi, phi ** 2]),
+        _permuted_signs([0, phi ** -2, 1, phi ** 2], even_only=True),
+        _permuted_signs([0, 1 / phi, phi, root5], even_only=True),
+        _permuted_signs([1 / phi, 1, phi, 2], even_only=True),
+    ])
+
+
+# Vertex builders; every polytope is scaled to the tesseract's circumradius 2
+POLYTOPES = {
+    'tesseract': tesseract,
+    '24-cell': cell_24,
+    '120-cell': cell_120,
+}
+
+
+class EdgeMesh(VMobject):
+    """All edges of a wireframe as one VMobject of straight segments.
+
+    set_edges(points, edges) writes every segment from an (E, 2) index array
+    into one point buffer, so a frame costs a few array operations however
+    many edges there are.
+    """
+
+    def __init__(self, points, edges, **kwargs):
+        super().__init__(**kwargs)
+        # Cubic (Cairo) or quadratic (OpenGL) curves: straight control points either way
+        per_curve = getattr(self, "n_points_per_curve", None) or self.n_points_per_cubic_curve
+        self._weights = np.linspace(0, 1, per_curve)[None, :, None]
+        self.set_edges(points, edges)
+
+    def set_edges(self, points, edges):
+        start = points[edges[:, 0]][:, None, :]
+        end = points[edges[:, 1]][:, None, :]
+        self.set_points((start + (end - start) * self._weights).reshape(-1, 3))
+        return self
+
+
 class Interactive4D(ThreeDScene):
     """Interactive 4D projection example (tesseract).
 
@@ -81,46 +160,32 @@ class Interactive4D(ThreeDScene):
     - Uses a simple perspective projection from 4D -> 3D along the w-axis.
     - ValueTrackers control rotations in two 4D planes and projection depth.
     - In interactive mode: self.rot_xw, self.rot_yz, self.eye are accessible.
+    - Vertices are one (V, 4) array, rotated and projected with one matmul;
+      edges are one EdgeMesh fed from an (E, 2) index array, and vertices one
+      point cloud. self.set_polytope("24-cell") or ("120-cell") swaps the shape.
     """
 
+    polytope = "tesseract"
+
     def construct(self):
         # Basic 3D axes and camera setup
         axes = ThreeDAxes()
         self.set_camera_orientation(phi=65 * DEGREES, theta=30 * DEGREES)
         self.add(axes)
 
-        # Create 4D vertices for a unit tesseract (all combinations of ±1)
-        self.verts4 = [np.array([x, y, z, w], dtype=float)
-                       for x in (-1, 1)
-                       for y in (-1, 1)
-                       for z in (-1, 1)
-                       for w in (-1, 1)]
-
-        # Build edges: vertices that differ in exactly one coordinate
-        self.edges = []
-        for i, a in enumerate(self.verts4):
-            for j, b in enumerate(self.verts4):
-                if j <= i:
-                    continue
-                if np.sum(a != b) == 1:
-                    self.edges.append((i, j))
-
-        # Initial projection
-        projected = [self.project(v) for v in self.verts4]
-
-        # Create 3D visual objects using Dot3D for better OpenGL compatibility
-        self.spheres = [Dot3D(point=p, color=BLUE, radius=0.08) for p in projected]
-        self.lines = [Line3D(start=projected[i], end=projected[j], color=WHITE)
-                      for (i, j) in self.edges]
-
-        self.group = VGroup(*self.spheres, *self.lines)
-        self.add(self.group)
-
         # ValueTrackers to control 4D rotations and projection distance
         self.rot_xw = ValueTracker(0.0)  # rotation in X-W plane
         self.rot_yz = ValueTracker(0.0)  # rotation in Y-Z plane
         self.eye = ValueTracker(4.0)     # projection distance along W
 
+        # Vertices as one point cloud, edges as one EdgeMesh
+        self.vertices = PMobject(stroke_width=8)
+        self.wire = EdgeMesh(np.zeros((2, 3)), np.array([[0, 1]]), stroke_color=WHITE, stroke_width=2)
+        self.set_polytope(self.polytope)
+
+        self.group = Group(self.wire, self.vertices)
+        self.add(self.group)
+
         # Updater rotates vertices in 4D then projects to 3D
         def updater(mob):
             theta = self.rot_xw.get_value()
@@ -143,17 +208,12 @@ class Interactive4D(ThreeDScene):
                 [0, 0, 0, 1]
             ])
 
+            # Rows are vertices, so R @ v for all of them is verts4 @ R.T
             R = R_xw @ R_yz
-            pts3 = [self.project(R @ v, eye=E) for v in self.verts4]
-
-            # update spheres
-            for i, s in enumerate(self.spheres):
-                s.move_to(pts3[i])
-
-            # update lines
-            for k, (i, j) in enumerate(self.edges):
-                self.lines[k].put_start_and_end_on(pts3[i], pts3[j])
+            pts3 = self.project(self.verts4 @ R.T, eye=E)
 
+            self.vertices.points = pts3
+            self.wire.set_edges(pts3, self.edges)
             return mob
 
         self.group.add_updater(updater)
@@ -166,17 +226,232 @@ class Interactive4D(ThreeDScene):
         )
         self.wait(0.5)
 
-        # Interactive shell: use self.rot_xw.set_value(...), self.rot_yz.set_value(...), etc.
+        # Interactive shell: use self.rot_xw.set_value(...), self.set_polytope("120-cell"), etc.
         self.interactive_embed()
 
+    def set_polytope(self, name):
+        """Show one of POLYTOPES; the updater picks up the new arrays on the next frame."""
+        verts = POLYTOPES[name]()
+        self.verts4 = verts * (2.0 / np.linalg.norm(verts[0]))
+        self.edges = polytope_edges(self.verts4)
+        pts3 = self.project(self.verts4, eye=self.eye.get_value())
+        self.vertices.points = pts3
+        self.vertices.rgbas = np.tile(np.append(ManimColor(BLUE).to_rgb(), 1.0), (len(pts3), 1))
+        self.wire.set_edges(pts3, self.edges)
+
     def project(self, v4, eye=4.0):
-        """Perspective project from 4D -> 3D using 'eye' on the w-axis."""
-        w = v4[3]
-        denom = eye - w
-        if abs(denom) < 1e-6:
-            denom = np.sign(denom) * 1e-6 if denom != 0 else 1e-6
-        factor = eye / denom
-        return np.array([v4[0] * factor, v4[1] * factor, v4[2] * factor])
+        """Perspective project from 4D -> 3D using 'eye' on the w-axis; v4 is (4,) or (V, 4)."""
+        v4 = np.asarray(v4, dtype=float)
+        denom = eye - v4[..., 3]
+        tiny = np.abs(denom) < 1e-6
+        denom = np.where(tiny, np.where(denom < 0, -1e-6, 1e-6), denom)
+        return v4[..., :3] * (eye / denom)[..., None]
+
+
+class Interactive24Cell(Interactive4D):
+    """Interactive4D with the 24-cell (24 vertices, 96 edges)."""
+
+    polytope = "24-cell"
+
+
+class Interactive120Cell(Interactive4D):
+    """Interactive4D with the 120-cell (600 vertices, 1,200 edges)."""
+
+    polytope = "120-cell"
+
+
+class ParticleEngine:
+    """Structure-of-arrays particle store for FluidSimulation3D.
+
+    Positions and velocities live in (capacity, 3) arrays; the first `count`
+    rows are live. Every update is a handful of whole-array operations, so
+    the cost grows with NumPy throughput rather than with Python loops.
+
+    With sph=True particles also interact as a smoothed-particle fluid
+    (poly6 density, spiky pressure gradient, viscosity). Neighbours come from
+    a uniform grid of cell size `smoothing`, rebuilt every step by sorting the
+    particles by cell id.
+    """
+
+    # (dx, dy) of the cell columns searched for neighbours: the particle's own
+    # column (later particles only) and four forward ones, so each pair is seen once
+    FORWARD_COLUMNS = np.array([[0, 0], [0, 1], [1, -1], [1, 0], [1, 1]])
+
+    def __init__(self, capacity=50000, box_size=3.0, seed=None):
+        self.capacity = capacity
+        self.box_size = box_size
+        self.count = 0
+
+        # SPH parameters (smoothing length in scene units)
+        self.sph = False
+        self.smoothing = 0.12
+        self.rest_density = 1000.0
+        self.stiffness = 15.0
+        self.viscosity = 0.5
+        self.substeps = 2
+        self.pair_chunk = 4096
+        self.positions = np.zeros((capacity, 3))
+        self.velocities = np.zeros((capacity, 3))
+        self.rng = np.random.default_rng(seed)
+        # Scratch for the position update and wall hits
+        self._step = np.zeros((capacity, 3))
+        self._hit = np.zeros((capacity, 3), dtype=bool)
+
+    def spawn(self, n):
+        """Spawn up to n particles at the top of the container; returns how many fit."""
+        n = max(0, min(n, self.capacity - self.count))
+        half = self.box_size / 2 - 0.2
+        new = slice(self.count, self.count + n)
+        self.positions[new, 0] = self.rng.uniform(-half * 0.5, half * 0.5, n)
+        self.positions[new, 1] = self.rng.uniform(-half * 0.5, half * 0.5, n)
+        self.positions[new, 2] = half - 0.1
+        self.velocities[new, :2] = self.rng.uniform(-0.5, 0.5, (n, 2))
+        self.velocities[new, 2] = self.rng.uniform(-1, 0, n)
+        self.count += n
+        return n
+
+    def clear(self):
+        self.count = 0
+
+    @property
+    def particle_mass(self):
+        """Mass giving the rest density at a spacing of half the smoothing length."""
+        return self.rest_density * (self.smoothing / 2) ** 3
+
+    def step(self, dt, gravity, damping, restitution=0.6):
+        """Advance all live particles by dt (in substeps when SPH is on), then damp."""
+        substeps = self.substeps if self.sph else 1
+        for _ in range(substeps):
+            self._integrate(dt / substeps, gravity, restitution)
+        self.velocities[:self.count] *= damping
+
+    def _integrate(self, dt, gravity, restitution):
+        """Gravity (along z), SPH forces, motion and wall reflection."""
+        if self.sph and self.count > 1:
+            self.velocities[:self.count] += self._sph_accelerations() * dt
+
+        n = self.count
+        pos, vel = self.positions[:n], self.velocities[:n]
+        step, hit = self._step[:n], self._hit[:n]
+        half_box = self.box_size / 2 - 0.1
+
+        vel[:, 2] += gravity * dt
+        np.multiply(vel, dt, out=step)
+        pos += step
+
+        # Walls: clamp and reflect the velocity component of every hit axis
+        np.greater(np.abs(pos), half_box, out=hit)
+        np.clip(pos, -half_box, half_box, out=pos)
+        vel[hit] *= -restitution
+
+    def _neighbour_pairs(self):
+        """Sort live particles by grid cell, then return every pair (i, j, r^2) closer than smoothing.
+
+        Cell ids run fastest along z, so the three cells of a column around a
+        particle form one contiguous range of the sorted particles: each
+        particle needs five ranges, expanded into flat pair arrays a chunk
+        of particles at a time to bound memory.
+        """
+        n = self.count
+        h = self.smoothing
+        dims = max(int(np.ceil(self.box_size / h)), 1)
+
+        cells = ((self.positions[:n] + self.box_size / 2) / h).astype(np.intp)
+        np.clip(cells, 0, dims - 1, out=cells)
+        ids = (cells[:, 0] * dims + cells[:, 1]) * dims + cells[:, 2]
+        order = np.argsort(ids, kind="stable")
+        self.positions[:n] = self.positions[order]
+        self.velocities[:n] = self.velocities[order]
+        cells = cells[order]
+        counts = np.bincount(ids, minlength=dims ** 3)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+
+        x, y, z = (np.ascontiguousarray(self.positions[:n, axis]) for axis in range(3))
+        pairs_i, pairs_j, pairs_r2 = [], [], []
+        for lo in range(0, n, self.pair_chunk):
+            hi = min(n, lo + self.pair_chunk)
+            c = cells[lo:hi]
+            cx = c[:, 0, None] + self.FORWARD_COLUMNS[:, 0]
+            cy = c[:, 1, None] + self.FORWARD_COLUMNS[:, 1]
+            valid = (cx >= 0) & (cx < dims) & (cy >= 0) & (cy < dims)
+            column = np.where(valid, cx * dims + cy, 0) * dims
+            z_lo = np.maximum(c[:, 2] - 1, 0)[:, None]
+            z_hi = np.minimum(c[:, 2] + 1, dims - 1)[:, None]
+            first = starts[column + z_lo]
+            last = ends[column + z_hi]
+            first[:, 0] = np.arange(lo + 1, hi + 1)
+
+            # Expand the ranges: i repeated, j counting through each range
+            count = np.where(valid, np.maximum(last - first, 0), 0).ravel()
+            i = np.repeat(np.arange(lo, hi), count.reshape(hi - lo, -1).sum(axis=1))
+            j = np.repeat(first.ravel() - (np.cumsum(count) - count), count) + np.arange(count.sum())
+
+            dx, dy, dz = x[i] - x[j], y[i] - y[j], z[i] - z[j]
+            r2 = dx * dx + dy * dy + dz * dz
+            close = np.flatnonzero(r2 < h * h)
+            pairs_i.append(i[close])
+            pairs_j.append(j[close])
+            pairs_r2.append(r2[close])
+        return np.concatenate(pairs_i), np.concatenate(pairs_j), np.concatenate(pairs_r2)
+
+    def _sph_accelerations(self):
+        """Pressure and viscosity accelerations of all live particles (symmetric pair forces)."""
+        i, j, r2 = self._neighbour_pairs()
+        n = self.count
+        h = self.smoothing
+        m = self.particle_mass
+        poly6 = 315 / (64 * np.pi * h ** 9)
+        spiky = 45 / (np.pi * h ** 6)
+
+        # Density (self term included) and a pressure that only pushes
+        w = m * poly6 * (h * h - r2) ** 3
+        density = m * poly6 * h ** 6 + np.bincount(i, w, n) + np.bincount(j, w, n)
+        pressure = self.stiffness * np.maximum(density - self.rest_density, 0)
+
+        r = np.sqrt(r2)
+        np.maximum(r, 1e-9, out=r)
+        inv_rho = m / (density[i] * density[j])
+        push = inv_rho * 0.5 * (pressure[i] + pressure[j]) * spiky * (h - r) ** 2 / r
+        drag = inv_rho * self.viscosity * spiky * (h - r)
+
+        pos, vel = self.positions[:n], self.velocities[:n]
+        acc = np.empty((n, 3))
+        for axis in range(3):
+            f = push * (pos[i, axis] - pos[j, axis]) + drag * (vel[j, axis] - vel[i, axis])
+            acc[:, axis] = np.bincount(i, f, n) - np.bincount(j, f, n)
+        return acc
+
+    def speeds(self):
+        return np.linalg.norm(self.velocities[:self.count], axis=1)
+
+
+class ParticleCloud(PMobject):
+    """All particles of a ParticleEngine as one point cloud.
+
+    update_from swaps in the live slice of the position buffer and recolours
+    by speed (blue = slow, red = fast), so no mobject exists per particle.
+    Works with both renderers (PMobject becomes OpenGLPMobject under OpenGL).
+    """
+
+    def __init__(self, engine, slow=BLUE, fast=RED, max_speed=5.0, stroke_width=4, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.engine = engine
+        self.slow_rgb = np.asarray(ManimColor(slow).to_rgb())
+        self.fast_rgb = np.asarray(ManimColor(fast).to_rgb())
+        self.max_speed = max_speed
+        self._rgbas = np.ones((engine.capacity, 4))
+        self.update_from()
+
+    def update_from(self):
+        n = self.engine.count
+        t = np.clip(self.engine.speeds() / self.max_speed, 0, 1)
+        rgbas = self._rgbas[:n]
+        np.multiply.outer(t, self.fast_rgb - self.slow_rgb, out=rgbas[:, :3])
+        rgbas[:, :3] += self.slow_rgb
+        self.points = self.engine.positions[:n]
+        self.rgbas = rgbas
+        return self
 
 
 class FluidSimulation3D(ThreeDScene):
@@ -186,8 +461,11 @@ class FluidSimulation3D(ThreeDScene):
 
     Features:
     - Particle-based fluid with gravity, damping, and collision
+    - Particles are (N, 3) arrays in a ParticleEngine, drawn as one ParticleCloud
     - Interactive controls: self.gravity, self.damping, self.source_rate
-    - Add particles with self.add_particles(n) in interactive mode
+    - Add particles with self.add_particles(n) in interactive mode (up to 50,000)
+    - self.set_sph(True) makes particles interact as an SPH fluid; tune it via
+      self.engine.smoothing, .stiffness, .viscosity and .substeps
     """
 
     def construct(self):
@@ -213,10 +491,9 @@ class FluidSimulation3D(ThreeDScene):
         self.source_rate = ValueTracker(5)  # particles per second
         self.dt = 0.02  # time step
 
-        # Particle storage
-        self.positions = []  # list of np.array [x, y, z]
-        self.velocities = []  # list of np.array [vx, vy, vz]
-        self.particles = VGroup()  # visual Dot3D objects
+        # Particle storage: one engine, one point cloud
+        self.engine = ParticleEngine(capacity=50000, box_size=box_size)
+        self.particles = ParticleCloud(self.engine)
         self.add(self.particles)
 
         # Initialize with some particles at top
@@ -231,42 +508,20 @@ class FluidSimulation3D(ThreeDScene):
             if dt == 0:
                 return
 
-            g = self.gravity.get_value()
-            damp = self.damping.get_value()
-            half_box = self.box_size / 2 - 0.1
-            restitution = 0.6
-
-            for i in range(len(self.positions)):
-                # Apply gravity (in z direction)
-                self.velocities[i][2] += g * self.dt
-
-                # Update position
-                self.positions[i] += self.velocities[i] * self.dt
-
-                # Collision with box walls
-                for axis in range(3):
-                    if self.positions[i][axis] < -half_box:
-                        self.positions[i][axis] = -half_box
-                        self.velocities[i][axis] *= -restitution
-                    elif self.positions[i][axis] > half_box:
-                        self.positions[i][axis] = half_box
-                        self.velocities[i][axis] *= -restitution
-
-                # Apply damping
-                self.velocities[i] *= damp
+            self.engine.step(self.dt, self.gravity.get_value(), self.damping.get_value())
 
-                # Update visual
-                if i < len(self.particles):
-                    self.particles[i].move_to(self.positions[i])
-
-            # Spawn new particles based on rate
+            # Spawn new particles based on rate (whole particles due since the last spawn)
             self.time_acc += dt
             rate = self.source_rate.get_value()
             if rate > 0:
-                spawn_interval = 1.0 / rate
-                while self.time_acc - self.last_spawn > spawn_interval and len(self.positions) < 200:
-                    self.spawn_particles(1)
-                    self.last_spawn = self.time_acc
+                due = int((self.time_acc - self.last_spawn) * rate)
+                if due:
+                    self.engine.spawn(due)
+                    self.last_spawn += due / rate
+            else:
+                self.last_spawn = self.time_acc
+
+            mob.update_from()
 
         self.particles.add_updater(physics_updater)
 
@@ -278,28 +533,8 @@ class FluidSimulation3D(ThreeDScene):
 
     def spawn_particles(self, n):
         """Spawn n particles at the top of the container."""
-        half = self.box_size / 2 - 0.2
-        for _ in range(n):
-            # Random position at top
-            x = np.random.uniform(-half * 0.5, half * 0.5)
-            y = np.random.uniform(-half * 0.5, half * 0.5)
-            z = half - 0.1
-
-            pos = np.array([x, y, z])
-            vel = np.array([
-                np.random.uniform(-0.5, 0.5),
-                np.random.uniform(-0.5, 0.5),
-                np.random.uniform(-1, 0)
-            ])
-
-            self.positions.append(pos)
-            self.velocities.append(vel)
-
-            # Color based on velocity magnitude (blue = slow, red = fast)
-            speed = np.linalg.norm(vel)
-            color = interpolate_color(BLUE, RED, min(speed / 5, 1))
-            particle = Dot3D(point=pos, radius=0.08, color=color)
-            self.particles.add(particle)
+        self.engine.spawn(n)
+        self.particles.update_from()
 
     def add_particles(self, n=10):
         """Add n particles - call this in interactive mode."""
@@ -307,9 +542,7 @@ class FluidSimulation3D(ThreeDScene):
 
     def reset_particles(self):
         """Clear all particles and start fresh."""
-        self.positions.clear()
-        self.velocities.clear()
-        self.particles.submobjects.clear()
+        self.engine.clear()
         self.spawn_particles(40)
 
     def set_gravity(self, g):
@@ -319,3 +552,7 @@ class FluidSimulation3D(ThreeDScene):
     def set_damping(self, d):
         """Set damping (0-1, lower = more energy loss)."""
         self.damping.set_value(d)
+
+    def set_sph(self, enabled=True):
+        """Switch particle-particle SPH forces on or off."""
+        self.engine.sph = enabled
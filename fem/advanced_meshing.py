@@ -1,30 +1,54 @@
 """
 Advanced Meshing Implementation - Best Practices
-Includes: Delaunay triangulation, boundary layers, quality metrics
+Includes: Delaunay triangulation, quality-driven refinement, boundary layers, quality metrics
 """
 
+import inspect
+
 from manim import *
 import numpy as np
 from scipy.spatial import Delaunay as ScipyDelaunay
 from scipy.spatial import ConvexHull
+from scipy.spatial import cKDTree
+
+from boundary_layer import extrude_boundary_layers
+from boundary_sampling import ArcLengthBoundary
+from mesh_cache import load_cached_mesh, mesh_cache_key, store_cached_mesh
+from mesh_geometry import points_in_polygon, triangle_angles, triangle_areas, triangle_edge_lengths
+from mesh_refinement import recover_segments, refine_delaunay
+from mesh_smoothing import SmoothableMesh
 
 
-class AdvancedFiniteElement(VGroup):
+class AdvancedFiniteElement(SmoothableMesh, VGroup):
     """
     Advanced finite element mesh generator with multiple algorithms.
     
     Implements:
     - Delaunay triangulation (optimal quality)
+    - Delaunay refinement (guaranteed minimum angle, recovered boundary)
     - Boundary layer meshing (for CFD/gradient capture)
     - Quality metric calculation and visualization
     - Adaptive mesh refinement
+    - Laplacian / angle-based smoothing
+    - Cached meshes (content-addressed .npz) so re-renders skip generation
     """
     
+    # Editing any of these invalidates cached meshes
+    generator_sources = (
+        __file__,
+        inspect.getfile(refine_delaunay),
+        inspect.getfile(triangle_angles),
+        inspect.getfile(ArcLengthBoundary),
+        inspect.getfile(extrude_boundary_layers),
+    )
+    
     def __init__(
         self,
         base_domain=None,
-        mesh_algorithm="delaunay",  # "delaunay", "boundary_layer", "hybrid"
+        mesh_algorithm="delaunay",  # "delaunay", "refined", "boundary_layer", "hybrid"
         target_element_size=0.3,
+        size_function=None,  # f(x, y) -> local element size (refined only)
+        min_angle=25.0,  # Minimum angle in degrees (refined only)
         boundary_layers=None,  # Number of boundary layers
         boundary_layer_growth=1.2,  # Growth rate for boundary layers
         show_domain=True,
@@ -32,6 +56,8 @@ class AdvancedFiniteElement(VGroup):
         domain_color=RED,
         mesh_opacity=0.3,
         stroke_width=1.5,
+        seed=42,
+        use_cache=True,
         **kwargs
     ):
         """
@@ -41,14 +67,24 @@ class AdvancedFiniteElement(VGroup):
         -----------
         mesh_algorithm : str
             "delaunay" - Delaunay triangulation (best quality)
+            "refined" - Delaunay refinement to min_angle and element size
             "boundary_layer" - Structured layers near boundary
             "hybrid" - Boundary layers + Delaunay interior
         target_element_size : float
             Approximate size of mesh elements
+        size_function : callable or None
+            Vectorized f(x, y) giving the local target size ("refined" only)
+        min_angle : float
+            Minimum triangle angle in degrees ("refined" only, keep below ~30)
         boundary_layers : int or None
             Number of layers near boundary (for boundary_layer/hybrid)
         boundary_layer_growth : float
             Growth rate for boundary layer thickness
+        seed : int
+            Seed for the interior point jitter (meshes are reproducible)
+        use_cache : bool
+            Load the mesh from the on-disk cache if this domain and these
+            parameters were meshed before (disabled with a size_function)
         """
         super().__init__(**kwargs)
         
@@ -63,10 +99,23 @@ class AdvancedFiniteElement(VGroup):
         self.mesh_algorithm = mesh_algorithm
         self.boundary_layers = boundary_layers
         self.boundary_layer_growth = boundary_layer_growth
-        
-        # Generate mesh based on algorithm
-        if mesh_algorithm == "delaunay":
+        self.size_function = size_function
+        self.min_angle = min_angle
+        self.refinement_history = []
+        self.refinement_stats = None
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        
+        # Reuse a cached mesh when this domain was meshed with these parameters
+        cache_key = self._cache_key() if use_cache else None
+        cached = load_cached_mesh(cache_key) if cache_key is not None else None
+        
+        if cached is not None:
+            elements = self._restore_cached_mesh(cached)
+        elif mesh_algorithm == "delaunay":
             elements, self.nodes = self._generate_delaunay_mesh()
+        elif mesh_algorithm == "refined":
+            elements, self.nodes = self._generate_refined_mesh()
         elif mesh_algorithm == "boundary_layer":
             elements, self.nodes = self._generate_boundary_layer_mesh()
         elif mesh_algorithm == "hybrid":
@@ -89,26 +138,84 @@ class AdvancedFiniteElement(VGroup):
             self.add(boundary)
         
         self.mesh_elements = elements
+        
+        if cache_key is not None and cached is None:
+            self._store_cached_mesh(cache_key)
+    
+    def _cache_key(self):
+        """Content hash of the domain outline and mesh parameters (None if uncacheable)."""
+        if self.size_function is not None:
+            return None  # Arbitrary callables cannot be hashed reliably
+        params = {
+            'class': type(self).__name__,
+            'algorithm': self.mesh_algorithm,
+            'target_size': self.target_size,
+            'min_angle': self.min_angle,
+            'boundary_layers': self.boundary_layers,
+            'boundary_layer_growth': self.boundary_layer_growth,
+            'seed': self.seed,
+        }
+        outline = self.base_domain.complex_domain.get_all_points()
+        return mesh_cache_key(outline, params, self.generator_sources)
+    
+    def _store_cached_mesh(self, cache_key):
+        """Write the freshly generated mesh to the cache."""
+        extras = {}
+        meta = {'algorithm': self.mesh_algorithm}
+        if self.mesh_algorithm == "refined":
+            nodes, connectivity = self.nodes, self.triangles
+            num_points = [n for n, _ in self.refinement_history]
+            stage_triangles = [tris for _, tris in self.refinement_history]
+            extras = {
+                'segments': self.boundary_segments,
+                'history_num_points': np.array(num_points),
+                'history_offsets': np.cumsum([0] + [len(t) for t in stage_triangles]),
+                'history_triangles': np.vstack(stage_triangles).astype(np.int32),
+            }
+            meta['refinement_stats'] = self.refinement_stats
+        elif self.mesh_algorithm in ("boundary_layer", "hybrid"):
+            nodes, connectivity = self.nodes, self.connectivity
+            extras = {'num_quads': np.array(len(self.layer_quads))}
+        else:
+            nodes, connectivity = self.get_mesh_arrays()
+        
+        quality = self.calculate_quality_metrics()['quality_scores']
+        store_cached_mesh(cache_key, nodes, connectivity, quality=quality, extras=extras, meta=meta)
+    
+    def _restore_cached_mesh(self, cached):
+        """Rebuild elements (and refinement data) from a cache entry."""
+        nodes = cached['nodes']
+        connectivity = cached['connectivity']
+        self.nodes = nodes
+        
+        if self.mesh_algorithm == "refined":
+            extras = cached['extras']
+            self.triangles = connectivity
+            self.boundary_segments = extras['segments']
+            offsets = extras['history_offsets']
+            self.refinement_history = [
+                (int(n), extras['history_triangles'][offsets[k]:offsets[k + 1]])
+                for k, n in enumerate(extras['history_num_points'])
+            ]
+            self.refinement_stats = cached['meta'].get('refinement_stats')
+        elif self.mesh_algorithm in ("boundary_layer", "hybrid"):
+            num_quads = int(cached['extras']['num_quads'])
+            self.layer_quads = np.array(connectivity[:num_quads])
+            self.triangles = np.array(connectivity[num_quads:])
+            self.connectivity = list(connectivity)
+        
+        corners = np.column_stack([nodes, np.zeros(len(nodes))])
+        return [Polygon(*corners[elem]) for elem in connectivity]
     
     def _sample_boundary(self, target_spacing=None):
-        """Sample points uniformly along the boundary."""
+        """Sample points evenly spaced in arc length along the boundary."""
         if target_spacing is None:
             target_spacing = self.target_size
         
-        boundary_curve = self.base_domain.complex_domain
-        all_points = boundary_curve.get_all_points()
-        
-        # Calculate total perimeter
-        perimeter = 0
-        for i in range(len(all_points) - 1):
-            perimeter += np.linalg.norm(all_points[i+1] - all_points[i])
-        
-        # Number of boundary points
-        n_boundary = max(int(perimeter / target_spacing), 20)
-        
-        # Uniformly sample
-        indices = np.linspace(0, len(all_points) - 1, n_boundary, dtype=int)
-        return all_points[indices]
+        sampler = self.base_domain.get_arc_length_boundary()
+        n_boundary = max(int(round(sampler.perimeter / target_spacing)), 20)
+        points, _, _ = self.base_domain.sample_boundary(count=n_boundary)
+        return points
     
     def _get_domain_center(self):
         """Get centroid of domain."""
@@ -157,8 +264,8 @@ class AdvancedFiniteElement(VGroup):
         
         for i in range(n_x):
             for j in range(n_y):
-                x = min_x + i * spacing + np.random.uniform(-0.2, 0.2) * spacing
-                y = min_y + j * spacing + np.random.uniform(-0.2, 0.2) * spacing
+                x = min_x + i * spacing + self.rng.uniform(-0.2, 0.2) * spacing
+                y = min_y + j * spacing + self.rng.uniform(-0.2, 0.2) * spacing
                 point = np.array([x, y, 0])
                 
                 # Check if inside domain
@@ -210,181 +317,196 @@ class AdvancedFiniteElement(VGroup):
         
         return elements, nodes
     
-    def _generate_boundary_layer_mesh(self):
+    def _generate_refined_mesh(self):
         """
-        Generate structured boundary layer mesh.
+        Generate mesh by quality-driven Delaunay refinement (Ruppert/Chew).
         
-        Critical for CFD and problems with boundary gradients:
-        - Controlled element height near boundary
-        - High aspect ratio elements (stretched)
-        - Smooth transition to interior
+        Starts from the boundary samples only and inserts circumcentres of
+        bad or oversized triangles until every angle is >= min_angle:
+        - Boundary edges are recovered by splitting encroached segments
+        - Points are added to the triangulation incrementally
+        - Every pass is kept in refinement_history for playback
+        """
+        boundary_points = self._sample_boundary(self.target_size)
+        
+        result = refine_delaunay(
+            boundary_points,
+            target_size=self.target_size,
+            size_function=self.size_function,
+            min_angle=self.min_angle,
+        )
+        
+        nodes = result['nodes']
+        self.triangles = result['triangles']
+        self.boundary_segments = result['segments']
+        self.refinement_history = result['history']
+        self.refinement_stats = result['stats']
+        
+        corners = np.zeros((len(self.triangles), 3, 3))
+        corners[:, :, :2] = nodes[self.triangles]
+        elements = [Polygon(*tri_corners) for tri_corners in corners]
+        
+        return elements, nodes
+    
+    def _extrude_layers(self):
+        """
+        Extrude the structured boundary layers.
+        
+        Returns layer nodes (L + 1, n, 2) and quad connectivity (L * n, 4).
         """
         if self.boundary_layers is None:
             self.boundary_layers = 3
         
         boundary_points = self._sample_boundary(self.target_size)
-        n_boundary = len(boundary_points)
         
-        elements = []
-        all_nodes = []
+        # Initial layer height 0.3 * target size, growing geometrically inward
+        heights = self.target_size * 0.3 * self.boundary_layer_growth ** np.arange(self.boundary_layers)
+        layers, quads, self.layer_scale = extrude_boundary_layers(boundary_points, heights)
+        return layers, quads
+    
+    def _layers_to_elements(self, nodes, quads, triangles):
+        """
+        Build quad + triangle Polygons and record the shared connectivity.
         
-        # Compute inward normals at each boundary point
-        normals = []
-        for i in range(n_boundary):
-            prev_pt = boundary_points[(i - 1) % n_boundary]
-            next_pt = boundary_points[(i + 1) % n_boundary]
-            
-            # Tangent vector
-            tangent = next_pt - prev_pt
-            tangent = tangent / np.linalg.norm(tangent)
-            
-            # Inward normal (rotate tangent 90 degrees)
-            normal = np.array([-tangent[1], tangent[0], 0])
-            
-            # Check if normal points inward
-            center = self._get_domain_center()
-            to_center = center - boundary_points[i]
-            if np.dot(normal[:2], to_center[:2]) < 0:
-                normal = -normal
-            
-            normals.append(normal)
-        
-        # Create layers
-        layer_heights = []
-        h = self.target_size * 0.3  # Initial layer height
-        for layer in range(self.boundary_layers):
-            layer_heights.append(h)
-            h *= self.boundary_layer_growth
-        
-        # Generate layer points
-        layer_points = [boundary_points]
-        for layer_h in layer_heights:
-            new_layer = []
-            for i, pt in enumerate(layer_points[-1]):
-                new_pt = pt + normals[i] * layer_h
-                new_layer.append(new_pt)
-            layer_points.append(np.array(new_layer))
-        
-        # Create quad elements in layers
-        for layer in range(len(layer_points) - 1):
-            for i in range(n_boundary):
-                i_next = (i + 1) % n_boundary
-                
-                v1 = layer_points[layer][i]
-                v2 = layer_points[layer][i_next]
-                v3 = layer_points[layer + 1][i_next]
-                v4 = layer_points[layer + 1][i]
-                
-                # Create two triangles from quad
-                tri1 = Polygon(v1, v2, v3)
-                tri2 = Polygon(v1, v3, v4)
-                
-                elements.append(tri1)
-                elements.append(tri2)
-        
-        # Fill interior with Delaunay
-        interior_boundary = layer_points[-1]
-        interior_points = self._generate_interior_points(
-            interior_boundary, 
-            self.target_size * 1.5
-        )
+        Raises RuntimeError unless the mesh conforms: its boundary edges must
+        be exactly the outline edges (layer 0), so every ring edge is shared by
+        a quad and a triangle and nothing overlaps or leaves a gap.
+        """
+        n = len(quads) // self.boundary_layers
+        i = np.arange(n)
+        outline = np.sort(np.column_stack([i, (i + 1) % n]), axis=1)
+        edges = np.vstack([np.column_stack([q, np.roll(q, -1, axis=1)]).reshape(-1, 2)
+                           for q in (quads, triangles)])
+        edges = np.sort(edges, axis=1)
+        unique, counts = np.unique(edges, axis=0, return_counts=True)
+        single = unique[counts == 1]
+        if len(single) != n or not np.array_equal(single, np.unique(outline, axis=0)) or counts.max() > 2:
+            raise RuntimeError(
+                f"Boundary layer mesh does not conform: {len(single)} boundary edges for a {n}-edge outline"
+            )
         
-        if len(interior_points) > 3:
-            all_interior = np.vstack([interior_boundary[:, :2], interior_points])
-            tri = ScipyDelaunay(all_interior)
-            
-            for simplex in tri.simplices:
-                v1 = np.array([all_interior[simplex[0], 0], all_interior[simplex[0], 1], 0])
-                v2 = np.array([all_interior[simplex[1], 0], all_interior[simplex[1], 1], 0])
-                v3 = np.array([all_interior[simplex[2], 0], all_interior[simplex[2], 1], 0])
-                
-                centroid = (v1 + v2 + v3) / 3
-                if self._point_in_polygon(centroid, boundary_points):
-                    triangle = Polygon(v1, v2, v3)
-                    elements.append(triangle)
+        self.layer_quads = quads
+        self.triangles = triangles
+        self.connectivity = list(quads) + list(triangles)
         
-        # Collect all nodes
-        for layer in layer_points:
-            all_nodes.extend(layer[:, :2])
-        if len(interior_points) > 0:
-            all_nodes.extend(interior_points)
+        corners = np.column_stack([nodes, np.zeros(len(nodes))])
+        elements = [Polygon(*quad_corners) for quad_corners in corners[quads]]
+        elements += [Polygon(*tri_corners) for tri_corners in corners[triangles]]
+        return elements
+    
+    def _generate_boundary_layer_mesh(self):
+        """
+        Generate structured boundary layer mesh.
         
-        nodes = np.array(all_nodes)
+        Critical for CFD and problems with boundary gradients:
+        - Controlled element height near boundary
+        - High aspect ratio elements (stretched)
+        - Smooth transition to interior
         
-        return elements, nodes
+        The region inside the last layer is filled with a Delaunay
+        triangulation of its ring and a coarse point cloud; ring edges the
+        triangulation misses are recovered by edge flips, so the triangles
+        meet the quads edge to edge.
+        """
+        layers, quads = self._extrude_layers()
+        layer_nodes = layers.reshape(-1, 2)
+        ring = layers[-1]
+        ring_offset = len(layer_nodes) - len(ring)
+        
+        # Fill interior with Delaunay; points too close to the ring would cut its edges
+        spacing = self.target_size * 1.5
+        interior_points = self._generate_interior_points(ring, spacing)
+        if len(interior_points):
+            dist, _ = cKDTree(ring).query(interior_points)
+            interior_points = interior_points[dist > 0.5 * spacing]
+        
+        interior = np.vstack([ring, interior_points.reshape(-1, 2)])
+        ring_ids = np.arange(len(ring))
+        ring_segments = np.column_stack([ring_ids, (ring_ids + 1) % len(ring)])
+        simplices = recover_segments(interior, ScipyDelaunay(interior).simplices, ring_segments)
+        simplices = simplices[points_in_polygon(interior[simplices].mean(axis=1), ring)]
+        
+        # Ring nodes are the last layer; interior points follow the layers
+        local_to_global = np.concatenate([
+            ring_offset + np.arange(len(ring)),
+            len(layer_nodes) + np.arange(len(interior_points)),
+        ])
+        nodes = np.vstack([layer_nodes, interior_points.reshape(-1, 2)])
+        triangles = local_to_global[simplices]
+        
+        return self._layers_to_elements(nodes, quads, triangles), nodes
     
     def _generate_hybrid_mesh(self):
-        """Boundary layers + Delaunay interior (BEST for CFD)."""
-        return self._generate_boundary_layer_mesh()
+        """
+        Boundary layers + Delaunay interior (BEST for CFD).
+        
+        The interior is a quality Delaunay refinement of the innermost layer
+        ring with its nodes held fixed and its edges recovered by flips, so
+        triangles share the ring nodes and edges of the quads exactly
+        (conforming, no hanging nodes; checked when the elements are built).
+        """
+        layers, quads = self._extrude_layers()
+        layer_nodes = layers.reshape(-1, 2)
+        ring = layers[-1]
+        ring_offset = len(layer_nodes) - len(ring)
+        
+        result = refine_delaunay(
+            ring,
+            target_size=self.target_size,
+            min_angle=self.min_angle,
+            split_boundary=False,
+        )
+        self.refinement_stats = result['stats']
+        
+        # Match refinement nodes back onto the ring (duplicates may have been dropped)
+        interior_nodes = result['nodes']
+        dist, nearest = cKDTree(ring).query(interior_nodes)
+        on_ring = dist < 1e-9
+        local_to_global = np.empty(len(interior_nodes), dtype=int)
+        local_to_global[on_ring] = ring_offset + nearest[on_ring]
+        local_to_global[~on_ring] = len(layer_nodes) + np.arange(np.count_nonzero(~on_ring))
+        
+        nodes = np.vstack([layer_nodes, interior_nodes[~on_ring]])
+        triangles = local_to_global[result['triangles']]
+        
+        return self._layers_to_elements(nodes, quads, triangles), nodes
     
     def calculate_quality_metrics(self):
         """
         Calculate quality metrics for all elements.
         
         Returns dictionary with:
-        - aspect_ratios: list of aspect ratios
-        - min_angles: list of minimum angles (degrees)
-        - areas: list of element areas
+        - aspect_ratios: array of aspect ratios
+        - min_angles: array of minimum angles (degrees)
+        - areas: array of element areas
         - quality_scores: 0-1 score (1 = perfect)
         """
+        corners = [elem.get_vertices()[:3] for elem in self.mesh_elements]
+        corners = np.array([c for c in corners if len(c) == 3]).reshape(-1, 3, 3)
+        triangles = np.arange(len(corners) * 3).reshape(-1, 3)
+        points = corners.reshape(-1, 3)
+        
+        # Edge lengths and angles for the first 3 vertices of every element
+        edges = triangle_edge_lengths(points, triangles)
+        longest = edges.max(axis=1)
+        shortest = edges.min(axis=1)
+        aspect_ratios = np.full(len(edges), 100.0)
+        np.divide(longest, shortest, out=aspect_ratios, where=shortest > 1e-10)
+        
+        min_angles = triangle_angles(points, triangles).min(axis=1)
+        areas = triangle_areas(points, triangles)
+        
+        # Quality score (0-1, higher is better): mean of angle quality
+        # (equilateral = 60°) and aspect quality (equilateral = 1.0)
+        quality_scores = np.clip((min_angles / 60.0 + 1.0 / aspect_ratios) / 2, 0, 1)
+        
         metrics = {
-            'aspect_ratios': [],
-            'min_angles': [],
-            'areas': [],
-            'quality_scores': []
+            'aspect_ratios': aspect_ratios,
+            'min_angles': min_angles,
+            'areas': areas,
+            'quality_scores': quality_scores,
         }
         
-        for elem in self.mesh_elements:
-            vertices = elem.get_vertices()
-            
-            if len(vertices) < 3:
-                continue
-            
-            # Take first 3 vertices for triangle
-            v1, v2, v3 = vertices[0], vertices[1], vertices[2]
-            
-            # Edge lengths
-            e1 = np.linalg.norm(v2 - v1)
-            e2 = np.linalg.norm(v3 - v2)
-            e3 = np.linalg.norm(v1 - v3)
-            
-            # Aspect ratio
-            longest = max(e1, e2, e3)
-            shortest = min(e1, e2, e3)
-            aspect_ratio = longest / shortest if shortest > 1e-10 else 100
-            
-            # Angles (using law of cosines)
-            def angle(a, b, c):
-                """Angle opposite to side a."""
-                cos_angle = (b**2 + c**2 - a**2) / (2 * b * c)
-                cos_angle = np.clip(cos_angle, -1, 1)
-                return np.arccos(cos_angle) * 180 / np.pi
-            
-            angle1 = angle(e1, e2, e3)
-            angle2 = angle(e2, e3, e1)
-            angle3 = angle(e3, e1, e2)
-            min_angle = min(angle1, angle2, angle3)
-            
-            # Area
-            area = 0.5 * abs(
-                (v2[0] - v1[0]) * (v3[1] - v1[1]) - 
-                (v3[0] - v1[0]) * (v2[1] - v1[1])
-            )
-            
-            # Quality score (0-1, higher is better)
-            # Based on minimum angle (equilateral = 60°)
-            angle_quality = min_angle / 60.0
-            # Based on aspect ratio (equilateral = 1.0)
-            aspect_quality = 1.0 / aspect_ratio
-            
-            quality = (angle_quality + aspect_quality) / 2
-            quality = np.clip(quality, 0, 1)
-            
-            metrics['aspect_ratios'].append(aspect_ratio)
-            metrics['min_angles'].append(min_angle)
-            metrics['areas'].append(area)
-            metrics['quality_scores'].append(quality)
-        
         return metrics
     
     def color_by_quality(self, metric="quality", color_range=[RED, GREEN]):
@@ -449,6 +571,63 @@ class AdvancedFiniteElement(VGroup):
         }
         
         return stats
+    
+    def _current_node_transform(self):
+        """
+        Affine map (3x3) from generated node coordinates to the current frame.
+        
+        Recovered from the first element, so it follows any scale/shift/rotate
+        applied to the mesh after construction.
+        """
+        original = np.column_stack([self.nodes[self.triangles[0]], np.ones(3)])
+        current = self.mesh_elements[0].get_vertices()[:3]
+        return np.linalg.solve(original, current)
+    
+    def _triangles_to_vmobject(self, nodes, triangles, transform):
+        """Single VMobject holding every triangle outline as straight cubic segments."""
+        corners = np.column_stack([nodes[:, :2], np.ones(len(nodes))]) @ transform
+        starts = corners[triangles]  # (T, 3, 3)
+        ends = np.roll(starts, -1, axis=1)
+        weights = np.linspace(0, 1, 4)[None, None, :, None]
+        points = starts[:, :, None, :] * (1 - weights) + ends[:, :, None, :] * weights
+        
+        stage = VMobject()
+        stage.set_points(points.reshape(-1, 3))
+        return stage
+    
+    def get_refinement_animation(self, run_time=3):
+        """
+        Play back the Delaunay refinement passes, ending on the final mesh.
+        
+        Only available for mesh_algorithm="refined". Every pass is drawn from
+        the stored node/triangle arrays, so no mesh is regenerated.
+        
+        Returns:
+        --------
+        Animation : Manim animation acting on this mesh
+        """
+        if not self.refinement_history:
+            raise ValueError("Refinement animation requires mesh_algorithm='refined'")
+        
+        transform = self._current_node_transform()
+        template = self.mesh_elements[0]
+        
+        stages = []
+        for num_points, triangles in self.refinement_history[:-1]:
+            stage = self._triangles_to_vmobject(self.nodes[:num_points], triangles, transform)
+            stage.set_fill(template.get_fill_color(), opacity=template.get_fill_opacity())
+            stage.set_stroke(template.get_stroke_color(), width=template.get_stroke_width())
+            stages.append(stage)
+        
+        final_submobjects = list(self.submobjects)
+        domain_outline = final_submobjects[len(self.mesh_elements):]
+        frames = [[stage] + domain_outline for stage in stages] + [final_submobjects]
+        
+        def show_pass(mesh, alpha):
+            k = min(int(alpha * len(frames)), len(frames) - 1)
+            mesh.submobjects = list(frames[k])
+        
+        return UpdateFromAlphaFunc(self, show_pass, run_time=run_time, rate_func=linear)
 
 
 # Continue in next file...
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Vectorized boundary-layer extrusion
+Inward normals from the outline orientation, offset clipping where neighbouring
+rays converge or the opposite wall is close, quad connectivity as arrays,
+local shrinking until every quad is convex and the inner ring does not cross itself
+"""
+
+import numpy as np
+
+from structured_mesh import quad_corner_jacobians
+
+
+def polygon_signed_area(points):
+    """Shoelace area of a closed outline; positive when counter-clockwise."""
+    p = np.asarray(points, dtype=float)[:, :2]
+    q = np.roll(p, -1, axis=0)
+    return 0.5 * np.sum(p[:, 0] * q[:, 1] - q[:, 0] * p[:, 1])
+
+
+def inward_normals(points, smoothing=2):
+    """
+    Unit inward vertex normals of a counter-clockwise outline.
+
+    Each vertex normal is the normalized sum of its two edge normals; a few
+    passes of neighbour averaging spread the fan at sharp corners so rays from
+    adjacent vertices do not cross immediately. A smoothed normal that no
+    longer points to the left of both of its edges (it would fold the quads
+    there however thin they are) falls back to the plain bisector.
+    """
+    p = np.asarray(points, dtype=float)[:, :2]
+    edges = np.roll(p, -1, axis=0) - p
+    edges /= np.maximum(np.linalg.norm(edges, axis=1), 1e-12)[:, None]
+    # Left of the direction of travel is inside for a CCW outline
+    edge_normals = np.column_stack([-edges[:, 1], edges[:, 0]])
+    incoming_normals = np.roll(edge_normals, 1, axis=0)
+    bisectors = edge_normals + incoming_normals
+    bisectors /= np.maximum(np.linalg.norm(bisectors, axis=1), 1e-12)[:, None]
+
+    normals = bisectors
+    for _ in range(smoothing):
+        normals = 0.5 * normals + 0.25 * (np.roll(normals, 1, axis=0) + np.roll(normals, -1, axis=0))
+        normals /= np.maximum(np.linalg.norm(normals, axis=1), 1e-12)[:, None]
+
+    limit = 0.5 * np.einsum("pd,pd->p", bisectors, edge_normals)
+    inside = (np.einsum("pd,pd->p", normals, edge_normals) > limit) & \
+             (np.einsum("pd,pd->p", normals, incoming_normals) > limit)
+    return np.where(inside[:, None], normals, bisectors)
+
+
+def _neighbour_crossing(points, normals):
+    """
+    Distance along each ray to where it meets its neighbours' rays.
+
+    Returns (n,) distances; inf where neighbouring rays diverge.
+    """
+    limit = np.full(len(points), np.inf)
+    for shift in (-1, 1):
+        q, m = np.roll(points, shift, axis=0), np.roll(normals, shift, axis=0)
+        d = q - points
+        denom = normals[:, 0] * m[:, 1] - normals[:, 1] * m[:, 0]
+        safe = np.abs(denom) > 1e-12
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (d[:, 0] * m[:, 1] - d[:, 1] * m[:, 0]) / denom
+            s = (d[:, 0] * normals[:, 1] - d[:, 1] * normals[:, 0]) / denom
+        converging = safe & (t > 0) & (s > 0)
+        limit = np.where(converging, np.minimum(limit, t), limit)
+    return limit
+
+
+def _wall_distance(points, normals, chunk_size=1 << 20):
+    """Distance along each inward ray to the first outline edge it hits."""
+    a = points
+    b = np.roll(points, -1, axis=0)
+    e = b - a
+    n = len(points)
+    hit = np.full(n, np.inf)
+    rows = max(1, chunk_size // n)
+    for start in range(0, n, rows):
+        o = points[start:start + rows, None, :]
+        r = normals[start:start + rows, None, :]
+        w = a[None] - o
+        denom = r[..., 0] * e[None, :, 1] - r[..., 1] * e[None, :, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (w[..., 0] * e[None, :, 1] - w[..., 1] * e[None, :, 0]) / denom
+            u = (w[..., 0] * r[..., 1] - w[..., 1] * r[..., 0]) / denom
+        valid = (np.abs(denom) > 1e-12) & (u >= 0) & (u <= 1) & (t > 1e-9)
+        # Skip the two edges that start or end at the ray's own vertex
+        idx = np.arange(start, min(start + rows, n))
+        valid[np.arange(len(idx)), idx] = False
+        valid[np.arange(len(idx)), (idx - 1) % n] = False
+        hit[idx] = np.where(valid, t, np.inf).min(axis=1)
+    return hit
+
+
+def crossing_edges(ring, chunk_size=1 << 20):
+    """
+    Edges of a closed polyline that properly cross another, non-adjacent edge.
+
+    Returns:
+    --------
+    crossed : bool array (n,), entry i for the edge from point i to point i + 1
+    """
+    a = np.asarray(ring, dtype=float)[:, :2]
+    b = np.roll(a, -1, axis=0)
+    n = len(a)
+
+    def orient(p, q, r):
+        return (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1]) - (q[..., 1] - p[..., 1]) * (r[..., 0] - p[..., 0])
+
+    crossed = np.zeros(n, dtype=bool)
+    rows = max(1, chunk_size // max(n, 1))
+    for start in range(0, n, rows):
+        p, q = a[start:start + rows, None], b[start:start + rows, None]
+        hits = (orient(p, q, a[None]) * orient(p, q, b[None]) < 0) & \
+               (orient(a[None], b[None], p) * orient(a[None], b[None], q) < 0)
+        crossed[start:start + rows] = hits.any(axis=1)
+    return crossed
+
+
+def extrude_boundary_layers(boundary_points, heights, smoothing=2, neighbour_fraction=0.8,
+                            wall_fraction=0.4, max_jump=0.25, shrink=0.7, max_shrink_passes=60):
+    """
+    Extrude structured layers inward from a closed outline.
+
+    Parameters:
+    -----------
+    boundary_points : array (n, 2) or (n, 3)
+        Closed outline in order (either orientation, not repeated at the end)
+    heights : array (L,)
+        Thickness of each layer, from the wall inward
+    smoothing : int
+        Neighbour-averaging passes applied to the normals
+    neighbour_fraction : float
+        Total thickness is kept below this fraction of the distance at which
+        a ray meets its neighbours' rays (concave corners)
+    wall_fraction : float
+        ... and below this fraction of the distance to the opposite wall
+    max_jump : float
+        Largest change of the thickness scale between neighbouring vertices
+    shrink : float
+        Factor applied to the thickness at both ends of a column of quads
+        that is not convex or whose inner edge crosses the rest of the
+        innermost ring; repeated until neither happens
+    max_shrink_passes : int
+        Safety limit on those passes (RuntimeError when exceeded)
+
+    Returns:
+    --------
+    layers : (L + 1, n, 2) node positions, layer 0 = outline (counter-clockwise)
+    quads : (L * n, 4) convex counter-clockwise quads indexing
+        layers.reshape(-1, 2); together they tile the region between the
+        outline and the innermost ring (a simple polygon) without overlaps
+    scale : (n,) fraction of the requested thickness kept at each vertex
+    """
+    points = np.asarray(boundary_points, dtype=float)[:, :2]
+    if polygon_signed_area(points) < 0:
+        points = points[::-1]
+    n = len(points)
+    heights = np.asarray(heights, dtype=float)
+    offsets = np.concatenate([[0.0], np.cumsum(heights)])
+    total = offsets[-1]
+
+    normals = inward_normals(points, smoothing)
+    limit = np.minimum(
+        neighbour_fraction * _neighbour_crossing(points, normals),
+        wall_fraction * _wall_distance(points, normals),
+    )
+    scale = np.minimum(1.0, limit / total) if total > 0 else np.ones(n)
+
+    i = np.arange(n)
+    i_next = (i + 1) % n
+    base = (np.arange(len(heights)) * n)[:, None]
+    quads = np.stack([base + i, base + i_next, base + n + i_next, base + n + i], axis=-1).reshape(-1, 4)
+
+    for _ in range(max_shrink_passes):
+        # Keep the layers graded: a clipped vertex pulls its neighbours down gently
+        for _ in range(int(np.ceil(1.0 / max_jump))):
+            neighbours = np.minimum(np.roll(scale, 1), np.roll(scale, -1))
+            scale = np.minimum(scale, neighbours + max_jump)
+
+        layers = points[None] + (offsets[:, None] * scale[None])[..., None] * normals[None]
+
+        # Convex quads and a simple inner ring: the layers cannot overlap
+        concave = (quad_corner_jacobians(layers.reshape(-1, 2), quads) <= 0).any(axis=1)
+        bad = concave.reshape(len(heights), n).any(axis=0) | crossing_edges(layers[-1])
+        if not bad.any():
+            return layers, quads, scale
+        scale[bad] *= shrink
+        scale[i_next[bad]] *= shrink
+
+    raise RuntimeError(f"Boundary layers still overlap after {max_shrink_passes} shrinking passes")
@@ -1,6 +1,16 @@
 from manim import *
+import inspect
+import warnings
 import numpy as np
 
+import fem_solver
+import mesh_morph
+import structured_mesh
+from boundary_sampling import ArcLengthBoundary
+from hex_mesh import hexagonal_tiling
+from mesh_cache import load_cached_mesh, mesh_cache_key, store_cached_mesh
+from mesh_smoothing import SmoothableMesh, corner_records, mesh_arrays_from_elements
+
 
 def closed_bezier(control_points):
     """Return a simple closed, smooth Bezier-like VMobject from anchor points.
@@ -119,15 +129,58 @@ class CommplexElement(VMobject):
         self.complex_domain.set_fill(RED, opacity=0.35)
         self.complex_domain.set_stroke(RED, width=3)
         self.add(self.complex_domain)
+        self._arc_length_boundary = None
+
+    def get_arc_length_boundary(self):
+        """Arc-length table of the outline, rebuilt only when the outline has moved."""
+        points = self.complex_domain.get_all_points()
+        cached = self._arc_length_boundary
+        if cached is None or not np.array_equal(cached[0], points):
+            sampler = ArcLengthBoundary(
+                points, points_per_curve=getattr(self.complex_domain, "n_points_per_cubic_curve", 4)
+            )
+            self._arc_length_boundary = cached = (points.copy(), sampler)
+        return cached[1]
+
+    def sample_boundary(self, spacing=None, count=None, offset=0.0):
+        """
+        Points evenly spaced in arc length along the outline.
+
+        Parameters:
+        -----------
+        spacing : float or None
+            Target distance between samples
+        count : int or None
+            Exact number of samples (overrides spacing)
+        offset : float
+            Arc length of the first sample
+
+        Returns:
+        --------
+        points : (n, 3) array
+        tangents : (n, 3) unit tangents
+        normals : (n, 3) unit outward normals
+        """
+        points, tangents, normals = self.get_arc_length_boundary().sample(spacing, count, offset)
+        z = np.zeros((len(points), 1))
+        return np.hstack([points, z]), np.hstack([tangents, z]), np.hstack([normals, z])
 
 
-class FiniteElement(VGroup):
+class FiniteElement(SmoothableMesh, VGroup):
     """Approximates a complex domain using simple geometric shapes (triangles, quads, hexagons).
     
     This class implements finite element mesh generation, which is essential in numerical
     methods for approximating solutions to PDEs over complex domains.
     """
     
+    # Editing this file invalidates cached meshes
+    generator_sources = (
+        __file__,
+        inspect.getfile(ArcLengthBoundary),
+        inspect.getfile(hexagonal_tiling),
+        structured_mesh.__file__,
+    )
+    
     def __init__(
         self,
         base_domain=None,
@@ -141,6 +194,8 @@ class FiniteElement(VGroup):
         mesh_opacity=0.3,
         stroke_width=1.5,
         adaptive=False,  # Adaptive mesh refinement (finer near boundary)
+        quad_mapping="polar",  # "polar" or "coons" (quad elements only)
+        use_cache=True,
         **kwargs
     ):
         """
@@ -170,6 +225,13 @@ class FiniteElement(VGroup):
             Width of mesh element edges
         adaptive : bool
             If True, creates finer mesh near the boundary
+        quad_mapping : str
+            "polar" - rings around the centre (triangle fan in the core)
+            "coons" - all-quad Coons patch from four boundary arcs (falls
+                      back to "polar" if the patch cannot be untangled)
+        use_cache : bool
+            Load the mesh from the on-disk cache if this domain and these
+            parameters were meshed before
         """
         super().__init__(**kwargs)
         
@@ -177,6 +239,11 @@ class FiniteElement(VGroup):
         self.num_radial = num_radial
         self.num_angular = num_angular
         self.adaptive = adaptive
+        self.quad_mapping = quad_mapping
+        self.nodes = None
+        self.connectivity = None
+        self._boundary_sampler = None
+        self._boundary_samples = {}
         
         # If no base domain provided, create a default one
         if base_domain is None:
@@ -184,8 +251,14 @@ class FiniteElement(VGroup):
         
         self.base_domain = base_domain
         
-        # Generate mesh elements
-        elements = self._generate_mesh()
+        # Generate mesh elements (or rebuild them from the mesh cache)
+        cache_key = self._cache_key() if use_cache else None
+        cached = load_cached_mesh(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self.nodes, self.connectivity = cached['nodes'], cached['connectivity']
+            elements = self._elements_from_arrays(self.nodes, self.connectivity)
+        else:
+            elements = self._generate_mesh()
         
         # Style the elements
         for elem in elements:
@@ -204,6 +277,24 @@ class FiniteElement(VGroup):
             self.add(domain_boundary)
         
         self.mesh_elements = elements
+        # Generation-frame corners of the first element (to track later transforms)
+        self._reference_corners = elements[0].get_vertices()[:3].copy() if elements else None
+        
+        if cache_key is not None and cached is None and elements:
+            store_cached_mesh(cache_key, self.nodes, self.connectivity, meta={'element_type': element_type})
+    
+    def _cache_key(self):
+        """Content hash of the domain outline and mesh parameters."""
+        params = {
+            'class': type(self).__name__,
+            'element_type': self.element_type,
+            'num_radial': self.num_radial,
+            'num_angular': self.num_angular,
+            'adaptive': self.adaptive,
+            'quad_mapping': self.quad_mapping,
+        }
+        outline = self.base_domain.complex_domain.get_all_points()
+        return mesh_cache_key(outline, params, self.generator_sources)
     
     def _generate_mesh(self):
         """Generate mesh elements based on the selected type."""
@@ -216,18 +307,29 @@ class FiniteElement(VGroup):
         else:
             raise ValueError(f"Unknown element type: {self.element_type}")
     
+    def _elements_from_arrays(self, nodes, connectivity):
+        """Polygon mobjects for node/connectivity arrays."""
+        corners = np.column_stack([nodes[:, :2], np.zeros(len(nodes))])
+        return [Polygon(*corners[elem]) for elem in connectivity]
+    
     def _sample_domain_boundary(self, num_samples=200):
-        """Sample points uniformly along the domain boundary."""
-        domain_points = self.base_domain.complex_domain.get_all_points()
-        
-        # Uniformly resample
-        if len(domain_points) > num_samples:
-            indices = np.linspace(0, len(domain_points) - 1, num_samples, dtype=int)
-            sampled = domain_points[indices]
-        else:
-            sampled = domain_points
+        """
+        Sample points evenly spaced in arc length along the domain boundary.
         
-        return sampled
+        The meshers ask for the same few sample counts thousands of times, so
+        samples are kept per count (read-only) until the outline moves and the
+        domain rebuilds its arc-length table.
+        """
+        sampler = self.base_domain.get_arc_length_boundary()
+        if self._boundary_sampler is not sampler:
+            self._boundary_sampler = sampler
+            self._boundary_samples = {}
+        points = self._boundary_samples.get(num_samples)
+        if points is None:
+            points, _, _ = self.base_domain.sample_boundary(count=num_samples)
+            points.setflags(write=False)
+            self._boundary_samples[num_samples] = points
+        return points
     
     def _get_domain_center(self):
         """Compute the approximate center (centroid) of the domain."""
@@ -265,20 +367,13 @@ class FiniteElement(VGroup):
         # Cast ray and find intersection with boundary
         max_radius = 0
         
-        # Find the furthest boundary point in this direction
-        for point in boundary:
-            vec = point - center
-            # Get angle of this point
-            point_angle = np.arctan2(vec[1], vec[0])
-            
-            # Check if this point is close to our desired angle
-            angle_diff = abs((point_angle - angle + np.pi) % (2 * np.pi) - np.pi)
-            
-            # Accept points in a narrow cone around our direction
-            if angle_diff < TAU / (2 * num_samples):
-                radius = np.linalg.norm(vec[:2])
-                if radius > max_radius:
-                    max_radius = radius
+        # Find the furthest boundary point in a narrow cone around this direction
+        vec = boundary[:, :2] - center[:2]
+        point_angles = np.arctan2(vec[:, 1], vec[:, 0])
+        angle_diff = np.abs((point_angles - angle + np.pi) % (2 * np.pi) - np.pi)
+        in_cone = angle_diff < TAU / (2 * num_samples)
+        if in_cone.any():
+            max_radius = np.linalg.norm(vec[in_cone], axis=1).max()
         
         # Fallback if no points found: sample along the ray
         if max_radius == 0:
@@ -302,16 +397,8 @@ class FiniteElement(VGroup):
             return point
         
         # Find the closest boundary point
-        min_dist = float('inf')
-        closest_point = point
-        
-        for boundary_pt in boundary:
-            dist = np.linalg.norm(point[:2] - boundary_pt[:2])
-            if dist < min_dist:
-                min_dist = dist
-                closest_point = boundary_pt
-        
-        return closest_point
+        dist = np.linalg.norm(boundary[:, :2] - point[:2], axis=1)
+        return boundary[np.argmin(dist)].copy()
     
     def _generate_triangular_mesh(self):
         """Generate triangular finite elements using radial subdivision."""
@@ -388,99 +475,67 @@ class FiniteElement(VGroup):
                         tri2 = Polygon(v1, v3, v4)
                         elements.append(tri2)
         
+        if elements:
+            nodes, self.connectivity = mesh_arrays_from_elements(elements)
+            self.nodes = nodes[:, :2]
         return elements
     
     def _generate_quad_mesh(self):
-        """Generate quadrilateral finite elements."""
-        elements = []
-        center = self._get_domain_center()
-        boundary = self._sample_domain_boundary(200)
-        
-        # Adaptive mesh spacing
-        if self.adaptive:
-            radial_fracs = [(r / self.num_radial) ** 0.7 for r in range(self.num_radial + 1)]
+        """
+        Generate structured quadrilateral elements by transfinite interpolation.
+        
+        Exactly num_radial * num_angular elements, hole-free and conforming:
+        - "polar": rings of quads around the centre (core cells are a
+          triangle fan); adaptive spacing puts more rings near the boundary
+        - "coons": num_angular x num_radial all-quad Coons patch, Winslow-
+          smoothed where the blend folds; every quad is checked, and if no
+          patch corner placement leaves all of them unfolded the polar mapping
+          is used instead (with a warning) rather than a tangled mesh
+        """
+        mesh = None
+        if self.quad_mapping == "coons":
+            boundary = self._sample_domain_boundary(2 * (self.num_angular + self.num_radial))
+            mesh = structured_mesh.untangled_coons_quad_mesh(boundary, self.num_angular, self.num_radial)
+            if mesh is None:
+                warnings.warn(
+                    f"Coons quad mesh ({self.num_angular} x {self.num_radial}) folds on this domain; "
+                    "using the polar mapping instead",
+                    stacklevel=3,
+                )
+        if mesh is not None:
+            nodes, connectivity = mesh
+        elif self.quad_mapping in ("polar", "coons"):
+            center = self._get_domain_center()
+            boundary = self._sample_domain_boundary(self.num_angular)
+            fracs = structured_mesh.radial_fractions(self.num_radial, self.adaptive)
+            nodes, connectivity = structured_mesh.polar_tfi_mesh(center, boundary, fracs)
         else:
-            radial_fracs = [r / self.num_radial for r in range(self.num_radial + 1)]
-        
-        for r in range(self.num_radial):
-            r_inner = radial_fracs[r]
-            r_outer = radial_fracs[r + 1]
-            
-            for a in range(self.num_angular):
-                angle1 = a * TAU / self.num_angular
-                angle2 = (a + 1) * TAU / self.num_angular
-                
-                # Get radii at both angles
-                radius1 = self._get_radial_profile(angle1)
-                radius2 = self._get_radial_profile(angle2)
-                
-                # Create quad vertices
-                dir1 = np.array([np.cos(angle1), np.sin(angle1), 0])
-                dir2 = np.array([np.cos(angle2), np.sin(angle2), 0])
-                
-                v1 = center + dir1 * radius1 * r_inner
-                v2 = center + dir1 * radius1 * r_outer
-                v3 = center + dir2 * radius2 * r_outer
-                v4 = center + dir2 * radius2 * r_inner
-                
-                # Clip all vertices to boundary
-                v1 = self._clip_point_to_boundary(v1)
-                v2 = self._clip_point_to_boundary(v2)
-                v3 = self._clip_point_to_boundary(v3)
-                v4 = self._clip_point_to_boundary(v4)
-                
-                # Only add quad if all vertices are inside boundary
-                if self._point_in_polygon(v1, boundary) and \
-                   self._point_in_polygon(v2, boundary) and \
-                   self._point_in_polygon(v3, boundary) and \
-                   self._point_in_polygon(v4, boundary):
-                    quad = Polygon(v1, v2, v3, v4)
-                    elements.append(quad)
+            raise ValueError(f"Unknown quad mapping: {self.quad_mapping}")
         
-        return elements
+        self.nodes, self.connectivity = nodes, connectivity
+        return self._elements_from_arrays(nodes, connectivity)
     
     def _generate_hex_mesh(self):
-        """Generate hexagonal finite elements (honeycomb pattern)."""
-        elements = []
+        """
+        Generate hexagonal finite elements (honeycomb pattern).
+        
+        Whole hexagons fill the interior and the cells crossing the boundary
+        are clipped to the domain, so the tiling covers it exactly.
+        """
         center = self._get_domain_center()
         boundary = self._sample_domain_boundary(200)
-        avg_radius = np.mean([np.linalg.norm(p[:2] - center[:2]) for p in boundary])
+        avg_radius = np.mean(np.linalg.norm(boundary[:, :2] - center[:2], axis=1))
         
         # Hexagon size based on desired mesh density
         hex_size = avg_radius / (self.num_radial * 1.8)
         
-        # Generate hexagonal grid using axial coordinates
-        for q in range(-self.num_radial - 2, self.num_radial + 3):
-            for r in range(-self.num_radial - 2, self.num_radial + 3):
-                # Axial to Cartesian conversion for hexagonal grid
-                x = hex_size * (3/2 * q)
-                y = hex_size * (np.sqrt(3)/2 * q + np.sqrt(3) * r)
-                hex_center = center + np.array([x, y, 0])
-                
-                # Check if hexagon center is inside the boundary
-                if not self._point_in_polygon(hex_center, boundary):
-                    continue
-                
-                # Create hexagon vertices
-                hex_vertices = []
-                for i in range(6):
-                    angle = TAU / 6 * i + TAU / 12  # Rotate for flat-top orientation
-                    vertex = hex_center + np.array([
-                        hex_size * np.cos(angle),
-                        hex_size * np.sin(angle),
-                        0
-                    ])
-                    hex_vertices.append(vertex)
-                
-                # Check if at least 4 vertices are inside (majority)
-                # This allows partial hexagons near the boundary
-                inside_count = sum(1 for v in hex_vertices if self._point_in_polygon(v, boundary))
-                
-                if inside_count >= 4:
-                    hexagon = Polygon(*hex_vertices)
-                    elements.append(hexagon)
+        # Clip against a finer outline than the hexagons (about 8 samples per edge)
+        perimeter = self.base_domain.get_arc_length_boundary().perimeter
+        outline = self._sample_domain_boundary(max(200, int(8 * perimeter / hex_size)))
+        nodes, connectivity = hexagonal_tiling(outline, center, hex_size)
         
-        return elements
+        self.nodes, self.connectivity = nodes, connectivity
+        return self._elements_from_arrays(nodes, connectivity)
     
     def color_by_function(self, func, color_range=[BLUE, RED], opacity=0.7):
         """
@@ -510,12 +565,38 @@ class FiniteElement(VGroup):
             value = func(center[0], center[1])
             values.append(value)
         
+        return self.color_by_values(values, color_range=color_range, opacity=opacity)
+    
+    def color_by_values(self, values, color_range=[BLUE, RED], opacity=0.7):
+        """
+        Color mesh elements by precomputed values (e.g. a FEM solution).
+        
+        Parameters:
+        -----------
+        values : array
+            One value per element, or one per node of get_mesh_arrays()
+            (averaged over each element's corners)
+        color_range : list
+            [min_color, max_color] for the gradient
+        opacity : float
+            Opacity for the colored elements
+        
+        Returns:
+        --------
+        self : for method chaining
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) != len(self.mesh_elements):
+            _, connectivity = self.get_mesh_arrays()
+            elem, node, _, _ = corner_records(connectivity)
+            values = np.bincount(elem, weights=values[node]) / np.bincount(elem)
+        
         # Normalize values to [0, 1]
-        vmin, vmax = min(values), max(values)
+        vmin, vmax = values.min(), values.max()
         if vmax - vmin > 1e-10:
-            norm_values = [(v - vmin) / (vmax - vmin) for v in values]
+            norm_values = (values - vmin) / (vmax - vmin)
         else:
-            norm_values = [0.5] * len(values)
+            norm_values = np.full(len(values), 0.5)
         
         # Apply gradient colors
         for elem, norm_val in zip(self.mesh_elements, norm_values):
@@ -540,10 +621,95 @@ class FiniteElement(VGroup):
         
         return self
     
+    def solve_poisson(self, source=1.0, **kwargs):
+        """
+        Solve -div(k grad u) = f on this mesh (P1 elements).
+        
+        Quads and hexagons are split into triangles (clipped boundary cells
+        by ear clipping). Keyword arguments
+        (conductivity, dirichlet, neumann, edge_tags, solver, tol) are passed
+        to fem_solver.solve_poisson; by default u = 0 on the whole boundary.
+        
+        Returns:
+        --------
+        dict : solver result plus the 'nodes' and 'triangles' it was solved on;
+               result['solution'] can go straight into color_by_values
+        """
+        nodes, connectivity = self.get_mesh_arrays()
+        triangles, _ = fem_solver.triangulate_polygons(connectivity, nodes)
+        result = fem_solver.solve_poisson(nodes, triangles, source=source, **kwargs)
+        result['nodes'] = nodes
+        result['triangles'] = triangles
+        return result
+    
+    def solve_plane_stress(self, **kwargs):
+        """
+        Solve plane-stress elasticity on this mesh (constant strain triangles).
+        
+        Keyword arguments are passed to fem_solver.solve_plane_stress; by
+        default the whole boundary is clamped, so pass edge_tags, dirichlet
+        and neumann to describe the load case.
+        
+        Returns:
+        --------
+        dict : solver result plus 'nodes' and 'triangles';
+               result['von_mises_nodal'] can go straight into color_by_values
+        """
+        nodes, connectivity = self.get_mesh_arrays()
+        triangles, _ = fem_solver.triangulate_polygons(connectivity, nodes)
+        result = fem_solver.solve_plane_stress(nodes, triangles, **kwargs)
+        result['nodes'] = nodes
+        result['triangles'] = triangles
+        return result
+    
+    def _current_node_transform(self):
+        """
+        Affine map (3x3) from generated node coordinates to the current frame.
+        
+        Recovered from the first element, so it follows any scale/shift/rotate
+        applied to the mesh after construction.
+        """
+        original = np.column_stack([self._reference_corners[:, :2], np.ones(3)])
+        current = self.mesh_elements[0].get_vertices()[:3]
+        return np.linalg.solve(original, current)
+    
+    def _generated_mesh_arrays(self):
+        """Nodes (N, 2) and connectivity in the frame the mesh was generated in."""
+        return self.nodes[:, :2], self.connectivity
+    
+    def _refinement_start_corners(self, refined, fine_nodes, fine_connectivity):
+        """
+        Where each corner of the refined mesh starts, in the generation frame.
+        
+        Polar quad meshes map the fine reference grid through the coarse
+        geometry (children exactly tile their parent); other meshes, Coons
+        patches included (their smoothing and corner placement change with
+        the resolution), push each child's corners onto the outline of the
+        coarse element containing it.
+        """
+        _, fine_corner_nodes, _, _ = corner_records(fine_connectivity)
+        
+        if self.element_type == "quad" and self.quad_mapping == "polar":
+            coarse_boundary = self._sample_domain_boundary(self.num_angular)
+            fracs = structured_mesh.radial_fractions(refined.num_radial, refined.adaptive)
+            start_nodes = structured_mesh.coarse_polar_nodes(
+                self._get_domain_center(), coarse_boundary, fracs, refined.num_angular
+            )
+            return start_nodes[fine_corner_nodes]
+        
+        coarse_nodes, coarse_connectivity = self._generated_mesh_arrays()
+        return mesh_morph.parent_start_corners(coarse_nodes, coarse_connectivity, fine_nodes, fine_connectivity)
+    
     def get_refinement_animation(self, new_radial=None, new_angular=None, run_time=2):
         """
         Create an animation showing mesh refinement.
         
+        Every refined element starts inside (or on the shape of) the coarse
+        element it came from and its points are interpolated directly to their
+        final positions, so the cost per frame is linear in the element count.
+        When the animation starts the mesh's elements are replaced by the
+        refined ones; afterwards this mesh is the refined mesh.
+        
         Parameters:
         -----------
         new_radial : int
@@ -555,26 +721,66 @@ class FiniteElement(VGroup):
         
         Returns:
         --------
-        AnimationGroup : Manim animation
+        Animation : Manim animation acting on this mesh
         """
         if new_radial is None:
             new_radial = self.num_radial * 2
         if new_angular is None:
             new_angular = self.num_angular * 2
         
-        # Create refined mesh
-        refined_mesh = FiniteElement(
+        template = self.mesh_elements[0]
+        refined = FiniteElement(
             base_domain=self.base_domain,
             element_type=self.element_type,
             num_radial=new_radial,
             num_angular=new_angular,
             show_domain=False,
-            mesh_color=self.mesh_elements[0].get_fill_color(),
-            mesh_opacity=self.mesh_elements[0].get_fill_opacity(),
-            stroke_width=self.mesh_elements[0].get_stroke_width(),
+            adaptive=self.adaptive,
+            quad_mapping=self.quad_mapping,
+            mesh_color=template.get_fill_color(),
+            mesh_opacity=template.get_fill_opacity(),
+            stroke_width=template.get_stroke_width(),
         )
-        
-        return Transform(self, refined_mesh, run_time=run_time)
+        fine_nodes, fine_connectivity = refined._generated_mesh_arrays()
+        _, fine_corner_nodes, _, _ = corner_records(fine_connectivity)
+        
+        # Corner positions before/after, moved into this mesh's current frame
+        transform = self._current_node_transform()
+        start_corners = self._refinement_start_corners(refined, fine_nodes, fine_connectivity)
+        end_corners = fine_nodes[fine_corner_nodes]
+        start_corners = np.column_stack([start_corners, np.ones(len(start_corners))]) @ transform
+        end_corners = np.column_stack([end_corners, np.ones(len(end_corners))]) @ transform
+        
+        lengths = np.array([len(elem) for elem in fine_connectivity])
+        start = mesh_morph.edge_bezier_points(start_corners, lengths)
+        delta = mesh_morph.edge_bezier_points(end_corners, lengths) - start
+        
+        # Element points are views into one buffer: a frame is a single multiply-add
+        buffer = start.copy()
+        views = np.split(buffer, 4 * np.cumsum(lengths)[:-1])
+        fine_elements = refined.mesh_elements
+        outline = self.submobjects[len(self.mesh_elements):]
+        swapped = [False]
+        
+        def morph(mesh, alpha):
+            if not swapped[0]:
+                for elem, view in zip(fine_elements, views):
+                    elem.points = view
+                mesh.submobjects = list(fine_elements) + outline
+                mesh.mesh_elements = fine_elements
+                # Adopt the refined mesh's description along with its elements
+                mesh.num_radial, mesh.num_angular = new_radial, new_angular
+                mesh.nodes, mesh.connectivity = refined.nodes, refined.connectivity
+                mesh._reference_corners = refined._reference_corners
+                swapped[0] = True
+            np.multiply(delta, alpha, out=buffer)
+            np.add(buffer, start, out=buffer)
+            if alpha >= 1:
+                # Hand each element its own points again once the morph is done
+                for elem, view in zip(fine_elements, views):
+                    elem.points = view.copy()
+        
+        return UpdateFromAlphaFunc(self, morph, run_time=run_time)
 
 
 class Domain2D(Scene):
@@ -663,6 +869,32 @@ class FunctionVisualization(Scene):
         self.add(mesh, title)
 
 
+class HeatConduction(Scene):
+    """Example scene solving a Poisson problem on the mesh instead of coloring by a formula."""
+    
+    def construct(self):
+        domain = CommplexElement(irregularity=0.3, seed=123)
+        
+        mesh = FiniteElement(
+            base_domain=domain,
+            element_type="triangle",
+            num_radial=8,
+            num_angular=24,
+            show_domain=True,
+            domain_color=WHITE,
+        )
+        
+        # Uniform heat source, boundary held at zero temperature
+        result = mesh.solve_poisson(source=1.0)
+        mesh.color_by_values(result['solution'], color_range=[BLUE, RED], opacity=0.8)
+        
+        title = Text("Heat Conduction (FEM solution)", font_size=32).to_edge(UP)
+        equation = MathTex(r"-\nabla^2 T = 1, \quad T = 0 \text{ on } \partial\Omega", font_size=28)
+        equation.to_edge(DOWN)
+        
+        self.add(mesh, title, equation)
+
+
 class AdaptiveMesh(Scene):
     """Example showing adaptive mesh refinement."""
     
@@ -695,4 +927,39 @@ class AdaptiveMesh(Scene):
         coarse_label = Text("Uniform Mesh", font_size=24).next_to(coarse, UP)
         adaptive_label = Text("Adaptive Mesh", font_size=24).next_to(adaptive, UP)
         
-        self.add(coarse, adaptive, coarse_label, adaptive_label)
\ No newline at end of file
+        self.add(coarse, adaptive, coarse_label, adaptive_label)
+
+class RefinementMorph(Scene):
+    """Example playing refinement morphs: each refined element grows out of its coarse parent."""
+    
+    def construct(self):
+        domain = CommplexElement(irregularity=0.25, seed=42)
+        
+        # Quads (children tile their parent) and triangles (children start on the parent outline)
+        quads = FiniteElement(
+            base_domain=domain,
+            element_type="quad",
+            num_radial=3,
+            num_angular=10,
+            mesh_color=YELLOW,
+        )
+        quads.shift(LEFT * 3.5)
+        
+        triangles = FiniteElement(
+            base_domain=domain,
+            element_type="triangle",
+            num_radial=3,
+            num_angular=10,
+            mesh_color=GREEN,
+        )
+        triangles.shift(RIGHT * 3.5)
+        
+        title = Text("Refinement Morph", font_size=32).to_edge(UP)
+        self.add(quads, triangles, title)
+        self.wait(0.5)
+        
+        self.play(
+            quads.get_refinement_animation(run_time=2),
+            triangles.get_refinement_animation(run_time=2),
+        )
+        self.wait()
@@ -0,0 +1,429 @@
+"""
+Sparse linear finite element solver on generated meshes
+Includes: P1 Poisson, plane-stress elasticity (CST), boundary tagging, direct/CG solves
+"""
+
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from mesh_smoothing import corner_records
+
+
+def _ear_clip(points, polygon):
+    """
+    Ear-clipping triangulation of one simple counter-clockwise polygon.
+
+    An ear is a strictly convex corner whose triangle holds no other corner
+    (on its edges included). Returns a list of (a, b, c) node index triples.
+    """
+    remaining = [int(k) for k in polygon]
+    triangles = []
+    while len(remaining) > 3:
+        n = len(remaining)
+        p = points[remaining]
+        for k in range(n):
+            a, b, c = p[k - 1], p[k], p[(k + 1) % n]
+            if (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) <= 0:
+                continue
+            others = np.delete(p, [(k - 1) % n, k, (k + 1) % n], axis=0)
+            sides = [
+                (v[0] - u[0]) * (others[:, 1] - u[1]) - (v[1] - u[1]) * (others[:, 0] - u[0])
+                for u, v in ((a, b), (b, c), (c, a))
+            ]
+            if np.any((sides[0] >= 0) & (sides[1] >= 0) & (sides[2] >= 0)):
+                continue
+            triangles.append((remaining[k - 1], remaining[k], remaining[(k + 1) % n]))
+            del remaining[k]
+            break
+        else:
+            raise ValueError(f"Element {polygon} is not a simple counter-clockwise polygon")
+    triangles.append(tuple(remaining))
+    return triangles
+
+
+def triangulate_polygons(connectivity, nodes=None):
+    """
+    Split polygon elements (quads, hexagons, clipped cells, ...) into triangles.
+
+    Convex elements are fan-split from their first corner. When nodes are
+    given, elements with a reflex or straight corner (e.g. hexagons clipped
+    by a curved boundary) are ear-clipped instead, and every triangle is
+    checked to have positive area (ValueError otherwise; a mirrored mesh
+    counts as positive); without nodes every element is fan-split, which is
+    only valid for convex elements.
+
+    Returns (triangles (T, 3), parent (T,)) where parent maps each triangle
+    back to the element it came from.
+    """
+    if isinstance(connectivity, np.ndarray) and connectivity.ndim == 2 and connectivity.shape[1] == 3:
+        return connectivity, np.arange(len(connectivity))
+
+    elem, node, prv, nxt = corner_records(connectivity)
+    lengths = np.bincount(elem)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    fan_split = np.ones(len(lengths), dtype=bool)
+    if nodes is not None:
+        xy = np.asarray(nodes, dtype=float)[:, :2]
+        # A mirrored mesh (clockwise elements) is checked in its mirror image
+        q, r = xy[node], xy[nxt]
+        if np.sum(q[:, 0] * r[:, 1] - r[:, 0] * q[:, 1]) < 0:
+            xy = xy * [1.0, -1.0]
+        a, b, c = xy[prv], xy[node], xy[nxt]
+        turn = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        fan_split = np.bincount(elem, weights=turn <= 0, minlength=len(lengths)) == 0
+
+    fans = np.where(fan_split, lengths - 2, 0)
+    parent = np.repeat(np.arange(len(lengths)), fans)
+    k = np.arange(len(parent)) - np.repeat(np.cumsum(fans) - fans, fans)
+    base = offsets[parent]
+    triangles = np.column_stack([node[base], node[base + k + 1], node[base + k + 2]])
+
+    if nodes is None:
+        return triangles, parent
+
+    clipped = np.flatnonzero(~fan_split)
+    if len(clipped):
+        ears = [_ear_clip(xy, node[offsets[e]:offsets[e] + lengths[e]]) for e in clipped]
+        order = np.argsort(np.concatenate([parent, np.repeat(clipped, [len(t) for t in ears])]), kind="stable")
+        triangles = np.vstack([triangles] + [np.array(t, dtype=int) for t in ears])[order]
+        parent = np.repeat(np.arange(len(lengths)), lengths - 2)
+
+    p = xy[triangles]
+    area2 = (p[:, 1, 0] - p[:, 0, 0]) * (p[:, 2, 1] - p[:, 0, 1]) - (p[:, 1, 1] - p[:, 0, 1]) * (p[:, 2, 0] - p[:, 0, 0])
+    if np.any(area2 <= 0):
+        raise ValueError(f"{np.count_nonzero(area2 <= 0)} triangles have non-positive area")
+    return triangles, parent
+
+
+def boundary_edges(triangles):
+    """Edges (B, 2) used by exactly one triangle."""
+    _, node, _, nxt = corner_records(triangles)
+    num_nodes = int(triangles.max()) + 1
+    lo, hi = np.minimum(node, nxt), np.maximum(node, nxt)
+    keys, counts = np.unique(lo.astype(np.int64) * num_nodes + hi, return_counts=True)
+    single = keys[counts == 1]
+    return np.column_stack([single // num_nodes, single % num_nodes])
+
+
+def tag_boundary_edges(nodes, edges, selectors, default=0):
+    """
+    Assign integer tags to boundary edges.
+
+    Parameters:
+    -----------
+    nodes : (N, 2) or (N, 3) array
+    edges : (B, 2) array from boundary_edges
+    selectors : dict {tag: f(x, y) -> bool array}
+        Evaluated at edge midpoints; later entries win on overlap
+    default : int
+        Tag for edges no selector claims
+
+    Returns:
+    --------
+    tags : (B,) int array
+    """
+    mid = 0.5 * (nodes[edges[:, 0], :2] + nodes[edges[:, 1], :2])
+    tags = np.full(len(edges), default, dtype=int)
+    for tag, selector in selectors.items():
+        tags[np.asarray(selector(mid[:, 0], mid[:, 1]), dtype=bool)] = tag
+    return tags
+
+
+def _evaluate(value, x, y):
+    """Evaluate a scalar or vectorized f(x, y) at many points."""
+    if callable(value):
+        return np.broadcast_to(np.asarray(value(x, y), dtype=float), x.shape)
+    return np.full(x.shape, float(value))
+
+
+def _shape_gradients(nodes, triangles):
+    """P1 shape function gradients (T, 3, 2) and unsigned areas (T,)."""
+    p = nodes[:, :2][triangles]
+    x, y = p[..., 0], p[..., 1]
+    b = np.column_stack([y[:, 1] - y[:, 2], y[:, 2] - y[:, 0], y[:, 0] - y[:, 1]])
+    c = np.column_stack([x[:, 2] - x[:, 1], x[:, 0] - x[:, 2], x[:, 1] - x[:, 0]])
+    det = x[:, 1] * y[:, 2] - x[:, 2] * y[:, 1] - x[:, 0] * y[:, 2] + x[:, 2] * y[:, 0] + x[:, 0] * y[:, 1] - x[:, 1] * y[:, 0]
+    # Degenerate (zero-area) triangles, e.g. from clipped radial meshes, get
+    # zero gradients and so contribute nothing
+    grads = np.stack([b, c], axis=-1)
+    np.divide(grads, det[:, None, None], out=grads, where=det[:, None, None] != 0)
+    grads[det == 0] = 0.0
+    return grads, 0.5 * np.abs(det)
+
+
+def _scatter_matrix(dofs, local, size):
+    """Assemble element matrices (T, k, k) over element dofs (T, k) into CSR."""
+    k = dofs.shape[1]
+    rows = np.broadcast_to(dofs[:, :, None], (len(dofs), k, k)).ravel()
+    cols = np.broadcast_to(dofs[:, None, :], (len(dofs), k, k)).ravel()
+    return sparse.coo_matrix((local.ravel(), (rows, cols)), shape=(size, size)).tocsr()
+
+
+def _edge_loads(nodes, edges, tags, loads, components):
+    """Lumped edge integrals of {tag: value} -> (edge nodes (M,), values (M, components))."""
+    edge_nodes, edge_values = [], []
+    for tag, value in loads.items():
+        selected = edges[tags == tag]
+        if len(selected) == 0:
+            continue
+        a, b = nodes[selected[:, 0], :2], nodes[selected[:, 1], :2]
+        mid = 0.5 * (a + b)
+        half_length = 0.5 * np.linalg.norm(b - a, axis=1)
+        values = value if isinstance(value, (tuple, list)) else (value,)
+        per_edge = np.column_stack([_evaluate(v, mid[:, 0], mid[:, 1]) for v in values[:components]])
+        contribution = per_edge * half_length[:, None]
+        edge_nodes.append(selected.ravel())
+        edge_values.append(np.repeat(contribution, 2, axis=0))
+    if not edge_nodes:
+        return np.empty(0, dtype=int), np.empty((0, components))
+    return np.concatenate(edge_nodes), np.vstack(edge_values)
+
+
+def _solve_constrained(K, F, fixed, fixed_values, solver, tol):
+    """Eliminate fixed dofs and solve K u = F for the rest."""
+    u = np.zeros(K.shape[0])
+    u[fixed] = fixed_values
+    free = np.ones(K.shape[0], dtype=bool)
+    free[fixed] = False
+    if not free.any():
+        return u, {'iterations': 0, 'residual': 0.0}
+
+    K_ff = K[free][:, free]
+    rhs = F[free] - K[free][:, fixed] @ u[fixed]
+
+    if solver == "direct":
+        u[free] = sparse_linalg.spsolve(K_ff.tocsc(), rhs)
+        iterations = 1
+    elif solver == "cg":
+        counter = {'n': 0}
+
+        def count(_):
+            counter['n'] += 1
+
+        jacobi = sparse.diags(1.0 / K_ff.diagonal())
+        u[free], status = sparse_linalg.cg(K_ff, rhs, rtol=tol, M=jacobi, callback=count)
+        if status > 0:
+            raise RuntimeError(f"CG did not converge in {status} iterations")
+        iterations = counter['n']
+    else:
+        raise ValueError(f"Unknown solver: {solver}")
+
+    residual = np.linalg.norm(K_ff @ u[free] - rhs) / max(np.linalg.norm(rhs), 1e-300)
+    return u, {'iterations': iterations, 'residual': float(residual)}
+
+
+def _default_edge_tags(triangles, edge_tags):
+    if edge_tags is None:
+        edges = boundary_edges(triangles)
+        return edges, np.zeros(len(edges), dtype=int)
+    return edge_tags
+
+
+def assemble_poisson(nodes, triangles, source=0.0, conductivity=1.0):
+    """
+    P1 stiffness matrix and load vector for -div(k grad u) = f.
+
+    source and conductivity may be scalars or vectorized f(x, y), evaluated
+    at element centroids.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    grads, areas = _shape_gradients(nodes, triangles)
+    centroids = nodes[:, :2][triangles].mean(axis=1)
+    k = _evaluate(conductivity, centroids[:, 0], centroids[:, 1])
+    f = _evaluate(source, centroids[:, 0], centroids[:, 1])
+
+    local = (k * areas)[:, None, None] * (grads @ grads.transpose(0, 2, 1))
+    K = _scatter_matrix(triangles, local, len(nodes))
+    F = np.bincount(triangles.ravel(), weights=np.repeat(f * areas / 3, 3), minlength=len(nodes))
+    return K, F
+
+
+def solve_poisson(nodes, triangles, source=0.0, conductivity=1.0, dirichlet=None, neumann=None,
+                  edge_tags=None, solver="direct", tol=1e-10):
+    """
+    Solve -div(k grad u) = f on a triangle mesh.
+
+    Parameters:
+    -----------
+    nodes : (N, 2) or (N, 3) array
+    triangles : (T, 3) int array
+    source, conductivity : float or vectorized f(x, y)
+    dirichlet : dict {tag: value or g(x, y)}
+        Prescribed u on tagged boundary edges (default: u = 0 on tag 0)
+    neumann : dict {tag: value or h(x, y)}
+        Prescribed outward flux k du/dn on tagged boundary edges
+    edge_tags : (edges, tags) or None
+        From boundary_edges / tag_boundary_edges; default tags every
+        boundary edge 0
+    solver : str
+        "direct" (sparse LU) or "cg" (Jacobi-preconditioned conjugate gradient)
+    tol : float
+        Relative residual tolerance for "cg"
+
+    Returns:
+    --------
+    dict with:
+    - solution: (N,) nodal values
+    - gradient: (T, 2) per-element gradient
+    - flux_magnitude: (T,) |k grad u|
+    - info: timings, iterations and relative residual
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    if dirichlet is None:
+        dirichlet = {0: 0.0}
+    edges, tags = _default_edge_tags(triangles, edge_tags)
+
+    t0 = time.perf_counter()
+    K, F = assemble_poisson(nodes, triangles, source, conductivity)
+    if neumann:
+        edge_nodes, edge_values = _edge_loads(nodes, edges, tags, neumann, 1)
+        F += np.bincount(edge_nodes, weights=edge_values[:, 0], minlength=len(nodes))
+    t_assembly = time.perf_counter() - t0
+
+    fixed = np.zeros(len(nodes), dtype=bool)
+    fixed_values = np.zeros(len(nodes))
+    for tag, value in dirichlet.items():
+        tag_nodes = np.unique(edges[tags == tag])
+        fixed[tag_nodes] = True
+        fixed_values[tag_nodes] = _evaluate(value, nodes[tag_nodes, 0], nodes[tag_nodes, 1])
+    if not fixed.any():
+        raise ValueError("At least one Dirichlet boundary is required")
+
+    t0 = time.perf_counter()
+    fixed_idx = np.flatnonzero(fixed)
+    u, info = _solve_constrained(K, F, fixed_idx, fixed_values[fixed_idx], solver, tol)
+    t_solve = time.perf_counter() - t0
+
+    grads, _ = _shape_gradients(nodes, triangles)
+    gradient = np.einsum('tij,ti->tj', grads, u[triangles])
+    centroids = nodes[:, :2][triangles].mean(axis=1)
+    k = _evaluate(conductivity, centroids[:, 0], centroids[:, 1])
+
+    info.update({'time_assembly': t_assembly, 'time_solve': t_solve, 'num_dofs': len(nodes)})
+    return {
+        'solution': u,
+        'gradient': gradient,
+        'flux_magnitude': k * np.linalg.norm(gradient, axis=1),
+        'info': info,
+    }
+
+
+def assemble_plane_stress(nodes, triangles, youngs_modulus=1.0, poisson_ratio=0.3, thickness=1.0,
+                          body_force=(0.0, 0.0)):
+    """
+    Constant-strain-triangle stiffness matrix and body-force load for plane stress.
+
+    Dofs are interleaved: 2 * node + component.
+
+    Returns (K, F, B, D) where B (T, 3, 6) is the strain-displacement operator
+    and D (3, 3) the plane-stress constitutive matrix.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    grads, areas = _shape_gradients(nodes, triangles)
+
+    E, nu = youngs_modulus, poisson_ratio
+    D = E / (1 - nu**2) * np.array([
+        [1, nu, 0],
+        [nu, 1, 0],
+        [0, 0, (1 - nu) / 2],
+    ])
+
+    B = np.zeros((len(triangles), 3, 6))
+    B[:, 0, 0::2] = grads[:, :, 0]
+    B[:, 1, 1::2] = grads[:, :, 1]
+    B[:, 2, 0::2] = grads[:, :, 1]
+    B[:, 2, 1::2] = grads[:, :, 0]
+
+    local = (thickness * areas)[:, None, None] * (B.transpose(0, 2, 1) @ D @ B)
+    dofs = np.repeat(2 * triangles, 2, axis=1) + np.tile([0, 1], 3)
+    K = _scatter_matrix(dofs, local, 2 * len(nodes))
+
+    centroids = nodes[:, :2][triangles].mean(axis=1)
+    weights = thickness * areas / 3
+    F = np.zeros(2 * len(nodes))
+    for comp in range(2):
+        f = _evaluate(body_force[comp], centroids[:, 0], centroids[:, 1])
+        F[comp::2] = np.bincount(triangles.ravel(), weights=np.repeat(f * weights, 3), minlength=len(nodes))
+    return K, F, B, D
+
+
+def solve_plane_stress(nodes, triangles, youngs_modulus=1.0, poisson_ratio=0.3, thickness=1.0,
+                       body_force=(0.0, 0.0), dirichlet=None, neumann=None, edge_tags=None,
+                       solver="direct", tol=1e-10):
+    """
+    Solve linear plane-stress elasticity with constant strain triangles.
+
+    Parameters:
+    -----------
+    youngs_modulus, poisson_ratio, thickness : float
+    body_force : (fx, fy), each a float or vectorized f(x, y)
+    dirichlet : dict {tag: (ux, uy)}
+        Prescribed displacement on tagged edges; a None component is left free
+        (default: clamp tag 0)
+    neumann : dict {tag: (tx, ty)}
+        Traction per unit length on tagged edges (floats or f(x, y))
+    edge_tags, solver, tol :
+        As for solve_poisson
+
+    Returns:
+    --------
+    dict with:
+    - displacement: (N, 2)
+    - stress: (T, 3) sigma_xx, sigma_yy, tau_xy per element
+    - von_mises: (T,) per element
+    - von_mises_nodal: (N,) area-weighted nodal average (for smooth colouring)
+    - info: timings, iterations and relative residual
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    if dirichlet is None:
+        dirichlet = {0: (0.0, 0.0)}
+    edges, tags = _default_edge_tags(triangles, edge_tags)
+
+    t0 = time.perf_counter()
+    K, F, B, D = assemble_plane_stress(nodes, triangles, youngs_modulus, poisson_ratio, thickness, body_force)
+    if neumann:
+        edge_nodes, edge_values = _edge_loads(nodes, edges, tags, neumann, 2)
+        for comp in range(2):
+            F[comp::2] += thickness * np.bincount(edge_nodes, weights=edge_values[:, comp], minlength=len(nodes))
+    t_assembly = time.perf_counter() - t0
+
+    fixed = np.zeros(2 * len(nodes), dtype=bool)
+    fixed_values = np.zeros(2 * len(nodes))
+    for tag, value in dirichlet.items():
+        tag_nodes = np.unique(edges[tags == tag])
+        for comp in range(2):
+            if value[comp] is None:
+                continue
+            dofs = 2 * tag_nodes + comp
+            fixed[dofs] = True
+            fixed_values[dofs] = _evaluate(value[comp], nodes[tag_nodes, 0], nodes[tag_nodes, 1])
+    if not fixed.any():
+        raise ValueError("At least one Dirichlet boundary is required")
+
+    t0 = time.perf_counter()
+    fixed_idx = np.flatnonzero(fixed)
+    u, info = _solve_constrained(K, F, fixed_idx, fixed_values[fixed_idx], solver, tol)
+    t_solve = time.perf_counter() - t0
+
+    dofs = np.repeat(2 * triangles, 2, axis=1) + np.tile([0, 1], 3)
+    stress = np.einsum('ij,tjk,tk->ti', D, B, u[dofs])
+    sx, sy, txy = stress[:, 0], stress[:, 1], stress[:, 2]
+    von_mises = np.sqrt(sx**2 - sx * sy + sy**2 + 3 * txy**2)
+
+    _, areas = _shape_gradients(nodes, triangles)
+    weight = np.bincount(triangles.ravel(), weights=np.repeat(areas, 3), minlength=len(nodes))
+    nodal = np.bincount(triangles.ravel(), weights=np.repeat(von_mises * areas, 3), minlength=len(nodes))
+    von_mises_nodal = nodal / np.maximum(weight, 1e-300)
+
+    info.update({'time_assembly': t_assembly, 'time_solve': t_solve, 'num_dofs': 2 * len(nodes)})
+    return {
+        'displacement': u.reshape(-1, 2),
+        'stress': stress,
+        'von_mises': von_mises,
+        'von_mises_nodal': von_mises_nodal,
+        'info': info,
+    }
@@ -0,0 +1,185 @@
+"""
+Hexagonal tiling of a domain with clipped boundary cells
+Lattice built as arrays, batch inside/outside classification, convex clipping
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mesh_geometry import points_in_polygon
+
+
+def clip_to_convex(subject, clipper, eps=1e-12):
+    """
+    Intersect a simple polygon with a convex polygon.
+
+    Every subject edge is clipped against all clipper half-planes at once
+    (Cyrus-Beck). The inside chains of the subject are then joined by walking
+    counter-clockwise along the clipper from each exit to the next entry, so a
+    disconnected intersection comes back as separate pieces (unlike
+    Sutherland-Hodgman, which bridges them with doubled edges).
+
+    Parameters:
+    -----------
+    subject : (n, 2) counter-clockwise outline (may be non-convex)
+    clipper : (m, 2) counter-clockwise convex outline
+
+    Returns:
+    --------
+    pieces : list of (k, 2) counter-clockwise polygons
+    """
+    subject = np.asarray(subject, dtype=float)
+    clipper = np.asarray(clipper, dtype=float)
+    m = len(clipper)
+    edge = np.roll(clipper, -1, axis=0) - clipper
+    inward = np.column_stack([-edge[:, 1], edge[:, 0]])
+
+    direction = np.roll(subject, -1, axis=0) - subject
+    # Side of each edge start and its rate of change along the edge, per half-plane
+    side = np.einsum('nmd,md->nm', subject[:, None, :] - clipper[None], inward)
+    rate = direction @ inward.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_hit = -side / rate
+    entering = rate > eps
+    leaving = rate < -eps
+    t_enter = np.max(np.where(entering, t_hit, 0.0), axis=1, initial=0.0)
+    t_leave = np.min(np.where(leaving, t_hit, 1.0), axis=1, initial=1.0)
+    # Parallel edges lying outside a half-plane have no inside portion
+    parallel_out = np.any(~entering & ~leaving & (side < 0), axis=1)
+    has_part = (t_enter < t_leave) & ~parallel_out
+
+    vertex_inside = np.all(side >= -eps * np.linalg.norm(inward, axis=1), axis=1)
+    if vertex_inside.all():
+        return [subject]
+
+    def clipper_param(point):
+        """Position along the clipper outline: edge index + fraction."""
+        rel = point - clipper
+        dist = np.abs(np.einsum('md,md->m', rel, inward)) / np.linalg.norm(inward, axis=1)
+        k = int(np.argmin(dist))
+        return k + np.clip(rel[k] @ edge[k] / (edge[k] @ edge[k]), 0.0, 1.0)
+
+    # Walk the subject starting at an outside vertex, collecting inside chains
+    n = len(subject)
+    first = int(np.flatnonzero(~vertex_inside)[0])
+    chains = []
+    current = None
+    for i in (np.arange(n) + first) % n:
+        if not has_part[i]:
+            continue
+        if t_enter[i] > eps or current is None:
+            entry = subject[i] + t_enter[i] * direction[i]
+            current = [entry]
+        if t_leave[i] < 1 - eps:
+            exit_point = subject[i] + t_leave[i] * direction[i]
+            current.append(exit_point)
+            chains.append(current)
+            current = None
+        else:
+            current.append(subject[(i + 1) % n])
+
+    if not chains:
+        # No crossings: the clipper lies wholly inside or outside the subject
+        return [clipper] if points_in_polygon(clipper.mean(axis=0)[None], subject)[0] else []
+
+    entries = np.array([clipper_param(chain[0]) for chain in chains])
+    exits = np.array([clipper_param(chain[-1]) for chain in chains])
+
+    pieces = []
+    unused = set(range(len(chains)))
+    while unused:
+        k = unused.pop()
+        piece = list(chains[k])
+        while True:
+            # Next entry counter-clockwise from this exit along the clipper
+            gap = np.mod(entries - exits[k], m)
+            nxt = int(np.argmin(gap))
+            corners = np.arange(np.floor(exits[k]) + 1, exits[k] + gap[nxt])
+            piece.extend(clipper[corners.astype(int) % m])
+            if nxt not in unused:
+                break
+            unused.remove(nxt)
+            piece.extend(chains[nxt])
+            k = nxt
+        pieces.append(np.array(piece))
+    return pieces
+
+
+def _polygon_area(points):
+    q = np.roll(points, -1, axis=0)
+    return 0.5 * np.sum(points[:, 0] * q[:, 1] - q[:, 0] * points[:, 1])
+
+
+def hexagonal_tiling(polygon, center, hex_size, merge_tol=1e-9):
+    """
+    Tile a domain with flat-top hexagons, clipping those that cross the boundary.
+
+    Hexagons whose circumcircle stays clear of the outline are kept whole (or
+    dropped) from one batch point-in-polygon call; only the cells straddling
+    the boundary are clipped, so the tiling covers the domain exactly.
+
+    Parameters:
+    -----------
+    polygon : array (n, 2) or (n, 3)
+        Closed domain outline (densely sampled, first point not repeated)
+    center : array (2,) or (3,)
+        A lattice cell is centred here
+    hex_size : float
+        Hexagon circumradius (= edge length)
+    merge_tol : float
+        Vertices closer than this (relative to hex_size) become one node
+
+    Returns:
+    --------
+    nodes : (N, 2) array
+    connectivity : list of counter-clockwise index arrays (6 for whole cells,
+        any length for clipped boundary cells)
+    """
+    poly = np.asarray(polygon, dtype=float)[:, :2]
+    if _polygon_area(poly) < 0:
+        poly = poly[::-1]
+    c = np.asarray(center, dtype=float)[:2]
+
+    # Axial lattice covering the bounding box (x = 3/2 s q, y = sqrt(3) s (q/2 + r))
+    lo, hi = poly.min(axis=0) - c, poly.max(axis=0) - c
+    q_range = np.arange(np.floor(lo[0] / (1.5 * hex_size)) - 1, np.ceil(hi[0] / (1.5 * hex_size)) + 2)
+    r_lo = np.floor(lo[1] / (np.sqrt(3) * hex_size) - q_range.max() / 2) - 1
+    r_hi = np.ceil(hi[1] / (np.sqrt(3) * hex_size) - q_range.min() / 2) + 1
+    q, r = np.meshgrid(q_range, np.arange(r_lo, r_hi + 1), indexing="ij")
+    q, r = q.ravel(), r.ravel()
+    centers = c + hex_size * np.column_stack([1.5 * q, np.sqrt(3) * (q / 2 + r)])
+
+    in_box = np.all((centers >= poly.min(axis=0) - hex_size) & (centers <= poly.max(axis=0) + hex_size), axis=1)
+    centers = centers[in_box]
+
+    # Cells farther than one circumradius from the outline are wholly in or out
+    edge_len = np.linalg.norm(np.roll(poly, -1, axis=0) - poly, axis=1).max()
+    dist, _ = cKDTree(poly).query(centers)
+    near = dist <= hex_size + edge_len
+    inside = points_in_polygon(centers, poly)
+    keep = near | inside
+    centers, near = centers[keep], near[keep]
+
+    angles = np.arange(6) * np.pi / 3  # flat-top: vertices at 0, 60, ... degrees
+    corner_offsets = hex_size * np.column_stack([np.cos(angles), np.sin(angles)])
+    hexagons = centers[:, None, :] + corner_offsets[None]
+
+    cells = []
+    for hexagon, is_near in zip(hexagons, near):
+        if not is_near:
+            cells.append(hexagon)
+            continue
+        for piece in clip_to_convex(poly, hexagon):
+            # Drop repeated points left where the outline meets a corner
+            gap = np.linalg.norm(piece - np.roll(piece, 1, axis=0), axis=1)
+            piece = piece[gap > merge_tol * hex_size]
+            if len(piece) >= 3 and _polygon_area(piece) > 1e-6 * hex_size**2:
+                cells.append(piece)
+
+    lengths = np.array([len(cell) for cell in cells], dtype=int)
+    stacked = np.vstack(cells)
+    keys = np.round(stacked / (merge_tol * 1e3 * hex_size)).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    nodes = stacked[first]
+    connectivity = np.split(inverse.ravel(), np.cumsum(lengths)[:-1])
+    return nodes, connectivity
@@ -0,0 +1,311 @@
+"""
+Meshing benchmark runner
+Times every mesher per stage over a matrix of domains, records peak memory and
+mesh quality, writes JSON and compares against a stored baseline
+
+Usage:
+    python mesh_benchmark.py --output bench.json
+    python mesh_benchmark.py --baseline bench_baseline.json --tolerance 0.25
+    python mesh_benchmark.py --quick --update-baseline --baseline bench_baseline.json
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import advanced_meshing
+import domain_2d_enhanced
+import fem_solver
+import structured_mesh
+from advanced_meshing import AdvancedFiniteElement
+from domain_2d_enhanced import CommplexElement, FiniteElement
+from mesh_geometry import triangle_angles, triangle_edge_lengths
+
+
+ADVANCED_ALGORITHMS = ["delaunay", "refined", "boundary_layer", "hybrid"]
+ELEMENT_TYPES = ["triangle", "quad", "hex"]
+NOMINAL_PERIMETER = 2 * np.pi * 2.0  # CommplexElement blobs have radius ~2
+STAGES = ["sampling", "interior_points", "triangulation", "filtering", "mobjects"]
+
+# (owner, attribute, stage): methods and module functions timed during a run.
+# "triangulation" covers the core mesher of each algorithm (Delaunay,
+# refinement, layer extrusion, TFI, hexagonal tiling).
+STAGE_HOOKS = [
+    (AdvancedFiniteElement, "_sample_boundary", "sampling"),
+    (AdvancedFiniteElement, "_get_domain_center", "sampling"),
+    (AdvancedFiniteElement, "_generate_interior_points", "interior_points"),
+    (AdvancedFiniteElement, "_point_in_polygon", "filtering"),
+    (advanced_meshing, "ScipyDelaunay", "triangulation"),
+    (advanced_meshing, "refine_delaunay", "triangulation"),
+    (advanced_meshing, "extrude_boundary_layers", "triangulation"),
+    (advanced_meshing, "points_in_polygon", "filtering"),
+    (advanced_meshing, "Polygon", "mobjects"),
+    (FiniteElement, "_sample_domain_boundary", "sampling"),
+    (FiniteElement, "_get_domain_center", "sampling"),
+    (FiniteElement, "_get_radial_profile", "sampling"),
+    (FiniteElement, "_point_in_polygon", "filtering"),
+    (FiniteElement, "_clip_point_to_boundary", "filtering"),
+    (structured_mesh, "polar_tfi_mesh", "triangulation"),
+    (structured_mesh, "untangled_coons_quad_mesh", "triangulation"),
+    (domain_2d_enhanced, "hexagonal_tiling", "triangulation"),
+    (domain_2d_enhanced, "Polygon", "mobjects"),
+]
+
+
+class StageTimer:
+    """
+    Exclusive wall time per stage.
+
+    Nested timed calls (e.g. sampling inside filtering) are charged to the
+    innermost stage only, so the stages add up to at most the total.
+    """
+
+    def __init__(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self._stack = []
+
+    def wrap(self, func, stage):
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = self._stack.pop()
+                self.totals[stage] += elapsed - children
+                self.calls[stage] += 1
+                if self._stack:
+                    self._stack[-1] += elapsed
+        return timed
+
+    @contextlib.contextmanager
+    def installed(self):
+        """Temporarily route every STAGE_HOOKS target through the timer."""
+        originals = [(owner, name, owner.__dict__[name]) for owner, name, _ in STAGE_HOOKS]
+        try:
+            for (owner, name, stage), (_, _, original) in zip(STAGE_HOOKS, originals):
+                setattr(owner, name, self.wrap(original, stage))
+            yield self
+        finally:
+            for owner, name, original in originals:
+                setattr(owner, name, original)
+
+
+def mesh_quality_stats(nodes, connectivity):
+    """
+    Quality summary with the same keys as AdvancedFiniteElement.get_quality_stats.
+
+    Polygons are split into triangles first (fan or ear clipping), so quads
+    and hexagons are measured on the triangles a solver would see.
+    """
+    triangles, _ = fem_solver.triangulate_polygons(connectivity, nodes)
+    edges = triangle_edge_lengths(nodes, triangles)
+    shortest = edges.min(axis=1)
+    aspect_ratios = np.full(len(edges), 100.0)
+    np.divide(edges.max(axis=1), shortest, out=aspect_ratios, where=shortest > 1e-10)
+    min_angles = triangle_angles(nodes, triangles).min(axis=1)
+    quality = np.clip((min_angles / 60.0 + 1.0 / aspect_ratios) / 2, 0, 1)
+    return {
+        'num_elements': len(connectivity),
+        'avg_quality': float(np.mean(quality)),
+        'min_quality': float(np.min(quality)),
+        'avg_aspect_ratio': float(np.mean(aspect_ratios)),
+        'max_aspect_ratio': float(np.max(aspect_ratios)),
+        'avg_min_angle': float(np.mean(min_angles)),
+        'min_angle_overall': float(np.min(min_angles)),
+    }
+
+
+def build_case(case, domain):
+    """Construct the mesh for one benchmark case (cache disabled)."""
+    if case['mesher'] == "AdvancedFiniteElement":
+        return AdvancedFiniteElement(
+            base_domain=domain,
+            mesh_algorithm=case['variant'],
+            target_element_size=case['size'],
+            seed=case['seed'],
+            use_cache=False,
+        )
+    # Radial/angular divisions giving roughly the same element size on a radius-2 blob
+    return FiniteElement(
+        base_domain=domain,
+        element_type=case['variant'],
+        num_radial=max(2, int(round(2.0 / case['size']))),
+        num_angular=max(6, int(round(NOMINAL_PERIMETER / case['size']))),
+        use_cache=False,
+    )
+
+
+def run_case(case, repeat=1, measure_memory=True):
+    """
+    Time one case (best of `repeat`), then measure peak memory in a separate run.
+
+    Returns:
+    --------
+    dict : case parameters, per-stage times, total time, peak memory, quality
+    """
+    def fresh_domain():
+        # Built outside the timed region; a new one per run so no sampling tables are reused
+        return CommplexElement(irregularity=case['irregularity'], seed=case['seed'])
+
+    best = None
+    for _ in range(repeat):
+        timer = StageTimer()
+        domain = fresh_domain()
+        with timer.installed():
+            start = time.perf_counter()
+            mesh = build_case(case, domain)
+            total = time.perf_counter() - start
+        if best is None or total < best[0]:
+            best = (total, timer, mesh)
+    total, timer, mesh = best
+
+    peak_mb = None
+    if measure_memory:
+        # tracemalloc slows allocation-heavy code down, so it gets its own run
+        domain = fresh_domain()
+        tracemalloc.start()
+        build_case(case, domain)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / 2**20
+
+    if isinstance(mesh, AdvancedFiniteElement):
+        # Plain JSON numbers; counts stay ints so baselines diff cleanly
+        quality = {
+            k: int(v) if isinstance(v, (int, np.integer)) else float(v)
+            for k, v in mesh.get_quality_stats().items()
+        }
+    else:
+        nodes, connectivity = mesh.get_mesh_arrays()
+        quality = mesh_quality_stats(nodes, connectivity)
+
+    stages = {stage: timer.totals[stage] for stage in STAGES}
+    stages['other'] = max(total - sum(stages.values()), 0.0)
+    return dict(case, time_total=total, stages=stages, calls=timer.calls,
+                peak_memory_mb=peak_mb, quality=quality)
+
+
+def case_matrix(irregularities, seeds, sizes, meshers=None):
+    """Every (mesher variant, irregularity, seed, size) combination."""
+    variants = [("AdvancedFiniteElement", a) for a in ADVANCED_ALGORITHMS]
+    variants += [("FiniteElement", t) for t in ELEMENT_TYPES]
+    if meshers:
+        variants = [(m, v) for m, v in variants if v in meshers or m in meshers]
+    return [
+        {'mesher': mesher, 'variant': variant, 'irregularity': irr, 'seed': seed, 'size': size}
+        for (mesher, variant), irr, seed, size in itertools.product(variants, irregularities, seeds, sizes)
+    ]
+
+
+def case_key(record):
+    return (record['mesher'], record['variant'], record['irregularity'], record['seed'], record['size'])
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, quality_tolerance=0.02, noise_floor=0.005):
+    """
+    Find regressions relative to a baseline run.
+
+    A case regresses when its total time grows by more than `tolerance`
+    (relative, ignoring differences under `noise_floor` seconds) or its
+    average quality drops by more than `quality_tolerance`.
+
+    Returns:
+    --------
+    list of (record, reason) for regressed cases
+    """
+    previous = {case_key(r): r for r in baseline['results']}
+    regressions = []
+    for record in results:
+        base = previous.get(case_key(record))
+        if base is None:
+            continue
+        slower = record['time_total'] - base['time_total']
+        if slower > noise_floor and record['time_total'] > base['time_total'] * (1 + tolerance):
+            regressions.append((record, f"time {base['time_total']:.3f}s -> {record['time_total']:.3f}s"))
+        drop = base['quality']['avg_quality'] - record['quality']['avg_quality']
+        if drop > quality_tolerance:
+            regressions.append((record, f"avg quality {base['quality']['avg_quality']:.3f} -> "
+                                        f"{record['quality']['avg_quality']:.3f}"))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fem meshers")
+    parser.add_argument("--output", default="mesh_benchmark.json", help="JSON results file")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown before a case counts as a regression")
+    parser.add_argument("--quality-tolerance", type=float, default=0.02,
+                        help="Allowed drop in average element quality")
+    parser.add_argument("--irregularities", type=float, nargs="+", default=[0.15, 0.3])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.4, 0.25])
+    parser.add_argument("--meshers", nargs="+",
+                        help="Restrict to these algorithms / element types / classes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak-memory run")
+    parser.add_argument("--quick", action="store_true", help="One irregularity, seed and size")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.irregularities, args.seeds, args.sizes, args.repeat = [0.25], [42], [0.3], 1
+
+    cases = case_matrix(args.irregularities, args.seeds, args.sizes, args.meshers)
+    results = []
+    for i, case in enumerate(cases, 1):
+        record = run_case(case, repeat=args.repeat, measure_memory=not args.no_memory)
+        results.append(record)
+        stages = ", ".join(f"{k} {v * 1e3:.0f}ms" for k, v in record['stages'].items() if v >= 5e-4)
+        print(f"[{i}/{len(cases)}] {case['mesher']}:{case['variant']} irr={case['irregularity']} "
+              f"seed={case['seed']} size={case['size']}: {record['time_total']:.3f}s "
+              f"({stages}), {record['quality']['num_elements']} elements, "
+              f"avg quality {record['quality']['avg_quality']:.3f}")
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+
+    if args.update_baseline and args.baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.quality_tolerance)
+        for record, reason in regressions:
+            print(f"✗ {record['mesher']}:{record['variant']} irr={record['irregularity']} "
+                  f"seed={record['seed']} size={record['size']}: {reason}")
+        if regressions:
+            return 1
+        print(f"✓ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
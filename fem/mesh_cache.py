@@ -0,0 +1,139 @@
+"""
+Content-addressed mesh cache and compact on-disk mesh format
+Meshes are stored as .npz: float32 nodes, int32 connectivity, boundary tags, quality
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from mesh_smoothing import boundary_nodes, corner_records
+
+
+MESH_FORMAT_VERSION = 1
+
+# Override with the MESH_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mesh_cache")
+
+
+def mesh_cache_key(outline_points, params, source_files=()):
+    """
+    Hash everything a generated mesh depends on.
+
+    Parameters:
+    -----------
+    outline_points : array
+        Domain outline (e.g. complex_domain.get_all_points()); hashing the
+        geometry itself covers control points, irregularity and domain seed
+    params : dict
+        Algorithm name, sizes, seed, ... (JSON-serializable)
+    source_files : iterable of paths
+        Generator sources; editing them invalidates old entries
+
+    Returns:
+    --------
+    key : str (hex digest)
+    """
+    digest = hashlib.sha256()
+    digest.update(f"mesh-format-{MESH_FORMAT_VERSION}".encode())
+    outline = np.ascontiguousarray(np.round(np.asarray(outline_points, dtype=float), 9))
+    digest.update(outline.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    for path in source_files:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def cache_path(key, cache_dir=None):
+    """Location of the cache entry for a key."""
+    if cache_dir is None:
+        cache_dir = os.environ.get("MESH_CACHE_DIR", DEFAULT_CACHE_DIR)
+    return os.path.join(cache_dir, f"{key}.npz")
+
+
+def save_mesh(path, nodes, connectivity, quality=None, extras=None, meta=None):
+    """
+    Write a mesh as compact .npz.
+
+    Parameters:
+    -----------
+    nodes : (N, 2) or (N, 3) array (stored as float32 x, y)
+    connectivity : (E, k) array or list of index arrays (stored flat as int32)
+    quality : (E,) array or None (stored as float32)
+    extras : dict of arrays or None
+        Additional arrays, e.g. refinement history
+    meta : dict or None
+        JSON-serializable metadata (algorithm, statistics, ...)
+    """
+    nodes = np.asarray(nodes)
+    elem, flat, _, _ = corner_records(connectivity)
+    lengths = np.bincount(elem)
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+
+    arrays = {
+        'nodes': nodes[:, :2].astype(np.float32),
+        'connectivity': flat.astype(np.int32),
+        'offsets': offsets,
+        'boundary_tags': boundary_nodes(len(nodes), connectivity).astype(np.uint8),
+        'meta': np.array(json.dumps(meta or {}, default=float)),
+    }
+    if quality is not None:
+        arrays['quality'] = np.asarray(quality, dtype=np.float32)
+    for name, value in (extras or {}).items():
+        arrays[f'extra_{name}'] = np.asarray(value)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write then rename so a crashed render never leaves a truncated entry
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_mesh(path):
+    """
+    Read a mesh written by save_mesh.
+
+    Returns:
+    --------
+    dict with nodes (N, 2) float64, connectivity ((E, k) array when all
+    elements have k corners, else list of arrays), boundary_tags, quality
+    (or None), extras (dict) and meta (dict)
+    """
+    with np.load(path) as data:
+        offsets = data['offsets']
+        flat = data['connectivity'].astype(np.intp)
+        lengths = np.diff(offsets)
+        if len(lengths) and np.all(lengths == lengths[0]):
+            connectivity = flat.reshape(len(lengths), lengths[0])
+        else:
+            connectivity = np.split(flat, offsets[1:-1])
+
+        return {
+            'nodes': data['nodes'].astype(float),
+            'connectivity': connectivity,
+            'boundary_tags': data['boundary_tags'].astype(bool),
+            'quality': data['quality'] if 'quality' in data else None,
+            'extras': {name[len('extra_'):]: data[name] for name in data.files if name.startswith('extra_')},
+            'meta': json.loads(str(data['meta'])),
+        }
+
+
+def load_cached_mesh(key, cache_dir=None):
+    """Load a cache entry, or return None on a miss (or unreadable entry)."""
+    path = cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        return load_mesh(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store_cached_mesh(key, nodes, connectivity, cache_dir=None, **kwargs):
+    """Save a mesh under its cache key (kwargs as for save_mesh)."""
+    save_mesh(cache_path(key, cache_dir), nodes, connectivity, **kwargs)
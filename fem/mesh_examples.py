@@ -376,6 +376,84 @@ class AspectRatioComparison(Scene):
         self.add(mesh, title, guide, stats_text, legend)
 
 
+class DelaunayRefinement(Scene):
+    """
+    Play back quality-driven Delaunay refinement pass by pass.
+    
+    Key Learning: Inserting circumcentres of bad triangles guarantees a minimum angle
+    """
+    
+    def construct(self):
+        domain = CommplexElement(irregularity=0.3, seed=100)
+        
+        mesh = AdvancedFiniteElement(
+            base_domain=domain,
+            mesh_algorithm="refined",
+            target_element_size=0.35,
+            min_angle=28,
+            mesh_color=GREEN,
+            show_domain=True,
+        )
+        
+        title = Text("Delaunay Refinement", font_size=28).to_edge(UP)
+        
+        refinement = mesh.refinement_stats
+        stats = mesh.get_quality_stats()
+        stats_text = VGroup(
+            Text(f"Passes: {refinement['iterations']}", font_size=16),
+            Text(f"Elements: {stats['num_elements']}", font_size=16),
+            Text(f"Min Angle: {stats['min_angle_overall']:.1f}°", font_size=16),
+            Text(f"Time: {refinement['time_total'] * 1000:.0f} ms", font_size=16, color=GRAY),
+        ).arrange(DOWN, buff=0.15, aligned_edge=LEFT).to_corner(DL)
+        
+        self.add(title)
+        self.play(mesh.get_refinement_animation(run_time=4))
+        self.play(FadeIn(stats_text))
+        self.wait()
+
+
+class MeshSmoothing(Scene):
+    """
+    Show Laplacian smoothing improving a Delaunay mesh in place.
+    
+    Key Learning: A few cheap smoothing passes noticeably raise element quality
+    """
+    
+    def construct(self):
+        domain = CommplexElement(irregularity=0.3, seed=7)
+        
+        mesh = AdvancedFiniteElement(
+            base_domain=domain,
+            mesh_algorithm="delaunay",
+            target_element_size=0.3,
+            show_domain=True,
+            domain_color=WHITE,
+        )
+        mesh.color_by_quality(metric="quality", color_range=[RED, GREEN])
+        
+        title = Text("Laplacian Smoothing", font_size=28).to_edge(UP)
+        
+        before = mesh.get_quality_stats()
+        before_text = Text(
+            f"Before: quality {before['avg_quality']:.3f}, min angle {before['min_angle_overall']:.1f}°",
+            font_size=16,
+        ).to_corner(DL)
+        
+        self.add(mesh, title, before_text)
+        self.play(mesh.get_smoothing_animation(iterations=8, run_time=3))
+        mesh.color_by_quality(metric="quality", color_range=[RED, GREEN])
+        
+        after = mesh.get_quality_stats()
+        after_text = Text(
+            f"After: quality {after['avg_quality']:.3f}, min angle {after['min_angle_overall']:.1f}°",
+            font_size=16,
+            color=GREEN,
+        ).next_to(before_text, UP, aligned_edge=LEFT)
+        
+        self.play(FadeIn(after_text))
+        self.wait()
+
+
 # ==========================================
 # Render commands:
 # ==========================================
@@ -396,4 +474,10 @@ class AspectRatioComparison(Scene):
 #   manim -pql mesh_examples.py OptimalElementSize
 # 
 # Aspect ratio:
-#   manim -pql mesh_examples.py AspectRatioComparison
\ No newline at end of file
+#   manim -pql mesh_examples.py AspectRatioComparison
+# 
+# Delaunay refinement:
+#   manim -pql mesh_examples.py DelaunayRefinement
+# 
+# Mesh smoothing:
+#   manim -pql mesh_examples.py MeshSmoothing
\ No newline at end of file
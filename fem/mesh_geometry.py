@@ -0,0 +1,99 @@
+"""
+Vectorized geometry helpers shared by the meshing modules
+Includes: batch point-in-polygon, triangle angles, circumcircles
+"""
+
+import numpy as np
+
+
+def points_in_polygon(points, polygon, chunk_size=1 << 20):
+    """
+    Even-odd ray casting test for many points at once.
+
+    Parameters:
+    -----------
+    points : array (n, 2) or (n, 3)
+        Query points (only x, y are used)
+    polygon : array (m, 2) or (m, 3)
+        Closed polygon outline (first point need not be repeated)
+    chunk_size : int
+        Upper bound on the size of the (points x edges) work arrays
+
+    Returns:
+    --------
+    inside : bool array (n,)
+    """
+    pts = np.asarray(points, dtype=float)[:, :2]
+    poly = np.asarray(polygon, dtype=float)[:, :2]
+
+    x1, y1 = poly[:, 0], poly[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    dy = y2 - y1
+    # Horizontal edges never cross the ray; avoid dividing by zero
+    slope = np.divide(x2 - x1, dy, out=np.zeros_like(dy), where=dy != 0)
+
+    inside = np.zeros(len(pts), dtype=bool)
+    rows = max(1, chunk_size // max(len(poly), 1))
+    for start in range(0, len(pts), rows):
+        x = pts[start:start + rows, 0, None]
+        y = pts[start:start + rows, 1, None]
+        crosses = (y1 > y) != (y2 > y)
+        x_int = x1 + (y - y1) * slope
+        hits = np.count_nonzero(crosses & (x < x_int), axis=1)
+        inside[start:start + rows] = hits % 2 == 1
+
+    return inside
+
+
+def triangle_edge_lengths(points, triangles):
+    """Edge lengths (T, 3); column k is the edge opposite vertex k."""
+    p = np.asarray(points)[:, :2][triangles]
+    a = np.linalg.norm(p[:, 2] - p[:, 1], axis=1)
+    b = np.linalg.norm(p[:, 0] - p[:, 2], axis=1)
+    c = np.linalg.norm(p[:, 1] - p[:, 0], axis=1)
+    return np.column_stack([a, b, c])
+
+
+def triangle_angles(points, triangles):
+    """Interior angles in degrees (T, 3); column k is the angle at vertex k."""
+    edges = triangle_edge_lengths(points, triangles)
+    a, b, c = edges[:, 0], edges[:, 1], edges[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_a = (b**2 + c**2 - a**2) / (2 * b * c)
+        cos_b = (c**2 + a**2 - b**2) / (2 * c * a)
+    angle_a = np.degrees(np.arccos(np.clip(np.nan_to_num(cos_a, nan=1.0), -1, 1)))
+    angle_b = np.degrees(np.arccos(np.clip(np.nan_to_num(cos_b, nan=1.0), -1, 1)))
+    angle_c = 180.0 - angle_a - angle_b
+    return np.column_stack([angle_a, angle_b, angle_c])
+
+
+def triangle_areas(points, triangles):
+    """Unsigned triangle areas (T,)."""
+    p = np.asarray(points)[:, :2][triangles]
+    d1 = p[:, 1] - p[:, 0]
+    d2 = p[:, 2] - p[:, 0]
+    return 0.5 * np.abs(d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0])
+
+
+def circumcircles(points, triangles):
+    """
+    Circumcentres (T, 2) and circumradii (T,) of triangles.
+
+    Degenerate (zero-area) triangles get an infinite radius.
+    """
+    p = np.asarray(points)[:, :2][triangles]
+    a = p[:, 0]
+    b = p[:, 1] - a
+    c = p[:, 2] - a
+    d = 2.0 * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+    b2 = np.sum(b**2, axis=1)
+    c2 = np.sum(c**2, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ux = (c[:, 1] * b2 - b[:, 1] * c2) / d
+        uy = (b[:, 0] * c2 - c[:, 0] * b2) / d
+    centers = a + np.column_stack([ux, uy])
+    radii = np.hypot(ux, uy)
+    degenerate = np.abs(d) < 1e-14
+    radii[degenerate] = np.inf
+    centers[degenerate] = p[degenerate].mean(axis=1)
+    return centers, radii
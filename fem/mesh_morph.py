@@ -0,0 +1,133 @@
+"""
+Coarse-to-fine mesh morphing
+Includes: parent lookup for refined elements, start geometry inside the parent,
+flat Bezier point buffers for per-frame interpolation
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mesh_smoothing import corner_records
+
+
+def _element_layout(connectivity):
+    """Corner records plus per-element corner counts and offsets."""
+    elem, node, prv, nxt = corner_records(connectivity)
+    lengths = np.bincount(elem)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return elem, node, nxt, lengths, offsets
+
+
+def _expand_pairs(pair_elem, lengths, offsets):
+    """For (query, element) pairs, one row per element edge: (pair index, corner index)."""
+    counts = lengths[pair_elem]
+    pair_idx = np.repeat(np.arange(len(pair_elem)), counts)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    corner_idx = offsets[pair_elem][pair_idx] + np.arange(counts.sum()) - starts[pair_idx]
+    return pair_idx, corner_idx
+
+
+def locate_parents(points, nodes, connectivity, k=8):
+    """
+    Index of the element containing each point.
+
+    Candidates are the k elements with the nearest centroids; each (point,
+    candidate) pair gets an even-odd crossing count over the candidate's edges.
+    Points outside every candidate fall back to the nearest centroid.
+    """
+    points = np.asarray(points, dtype=float)[:, :2]
+    nodes = np.asarray(nodes, dtype=float)[:, :2]
+    elem, node, nxt, lengths, offsets = _element_layout(connectivity)
+    centroids = np.column_stack([
+        np.bincount(elem, weights=nodes[node, d]) / lengths for d in range(2)
+    ])
+
+    k = min(k, len(lengths))
+    _, candidates = cKDTree(centroids).query(points, k=k)
+    candidates = candidates.reshape(len(points), k)
+
+    pair_elem = candidates.ravel()
+    pair_point = np.repeat(np.arange(len(points)), k)
+    pair_idx, corner_idx = _expand_pairs(pair_elem, lengths, offsets)
+
+    a, b = nodes[node[corner_idx]], nodes[nxt[corner_idx]]
+    p = points[pair_point[pair_idx]]
+    dy = b[:, 1] - a[:, 1]
+    straddle = (a[:, 1] > p[:, 1]) != (b[:, 1] > p[:, 1])
+    x_int = a[:, 0] + (p[:, 1] - a[:, 1]) * np.divide(b[:, 0] - a[:, 0], dy, out=np.zeros_like(dy), where=dy != 0)
+    crossings = np.bincount(pair_idx, weights=straddle & (p[:, 0] < x_int), minlength=len(pair_elem))
+
+    inside = (crossings.reshape(len(points), k) % 2) == 1
+    first = np.where(inside.any(axis=1), inside.argmax(axis=1), 0)
+    return candidates[np.arange(len(points)), first]
+
+
+def parent_start_corners(coarse_nodes, coarse_connectivity, fine_nodes, fine_connectivity):
+    """
+    Start position of every fine element corner on its parent's outline.
+
+    Each fine element's parent is the coarse element containing its centroid.
+    Corners are pushed radially from the parent centroid onto the parent
+    outline, so all children of one parent start as (roughly) that parent and
+    then contract into place.
+
+    Returns:
+    --------
+    start : (C, 2) array in the corner order of corner_records(fine_connectivity)
+    """
+    coarse_nodes = np.asarray(coarse_nodes, dtype=float)[:, :2]
+    fine_nodes = np.asarray(fine_nodes, dtype=float)[:, :2]
+    f_elem, f_node, _, f_lengths, _ = _element_layout(fine_connectivity)
+    c_elem, c_node, c_nxt, c_lengths, c_offsets = _element_layout(coarse_connectivity)
+
+    fine_centroids = np.column_stack([
+        np.bincount(f_elem, weights=fine_nodes[f_node, d]) / f_lengths for d in range(2)
+    ])
+    parents = locate_parents(fine_centroids, coarse_nodes, coarse_connectivity)
+    parent_centroids = np.column_stack([
+        np.bincount(c_elem, weights=coarse_nodes[c_node, d]) / c_lengths for d in range(2)
+    ])
+
+    corner_parent = parents[f_elem]
+    origin = parent_centroids[corner_parent]
+    direction = fine_nodes[f_node] - origin
+
+    # Ray from the parent centroid through the corner against each parent edge
+    pair_idx, edge_idx = _expand_pairs(corner_parent, c_lengths, c_offsets)
+    a, b = coarse_nodes[c_node[edge_idx]], coarse_nodes[c_nxt[edge_idx]]
+    d, o, e = direction[pair_idx], origin[pair_idx], b - a
+    denom = d[:, 0] * e[:, 1] - d[:, 1] * e[:, 0]
+    w = a - o
+    safe = np.abs(denom) > 1e-12
+    denom = np.where(safe, denom, 1.0)
+    t = (w[:, 0] * e[:, 1] - w[:, 1] * e[:, 0]) / denom
+    u = (w[:, 0] * d[:, 1] - w[:, 1] * d[:, 0]) / denom
+    hit = safe & (t > 0) & (u >= 0) & (u <= 1)
+
+    reach = np.full(len(f_node), np.inf)
+    np.minimum.at(reach, pair_idx[hit], t[hit])
+    reach[~np.isfinite(reach)] = 1.0
+    return origin + reach[:, None] * direction
+
+
+def edge_bezier_points(corners, lengths):
+    """
+    Polygon points (4 per edge, straight cubic segments) for flat corner arrays.
+
+    Parameters:
+    -----------
+    corners : (C, 3) corner positions, elements stored one after another
+    lengths : (E,) corners per element
+
+    Returns:
+    --------
+    points : (4 * C, 3); element e owns rows 4 * offsets[e] : 4 * (offsets[e] + lengths[e])
+    """
+    lengths = np.asarray(lengths)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    elem = np.repeat(np.arange(len(lengths)), lengths)
+    pos = np.arange(len(corners)) - offsets[elem]
+    nxt = offsets[elem] + (pos + 1) % lengths[elem]
+    weights = np.linspace(0, 1, 4)[:, None]
+    points = corners[:, None, :] * (1 - weights) + corners[nxt][:, None, :] * weights
+    return points.reshape(-1, corners.shape[1])
@@ -0,0 +1,375 @@
+"""
+Quality-driven Delaunay refinement (Ruppert / Chew)
+Boundary recovery by segment splitting (or by edge flips when the boundary nodes are
+fixed), circumcentre insertion, incremental re-triangulation
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+from scipy.spatial import Delaunay as ScipyDelaunay
+from scipy.spatial import cKDTree
+
+from mesh_geometry import points_in_polygon, triangle_angles, circumcircles
+
+
+def _clean_boundary(boundary_points, tol=1e-9):
+    """Drop repeated consecutive points (and a repeated closing point)."""
+    pts = np.asarray(boundary_points, dtype=float)[:, :2]
+    keep = np.ones(len(pts), dtype=bool)
+    keep[1:] = np.linalg.norm(np.diff(pts, axis=0), axis=1) > tol
+    pts = pts[keep]
+    if len(pts) > 1 and np.linalg.norm(pts[0] - pts[-1]) <= tol:
+        pts = pts[:-1]
+    return pts
+
+
+def _encroached_by_vertices(points, segments):
+    """Segments whose diametral circle contains a vertex other than its endpoints."""
+    a, b = points[segments[:, 0]], points[segments[:, 1]]
+    mid = 0.5 * (a + b)
+    radius = 0.5 * np.linalg.norm(b - a, axis=1)
+    k = min(3, len(points))
+    dist, idx = cKDTree(points).query(mid, k=k)
+    dist = dist.reshape(len(segments), k)
+    idx = idx.reshape(len(segments), k)
+    other = (idx != segments[:, :1]) & (idx != segments[:, 1:])
+    return np.any(other & (dist < radius[:, None] * (1 - 1e-9)), axis=1)
+
+
+def _segments_encroached_by(candidates, points, segments):
+    """
+    For each candidate point, find the segments whose diametral circle contains it.
+
+    Returns (hit_mask over candidates, unique indices of encroached segments).
+    """
+    a, b = points[segments[:, 0]], points[segments[:, 1]]
+    mid = 0.5 * (a + b)
+    radius = 0.5 * np.linalg.norm(b - a, axis=1)
+
+    neighbours = cKDTree(mid).query_ball_point(candidates, r=radius.max(), return_sorted=False)
+    counts = np.fromiter((len(n) for n in neighbours), dtype=int, count=len(candidates))
+    if counts.sum() == 0:
+        return np.zeros(len(candidates), dtype=bool), np.empty(0, dtype=int)
+
+    cand_idx = np.repeat(np.arange(len(candidates)), counts)
+    seg_idx = np.concatenate([n for n in neighbours if n]).astype(int)
+    hit = np.linalg.norm(candidates[cand_idx] - mid[seg_idx], axis=1) < radius[seg_idx]
+
+    hit_mask = np.zeros(len(candidates), dtype=bool)
+    hit_mask[cand_idx[hit]] = True
+    return hit_mask, np.unique(seg_idx[hit])
+
+
+def _separate_candidates(centers, radii, priority):
+    """Keep only one of any two circumcentres closer than half the smaller radius."""
+    if len(centers) < 2:
+        return np.ones(len(centers), dtype=bool)
+    pairs = cKDTree(centers).query_pairs(r=0.5 * radii.max(), output_type="ndarray")
+    keep = np.ones(len(centers), dtype=bool)
+    if len(pairs) == 0:
+        return keep
+    i, j = pairs[:, 0], pairs[:, 1]
+    close = np.linalg.norm(centers[i] - centers[j], axis=1) < 0.5 * np.minimum(radii[i], radii[j])
+    i, j = i[close], j[close]
+    # The lower-priority point of each close pair is deferred to the next pass
+    loser = np.where(priority[i] <= priority[j], j, i)
+    keep[loser] = False
+    return keep
+
+
+def _orient(p, q, r):
+    """Twice the signed area of triangle (p, q, r); positive when counter-clockwise."""
+    return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+
+def _crosses(points, a, b, c, d):
+    """Whether segments a-b and c-d cross at a point interior to both."""
+    p = points
+    return (_orient(p[a], p[b], p[c]) * _orient(p[a], p[b], p[d]) < 0 and
+            _orient(p[c], p[d], p[a]) * _orient(p[c], p[d], p[b]) < 0)
+
+
+def _in_circumcircle(p, a, b, c, d):
+    """Whether d lies strictly inside the circumcircle of counter-clockwise (a, b, c)."""
+    rows = [(p[k][0] - p[d][0], p[k][1] - p[d][1]) for k in (a, b, c)]
+    m = [(x, y, x * x + y * y) for x, y in rows]
+    det = (m[0][0] * (m[1][1] * m[2][2] - m[2][1] * m[1][2])
+           - m[0][1] * (m[1][0] * m[2][2] - m[2][0] * m[1][2])
+           + m[0][2] * (m[1][0] * m[2][1] - m[2][0] * m[1][1]))
+    return det > 0
+
+
+def recover_segments(points, simplices, segments):
+    """
+    Constrained Delaunay triangulation by edge flips (Sloan's algorithm).
+
+    Every edge crossing a missing segment is flipped (deferred while its two
+    triangles form a non-convex quad) until the segment is an edge; the flipped
+    edges are then restored to Delaunay unless they are segments themselves.
+    No points are added.
+
+    Parameters:
+    -----------
+    points : array (N, 2)
+        Node coordinates
+    simplices : array (T, 3)
+        A triangulation covering the segments (e.g. every Delaunay simplex)
+    segments : array (S, 2)
+        Edges that must appear; they may share end points but not cross
+
+    Returns:
+    --------
+    triangles : (T', 3) counter-clockwise triangles containing every segment
+        (flat simplices dropped)
+    """
+    p = np.asarray(points, dtype=float)[:, :2]
+    corners = p[simplices]
+    area2 = (corners[:, 1, 0] - corners[:, 0, 0]) * (corners[:, 2, 1] - corners[:, 0, 1]) - \
+            (corners[:, 1, 1] - corners[:, 0, 1]) * (corners[:, 2, 0] - corners[:, 0, 0])
+    scale = np.sum((corners[:, 1] - corners[:, 0]) ** 2, axis=1)
+    solid = np.abs(area2) > 1e-10 * scale
+    tris = np.array(simplices)[solid]
+    tris[area2[solid] < 0] = tris[area2[solid] < 0][:, [0, 2, 1]]
+
+    # Directed edge -> triangle holding it (counter-clockwise)
+    owner = {}
+    for t, (a, b, c) in enumerate(tris.tolist()):
+        owner[(a, b)] = owner[(b, c)] = owner[(c, a)] = t
+    constrained = {(int(a), int(b)) for a, b in segments} | {(int(b), int(a)) for a, b in segments}
+    missing = [(int(a), int(b)) for a, b in segments if (int(a), int(b)) not in owner and (int(b), int(a)) not in owner]
+    if not missing:
+        return tris
+
+    pts = p.tolist()
+    tri_list = tris.tolist()
+
+    def flip(u, v):
+        """Flip edge u-v; returns the new edge (w, x)."""
+        t1, t2 = owner.pop((u, v)), owner.pop((v, u))
+        w = next(k for k in tri_list[t1] if k != u and k != v)
+        x = next(k for k in tri_list[t2] if k != u and k != v)
+        tri_list[t1], tri_list[t2] = [u, x, w], [x, v, w]
+        owner[(u, x)] = owner[(x, w)] = owner[(w, u)] = t1
+        owner[(x, v)] = owner[(v, w)] = owner[(w, x)] = t2
+        return w, x
+
+    def opposite(u, v):
+        """Apexes of the triangles on either side of edge u-v."""
+        w = next(k for k in tri_list[owner[(u, v)]] if k != u and k != v)
+        x = next(k for k in tri_list[owner[(v, u)]] if k != u and k != v)
+        return w, x
+
+    created = []
+    for a, b in missing:
+        edges = {(min(u, v), max(u, v)) for u, v in owner}
+        queue = deque(e for e in edges if a not in e and b not in e and _crosses(pts, a, b, *e))
+        stalled = 0
+        while queue:
+            u, v = queue.popleft()
+            w, x = opposite(u, v)
+            if not _crosses(pts, u, v, w, x):
+                # Non-convex quad: come back once its neighbours have moved
+                queue.append((u, v))
+                stalled += 1
+                if stalled > 4 * len(queue) + 16:
+                    raise RuntimeError(f"Could not recover boundary segment {a}-{b}")
+                continue
+            stalled = 0
+            w, x = flip(u, v)
+            if a not in (w, x) and b not in (w, x) and _crosses(pts, a, b, w, x):
+                queue.append((w, x))
+            else:
+                created.append((w, x))
+
+    # Lawson flips on the new edges restore the Delaunay property around them
+    stack = [e for e in created if e not in constrained]
+    while stack:
+        u, v = stack.pop()
+        if (u, v) not in owner or (v, u) not in owner or (u, v) in constrained:
+            continue
+        w, x = opposite(u, v)
+        if _in_circumcircle(pts, u, v, w, x):
+            flip(u, v)
+            stack.extend([(u, x), (x, v), (v, w), (w, u)])
+
+    return np.array(tri_list, dtype=int)
+
+
+def refine_delaunay(
+    boundary_points,
+    interior_points=None,
+    target_size=0.3,
+    size_function=None,
+    min_angle=25.0,
+    max_iterations=60,
+    split_boundary=True,
+):
+    """
+    Refine a Delaunay triangulation until quality and size criteria are met.
+
+    Batched Ruppert refinement:
+    - Boundary segments encroached by a vertex are split at their midpoint,
+      which recovers every boundary edge (conforming Delaunay)
+    - Circumcentres of bad triangles (min angle too small or too large for the
+      local target size) are inserted, unless they encroach a segment, in which
+      case the segment is split instead
+    - New points are added to the existing Qhull triangulation incrementally
+
+    Parameters:
+    -----------
+    boundary_points : array (n, 2) or (n, 3)
+        Closed domain outline, in order
+    interior_points : array (k, 2) or None
+        Optional seed points inside the domain
+    target_size : float
+        Target element edge length (used when size_function is None)
+    size_function : callable or None
+        Vectorized f(x, y) -> local target edge length
+    min_angle : float
+        Minimum angle in degrees (keep below ~30 to guarantee termination)
+    max_iterations : int
+        Safety limit on refinement passes
+    split_boundary : bool
+        If False the boundary nodes are kept exactly as given (e.g. to stitch
+        onto an existing mesh): encroached segments are never split,
+        circumcentres encroaching them are skipped, and boundary edges the
+        Delaunay triangulation misses are recovered by edge flips
+
+    Returns:
+    --------
+    dict with:
+    - nodes: (N, 2) final node coordinates
+    - triangles: (T, 3) triangles inside the domain
+    - segments: (S, 2) recovered boundary segments (node indices)
+    - history: list of (num_points, triangles) per pass; points of pass k
+      are nodes[:num_points] since insertion only ever appends
+    - stats: iterations, point counts and timing per stage
+    """
+    t_start = time.perf_counter()
+
+    polygon = _clean_boundary(boundary_points)
+    n_boundary = len(polygon)
+    segments = np.column_stack([np.arange(n_boundary), (np.arange(n_boundary) + 1) % n_boundary])
+
+    points = polygon
+    if interior_points is not None and len(interior_points) > 0:
+        interior = np.asarray(interior_points, dtype=float)[:, :2]
+        interior = interior[points_in_polygon(interior, polygon)]
+        points = np.vstack([polygon, interior])
+
+    def local_size(xy):
+        if size_function is None:
+            return np.full(len(xy), float(target_size))
+        return np.broadcast_to(np.asarray(size_function(xy[:, 0], xy[:, 1]), dtype=float), (len(xy),))
+
+    # Never split below this length (guards against tiny input features)
+    min_edge = 1e-3 * float(np.min(local_size(polygon)))
+
+    stats = {
+        'iterations': 0,
+        'segment_splits': 0,
+        'circumcenters_inserted': 0,
+        'time_triangulation': 0.0,
+        'time_classification': 0.0,
+        'time_insertion_planning': 0.0,
+    }
+    history = []
+
+    t0 = time.perf_counter()
+    tri = ScipyDelaunay(points, incremental=True)
+    stats['time_triangulation'] += time.perf_counter() - t0
+
+    def inside_triangles():
+        simplices = tri.simplices
+        corners = tri.points[simplices]
+        centroids = corners.mean(axis=1)
+        # Qhull can emit flat simplices along collinear hull points; drop them
+        d1 = corners[:, 1] - corners[:, 0]
+        d2 = corners[:, 2] - corners[:, 0]
+        area2 = np.abs(d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0])
+        solid = area2 > 1e-10 * np.sum(d1**2, axis=1)
+        return simplices[solid & points_in_polygon(centroids, polygon)]
+
+    for iteration in range(max_iterations):
+        points = tri.points
+
+        t0 = time.perf_counter()
+        triangles = inside_triangles()
+        stats['time_classification'] += time.perf_counter() - t0
+        history.append((len(points), triangles))
+
+        t0 = time.perf_counter()
+        seg_len = np.linalg.norm(points[segments[:, 1]] - points[segments[:, 0]], axis=1)
+        split = _encroached_by_vertices(points, segments) & (seg_len > 2 * min_edge) & split_boundary
+        new_centers = np.empty((0, 2))
+
+        if not split.any():
+            min_angles = triangle_angles(points, triangles).min(axis=1)
+            centers, radii = circumcircles(points, triangles)
+            size = local_size(points[triangles].mean(axis=1))
+            # An equilateral triangle with edge h has circumradius h / sqrt(3)
+            bad = (min_angles < min_angle) | (radii > size / np.sqrt(3))
+            bad &= np.isfinite(radii) & (radii > min_edge)
+            if not bad.any():
+                stats['time_insertion_planning'] += time.perf_counter() - t0
+                break
+
+            centers, radii = centers[bad], radii[bad]
+            priority = np.argsort(np.argsort(min_angles[bad]))
+            keep = _separate_candidates(centers, radii, priority)
+            centers, radii = centers[keep], radii[keep]
+
+            encroaching, hit_segments = _segments_encroached_by(centers, points, segments)
+            split[hit_segments] = split_boundary
+            split &= seg_len > 2 * min_edge
+            new_centers = centers[~encroaching]
+            new_centers = new_centers[points_in_polygon(new_centers, polygon)]
+
+        split_idx = np.flatnonzero(split)
+        midpoints = 0.5 * (points[segments[split_idx, 0]] + points[segments[split_idx, 1]])
+        stats['time_insertion_planning'] += time.perf_counter() - t0
+
+        if len(midpoints) == 0 and len(new_centers) == 0:
+            break
+
+        # Midpoints are appended first, so their indices are known up front
+        mid_ids = len(points) + np.arange(len(split_idx))
+        tail = segments[split_idx, 1].copy()
+        segments[split_idx, 1] = mid_ids
+        segments = np.vstack([segments, np.column_stack([mid_ids, tail])])
+
+        t0 = time.perf_counter()
+        tri.add_points(np.vstack([midpoints, new_centers]))
+        stats['time_triangulation'] += time.perf_counter() - t0
+
+        stats['iterations'] = iteration + 1
+        stats['segment_splits'] += len(midpoints)
+        stats['circumcenters_inserted'] += len(new_centers)
+
+    nodes = tri.points.copy()
+    if split_boundary:
+        triangles = inside_triangles()
+    else:
+        triangles = recover_segments(nodes, tri.simplices, segments)
+        triangles = triangles[points_in_polygon(nodes[triangles].mean(axis=1), polygon)]
+    tri.close()
+    if history[-1][0] != len(nodes):
+        history.append((len(nodes), triangles))
+    else:
+        history[-1] = (len(nodes), triangles)
+
+    angles = triangle_angles(nodes, triangles)
+    stats['num_nodes'] = len(nodes)
+    stats['num_elements'] = len(triangles)
+    stats['min_angle_overall'] = float(angles.min()) if len(angles) else 0.0
+    stats['time_total'] = time.perf_counter() - t_start
+
+    return {
+        'nodes': nodes,
+        'triangles': triangles,
+        'segments': segments,
+        'history': history,
+        'stats': stats,
+    }
@@ -0,0 +1,297 @@
+"""
+Vectorized mesh smoothing
+Includes: node/connectivity extraction, sparse vertex adjacency, boundary-locked
+Laplacian and angle-based smoothing, in-place element updates for animation,
+smoothing methods shared by the mesh mobjects
+"""
+
+import numpy as np
+from manim import UpdateFromAlphaFunc
+from scipy import sparse
+
+
+def corner_records(connectivity):
+    """
+    Flatten element connectivity into per-corner arrays.
+
+    connectivity may be an (E, k) array or a list of index arrays of mixed
+    length (e.g. clipped polygons). Returns (elem, node, prev, next) arrays
+    with one entry per element corner.
+    """
+    if isinstance(connectivity, np.ndarray) and connectivity.ndim == 2:
+        num_elems, k = connectivity.shape
+        lengths = np.full(num_elems, k)
+        flat = connectivity.ravel()
+    else:
+        lengths = np.array([len(c) for c in connectivity], dtype=int)
+        flat = np.concatenate([np.asarray(c, dtype=int) for c in connectivity])
+
+    elem = np.repeat(np.arange(len(lengths)), lengths)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    pos = np.arange(len(flat)) - offsets[elem]
+    nxt = flat[offsets[elem] + (pos + 1) % lengths[elem]]
+    prv = flat[offsets[elem] + (pos - 1) % lengths[elem]]
+    return elem, flat, prv, nxt
+
+
+def mesh_arrays_from_elements(mesh_elements, tol=1e-6):
+    """
+    Recover shared nodes and connectivity from polygon mobjects.
+
+    Vertices closer than tol are merged into one node.
+
+    Returns:
+    --------
+    nodes : (N, 3) array in the mobjects' current frame
+    connectivity : (E, k) int array, or list of arrays for mixed polygons
+    """
+    vertices = [np.asarray(elem.get_vertices()) for elem in mesh_elements]
+    lengths = np.array([len(v) for v in vertices], dtype=int)
+    stacked = np.vstack(vertices)
+
+    keys = np.round(stacked[:, :2] / tol).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    nodes = stacked[first]
+    inverse = inverse.ravel()
+
+    if np.all(lengths == lengths[0]):
+        connectivity = inverse.reshape(len(lengths), lengths[0])
+    else:
+        connectivity = np.split(inverse, np.cumsum(lengths)[:-1])
+    return nodes, connectivity
+
+
+def vertex_adjacency(num_nodes, connectivity):
+    """Symmetric CSR adjacency of nodes joined by an element edge."""
+    _, node, _, nxt = corner_records(connectivity)
+    rows = np.concatenate([node, nxt])
+    cols = np.concatenate([nxt, node])
+    adjacency = sparse.coo_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(num_nodes, num_nodes)
+    ).tocsr()
+    adjacency.data[:] = 1.0  # duplicate edges from neighbouring elements collapse
+    return adjacency
+
+
+def boundary_nodes(num_nodes, connectivity):
+    """Boolean mask of nodes lying on an edge used by only one element."""
+    _, node, _, nxt = corner_records(connectivity)
+    lo, hi = np.minimum(node, nxt), np.maximum(node, nxt)
+    keys, counts = np.unique(lo.astype(np.int64) * num_nodes + hi, return_counts=True)
+    single = keys[counts == 1]
+    mask = np.zeros(num_nodes, dtype=bool)
+    mask[single // num_nodes] = True
+    mask[single % num_nodes] = True
+    return mask
+
+
+def _signed_areas(xy, elem, node, nxt, num_elems, uniform):
+    """Shoelace signed area per element from corner records."""
+    if uniform:
+        # Corners of equal-sized elements are contiguous blocks: one gather
+        p = xy[node].reshape(num_elems, -1, 2)
+        q = np.roll(p, -1, axis=1)
+        return 0.5 * np.sum(p[..., 0] * q[..., 1] - q[..., 0] * p[..., 1], axis=1)
+    p, q = xy[node], xy[nxt]
+    cross = p[:, 0] * q[:, 1] - q[:, 0] * p[:, 1]
+    return 0.5 * np.bincount(elem, weights=cross, minlength=num_elems)
+
+
+def smooth_mesh(nodes, connectivity, iterations=5, method="laplacian", relaxation=1.0,
+                locked=None, prevent_inversion=True):
+    """
+    Boundary-locked smoothing as sparse matrix products.
+
+    Parameters:
+    -----------
+    nodes : (N, 2) or (N, 3) array
+        Node coordinates (z, if present, is carried through unchanged)
+    connectivity : (E, k) array or list of index arrays
+        Element corners in order around each element
+    iterations : int
+        Number of smoothing passes
+    method : str
+        "laplacian" - move each node to the mean of its neighbours
+        "angle" - angle-based smoothing (Zhou & Shimada): rotate the node
+                  about each neighbour onto the bisector of the angle there
+    relaxation : float
+        Fraction of the computed move applied per pass (0-1)
+    locked : bool array or None
+        Nodes that must not move; defaults to the mesh boundary
+    prevent_inversion : bool
+        Undo the move of nodes belonging to elements that would flip
+
+    Returns:
+    --------
+    frames : (iterations + 1, N, dim) array of node positions, frame 0 = input
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    num_nodes = len(nodes)
+    elem, node, prv, nxt = corner_records(connectivity)
+    num_elems = elem.max() + 1
+    uniform = isinstance(connectivity, np.ndarray) and connectivity.ndim == 2
+
+    if locked is None:
+        locked = boundary_nodes(num_nodes, connectivity)
+    free = ~np.asarray(locked, dtype=bool)
+
+    if method == "laplacian":
+        adjacency = vertex_adjacency(num_nodes, connectivity)
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        averaging = sparse.diags(1.0 / np.maximum(degree, 1)) @ adjacency
+    elif method == "angle":
+        # Each corner j of an element contributes, for both of its element
+        # neighbours i, the other neighbour of j: (i, j, other).
+        i_idx = np.concatenate([prv, nxt])
+        j_idx = np.concatenate([node, node])
+        other = np.concatenate([nxt, prv])
+        # An interior edge (i, j) appears once per adjacent element: pair them up
+        order = np.lexsort((j_idx, i_idx))
+        i_idx, j_idx, other = i_idx[order], j_idx[order], other[order]
+        same = (i_idx[:-1] == i_idx[1:]) & (j_idx[:-1] == j_idx[1:])
+        first = np.flatnonzero(same)
+        i_idx, j_idx = i_idx[first], j_idx[first]
+        side_a, side_b = other[first], other[first + 1]
+        gather = sparse.coo_matrix(
+            (np.ones(len(i_idx)), (i_idx, np.arange(len(i_idx)))),
+            shape=(num_nodes, len(i_idx)),
+        ).tocsr()
+        counts = np.asarray(gather.sum(axis=1)).ravel()
+        free &= counts > 0
+    else:
+        raise ValueError(f"Unknown smoothing method: {method}")
+
+    frames = np.empty((iterations + 1,) + nodes.shape)
+    frames[0] = nodes
+    xy = nodes[:, :2].copy()
+    signs = np.sign(_signed_areas(xy, elem, node, nxt, num_elems, uniform))
+
+    for it in range(iterations):
+        if method == "laplacian":
+            target = averaging @ xy
+        else:
+            pj = xy[j_idx]
+            to_i = xy[i_idx] - pj
+            theta_a = np.arctan2(xy[side_a, 1] - pj[:, 1], xy[side_a, 0] - pj[:, 0])
+            theta_b = np.arctan2(xy[side_b, 1] - pj[:, 1], xy[side_b, 0] - pj[:, 0])
+            theta_i = np.arctan2(to_i[:, 1], to_i[:, 0])
+            # Bisect whichever arc between a and b contains node i (works for
+            # straight and reflex angles, e.g. 180 degrees in quad meshes)
+            arc = np.mod(theta_b - theta_a, 2 * np.pi)
+            ccw = np.mod(theta_i - theta_a, 2 * np.pi) < arc
+            mid = np.where(ccw, theta_a + arc / 2, theta_b + (2 * np.pi - arc) / 2)
+            length = np.linalg.norm(to_i, axis=1)
+            rotated = pj + length[:, None] * np.column_stack([np.cos(mid), np.sin(mid)])
+            target = (gather @ rotated) / np.maximum(counts, 1)[:, None]
+
+        new_xy = xy.copy()
+        new_xy[free] += relaxation * (target[free] - xy[free])
+
+        if prevent_inversion:
+            # Reverting every node of a flipped element restores the previous
+            # (valid) state locally, so this settles within a few rounds
+            while True:
+                new_signs = np.sign(_signed_areas(new_xy, elem, node, nxt, num_elems, uniform))
+                flipped = new_signs != signs
+                if not flipped.any():
+                    break
+                undo = np.zeros(num_nodes, dtype=bool)
+                undo[node[flipped[elem]]] = True
+                new_xy[undo] = xy[undo]
+            signs = new_signs
+
+        xy = new_xy
+        frames[it + 1] = frames[it]
+        frames[it + 1, :, :2] = xy
+
+    return frames
+
+
+def set_element_points(mesh_elements, connectivity, positions):
+    """
+    Write node positions into polygon mobjects in place.
+
+    Each polygon edge is a straight cubic segment, so its four control points
+    are interpolated between the two corner nodes.
+    """
+    positions = np.asarray(positions, dtype=float)
+    if positions.shape[1] == 2:
+        positions = np.column_stack([positions, np.zeros(len(positions))])
+    weights = np.linspace(0, 1, 4)[:, None]
+
+    if isinstance(connectivity, np.ndarray) and connectivity.ndim == 2:
+        starts = positions[connectivity]  # (E, k, 3)
+        ends = np.roll(starts, -1, axis=1)
+        points = starts[:, :, None, :] * (1 - weights) + ends[:, :, None, :] * weights
+        points = points.reshape(len(connectivity), -1, 3)
+        for elem, elem_points in zip(mesh_elements, points):
+            if elem.points.shape == elem_points.shape:
+                elem.points[:] = elem_points
+            else:
+                elem.set_points(elem_points)
+    else:
+        for elem, corners in zip(mesh_elements, connectivity):
+            starts = positions[corners]
+            ends = np.roll(starts, -1, axis=0)
+            elem_points = (starts[:, None, :] * (1 - weights) + ends[:, None, :] * weights).reshape(-1, 3)
+            if elem.points.shape == elem_points.shape:
+                elem.points[:] = elem_points
+            else:
+                elem.set_points(elem_points)
+
+
+class SmoothableMesh:
+    """
+    Smoothing methods for mesh mobjects that keep their elements in
+    self.mesh_elements (AdvancedFiniteElement, FiniteElement).
+    """
+
+    def get_mesh_arrays(self):
+        """Shared nodes (N, 3) and element connectivity, in the current frame."""
+        return mesh_arrays_from_elements(self.mesh_elements)
+
+    def smooth(self, iterations=5, method="laplacian", relaxation=1.0):
+        """
+        Smooth the mesh in place, keeping boundary nodes fixed.
+
+        Parameters:
+        -----------
+        iterations : int
+            Number of smoothing passes
+        method : str
+            "laplacian" - move nodes to the mean of their neighbours
+            "angle" - angle-based smoothing (better for quads and near
+                      concave boundaries)
+        relaxation : float
+            Fraction of each move applied per pass (0-1)
+
+        Returns:
+        --------
+        frames : (iterations + 1, N, 3) node positions per pass
+        """
+        nodes, connectivity = self.get_mesh_arrays()
+        frames = smooth_mesh(nodes, connectivity, iterations, method, relaxation)
+        set_element_points(self.mesh_elements, connectivity, frames[-1])
+        return frames
+
+    def get_smoothing_animation(self, iterations=5, method="laplacian", relaxation=1.0, run_time=2):
+        """
+        Animate smoothing passes by moving element corners in place.
+
+        Returns:
+        --------
+        Animation : Manim animation acting on this mesh
+        """
+        nodes, connectivity = self.get_mesh_arrays()
+        frames = smooth_mesh(nodes, connectivity, iterations, method, relaxation)
+        positions = frames[0].copy()
+
+        def move_nodes(mesh, alpha):
+            t = alpha * iterations
+            k = min(int(t), max(iterations - 1, 0))
+            frac = min(t - k, 1.0)
+            np.multiply(frames[k], 1 - frac, out=positions)
+            np.add(positions, frac * frames[min(k + 1, iterations)], out=positions)
+            set_element_points(self.mesh_elements, connectivity, positions)
+
+        return UpdateFromAlphaFunc(self, move_nodes, run_time=run_time)
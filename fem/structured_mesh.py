@@ -0,0 +1,279 @@
+"""
+Structured quad meshing by transfinite interpolation (TFI)
+Includes: polar TFI around a centre point, Coons patch from four boundary arcs,
+Winslow smoothing and Jacobian checks for untangled patches, fine meshes placed
+on coarse geometry (refinement morphs)
+"""
+
+import numpy as np
+
+
+def _counter_clockwise(points):
+    """Return outline points in counter-clockwise order."""
+    p = np.asarray(points, dtype=float)[:, :2]
+    q = np.roll(p, -1, axis=0)
+    area = 0.5 * np.sum(p[:, 0] * q[:, 1] - q[:, 0] * p[:, 1])
+    return p if area >= 0 else np.vstack([p[:1], p[:0:-1]])
+
+
+def radial_fractions(num_radial, adaptive=False):
+    """Ring positions from the centre (0) to the boundary (1)."""
+    fracs = np.linspace(0, 1, num_radial + 1)
+    # Adaptive: more rings near the boundary
+    return fracs ** 0.7 if adaptive else fracs
+
+
+def polar_tfi_mesh(center, boundary_points, radial_fracs):
+    """
+    Map a polar reference grid onto the domain.
+
+    Ring j is the boundary scaled towards the centre by radial_fracs[j], i.e.
+    x(xi, eta) = c + eta * (B(xi) - c). The innermost ring of cells shares the
+    centre node, so it is a fan of triangles; every other cell is a quad.
+
+    Parameters:
+    -----------
+    center : array (2,) or (3,)
+        Pole of the mapping (the domain must be star-shaped about it)
+    boundary_points : array (num_angular, 2 or 3)
+        One boundary point per sector edge, in order around the outline
+    radial_fracs : array (num_radial + 1,)
+        Increasing ring positions, starting at 0 and ending at 1
+
+    Returns:
+    --------
+    nodes : (1 + num_radial * num_angular, 2) array, node 0 is the centre
+    connectivity : list of index arrays, ring-major, num_radial * num_angular
+        elements (num_angular triangles, then quads), all counter-clockwise
+    """
+    c = np.asarray(center, dtype=float)[:2]
+    boundary = _counter_clockwise(boundary_points)
+    fracs = np.asarray(radial_fracs, dtype=float)[1:]
+    num_angular, num_radial = len(boundary), len(fracs)
+
+    rings = c + fracs[:, None, None] * (boundary - c)[None]
+    nodes = np.vstack([c, rings.reshape(-1, 2)])
+
+    a = np.arange(num_angular)
+    a_next = (a + 1) % num_angular
+    ring_ids = 1 + np.arange(num_radial)[:, None] * num_angular
+
+    core = np.column_stack([np.zeros(num_angular, dtype=int), ring_ids[0] + a, ring_ids[0] + a_next])
+    inner, outer = ring_ids[:-1], ring_ids[1:]
+    quads = np.stack([inner + a, outer + a, outer + a_next, inner + a_next], axis=-1).reshape(-1, 4)
+    return nodes, list(core) + list(quads)
+
+
+def coons_quad_mesh(boundary_points, num_xi, num_eta):
+    """
+    Coons-patch (bilinearly blended TFI) quad mesh from four boundary arcs.
+
+    The outline is split into bottom, right, top and left arcs of num_xi,
+    num_eta, num_xi and num_eta segments; the interior nodes blend the four
+    arcs and subtract the bilinear corner term, so the boundary is reproduced
+    exactly.
+
+    Parameters:
+    -----------
+    boundary_points : array (2 * (num_xi + num_eta), 2 or 3)
+        Boundary samples in order, starting at the bottom-left corner
+    num_xi, num_eta : int
+        Cells along and across the patch
+
+    Returns:
+    --------
+    nodes : ((num_eta + 1) * (num_xi + 1), 2) array, row-major in eta
+    quads : (num_eta * num_xi, 4) counter-clockwise quads
+    """
+    b = _counter_clockwise(boundary_points)
+    nx, ny = num_xi, num_eta
+    closed = np.vstack([b, b[:1]])
+
+    bottom = closed[0:nx + 1]
+    right = closed[nx:nx + ny + 1]
+    top = closed[nx + ny:2 * nx + ny + 1][::-1]
+    left = closed[2 * nx + ny:2 * nx + 2 * ny + 1][::-1]
+
+    xi = np.linspace(0, 1, nx + 1)[None, :, None]
+    eta = np.linspace(0, 1, ny + 1)[:, None, None]
+    p00, p10, p11, p01 = bottom[0], bottom[-1], top[-1], top[0]
+
+    grid = (
+        (1 - eta) * bottom[None] + eta * top[None]
+        + (1 - xi) * left[:, None] + xi * right[:, None]
+        - ((1 - xi) * (1 - eta) * p00 + xi * (1 - eta) * p10
+           + xi * eta * p11 + (1 - xi) * eta * p01)
+    )
+
+    i = np.arange(nx)[None, :]
+    row = (np.arange(ny) * (nx + 1))[:, None]
+    quads = np.stack([row + i, row + i + 1, row + nx + 1 + i + 1, row + nx + 1 + i], axis=-1)
+    return grid.reshape(-1, 2), quads.reshape(-1, 4)
+
+
+def quad_corner_jacobians(nodes, quads):
+    """
+    Jacobian (cross product of the two edges) at every corner of every quad.
+
+    All four are positive exactly when the quad is convex and counter-clockwise.
+    Corner k's value is also twice the area of the triangle (k - 1, k, k + 1),
+    so a quad is a simple counter-clockwise polygon (not folded, possibly with
+    one reflex corner) when corners 1 and 3, or corners 0 and 2, are positive:
+    one of its diagonals then splits it into two positive triangles.
+
+    Returns:
+    --------
+    jacobians : (num_quads, 4) array
+    """
+    p = np.asarray(nodes, dtype=float)[:, :2][np.asarray(quads)]
+    incoming = p - np.roll(p, 1, axis=1)
+    outgoing = np.roll(p, -1, axis=1) - p
+    return incoming[..., 0] * outgoing[..., 1] - incoming[..., 1] * outgoing[..., 0]
+
+
+def untangled_quads(nodes, quads):
+    """
+    Check that no quad is folded, and start each one at a corner of its interior diagonal.
+
+    Returns:
+    --------
+    quads : (num_quads, 4) array, each quad rolled (if needed) so that the
+        diagonal from its first corner lies inside it, as fan triangulation
+        (fem_solver.triangulate_polygons) assumes; None if any quad is folded
+    """
+    jac = quad_corner_jacobians(nodes, quads) > 0
+    fan_02 = jac[:, 1] & jac[:, 3]
+    fan_13 = jac[:, 0] & jac[:, 2]
+    if not (fan_02 | fan_13).all():
+        return None
+    quads = np.asarray(quads)
+    return np.where(fan_02[:, None], quads, np.roll(quads, -1, axis=1))
+
+
+def _turning_angles(points):
+    """Signed turn (radians, left positive) of a closed polyline at each point."""
+    incoming = points - np.roll(points, 1, axis=0)
+    outgoing = np.roll(points, -1, axis=0) - points
+    cross = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+    return np.arctan2(cross, np.einsum("pd,pd->p", incoming, outgoing))
+
+
+def winslow_smooth(nodes, num_xi, num_eta, iterations=200, tol=1e-6):
+    """
+    Elliptic (Winslow) smoothing of a structured grid's interior nodes.
+
+    Jacobi sweeps of alpha x_xixi - 2 beta x_xieta + gamma x_etaeta = 0, the
+    inverse-Laplace equations whose solutions stay untangled far more often
+    than the algebraic Coons blend. Boundary nodes are fixed.
+
+    Parameters:
+    -----------
+    nodes : ((num_eta + 1) * (num_xi + 1), 2) array, row-major in eta
+    num_xi, num_eta : int
+        Cells along and across the patch
+    iterations : int
+        Maximum number of sweeps
+    tol : float
+        Stop once no node moves more than tol times the grid extent
+
+    Returns:
+    --------
+    nodes : smoothed copy, same layout
+    """
+    grid = np.array(nodes, dtype=float)[:, :2].reshape(num_eta + 1, num_xi + 1, 2)
+    if num_xi < 2 or num_eta < 2:
+        return grid.reshape(-1, 2)
+    limit = tol * np.ptp(grid.reshape(-1, 2), axis=0).max()
+
+    for _ in range(iterations):
+        east, west = grid[1:-1, 2:], grid[1:-1, :-2]
+        north, south = grid[2:, 1:-1], grid[:-2, 1:-1]
+        x_xi = 0.5 * (east - west)
+        x_eta = 0.5 * (north - south)
+        alpha = np.einsum("jid,jid->ji", x_eta, x_eta)[..., None]
+        beta = np.einsum("jid,jid->ji", x_xi, x_eta)[..., None]
+        gamma = np.einsum("jid,jid->ji", x_xi, x_xi)[..., None]
+        cross = grid[2:, 2:] - grid[2:, :-2] - grid[:-2, 2:] + grid[:-2, :-2]
+
+        updated = (alpha * (east + west) + gamma * (north + south) - 0.5 * beta * cross) \
+            / np.maximum(2 * (alpha + gamma), 1e-30)
+        change = np.abs(updated - grid[1:-1, 1:-1]).max()
+        grid[1:-1, 1:-1] = updated
+        if change < limit:
+            break
+    return grid.reshape(-1, 2)
+
+
+def untangled_coons_quad_mesh(boundary_points, num_xi, num_eta, attempts=8, iterations=200):
+    """
+    Coons-patch quad mesh with every element checked for folding.
+
+    The plain Coons blend folds elements on irregular outlines, and a patch
+    corner on a concave stretch of boundary can never be fixed by moving the
+    interior. So the patch corners are placed where the outline turns most
+    convexly (the best `attempts` placements are tried in order); at each,
+    the Coons grid is Winslow-smoothed if a quad is folded, and the first
+    grid that passes untangled_quads is returned.
+
+    Quads may keep one reflex corner where the sampled outline itself
+    zigzags; they are still simple polygons, ordered for fan triangulation.
+
+    Parameters:
+    -----------
+    boundary_points : array (2 * (num_xi + num_eta), 2 or 3)
+        Boundary samples in order around the outline
+    num_xi, num_eta : int
+        Cells along and across the patch
+    attempts : int
+        Corner placements to try
+    iterations : int
+        Maximum Winslow sweeps per placement
+
+    Returns:
+    --------
+    (nodes, quads) as from coons_quad_mesh, or None when no placement gives
+    an untangled mesh
+    """
+    b = _counter_clockwise(boundary_points)
+    n = len(b)
+    corners = np.array([0, num_xi, num_xi + num_eta, 2 * num_xi + num_eta])
+    turn = _turning_angles(b)
+    sharpest = turn[(np.arange(n)[:, None] + corners[None]) % n].min(axis=1)
+
+    for offset in np.argsort(-sharpest, kind="stable")[:attempts]:
+        nodes, quads = coons_quad_mesh(np.roll(b, -offset, axis=0), num_xi, num_eta)
+        ordered = untangled_quads(nodes, quads)
+        if ordered is None:
+            nodes = winslow_smooth(nodes, num_xi, num_eta, iterations)
+            ordered = untangled_quads(nodes, quads)
+        if ordered is not None:
+            return nodes, ordered
+    return None
+
+
+def resample_outline(points, positions):
+    """
+    Points on the closed polyline through an outline at fractional indices.
+
+    positions are in units of outline points (k + f lies a fraction f of the
+    way from point k to point k + 1), counter-clockwise like the meshers.
+    """
+    p = _counter_clockwise(points)
+    n = len(p)
+    positions = np.mod(np.asarray(positions, dtype=float), n)
+    k = np.floor(positions).astype(int) % n
+    frac = (positions - np.floor(positions))[:, None]
+    return p[k] * (1 - frac) + p[(k + 1) % n] * frac
+
+
+def coarse_polar_nodes(center, coarse_boundary, radial_fracs, num_angular):
+    """
+    Nodes of a finer polar mesh placed on the coarse mesh's geometry.
+
+    Polar TFI is linear in each cell, so mapping the fine reference grid
+    through the coarse boundary polygon lands every fine node exactly on the
+    coarse elements (children tile their parent).
+    """
+    positions = np.arange(num_angular) * len(coarse_boundary) / num_angular
+    boundary = resample_outline(coarse_boundary, positions)
+    return polar_tfi_mesh(center, boundary, radial_fracs)[0]